@@ -4,7 +4,7 @@ Implements the core AI functionality for email triage, summarization, and respon
 """
 
 import json
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
@@ -303,6 +303,52 @@ class GeminiEmailAI:
             logger.error(f"Error extracting meeting details: {e}")
             return {"error": str(e)}
     
+    def generate_content(self, prompt: str, max_output_tokens: int = 1000) -> str:
+        """
+        Get the model's complete text response to a prompt.
+        
+        Errors are raised to the caller, which chooses its own fallback.
+        
+        Args:
+            prompt: Prompt to send to the model
+            max_output_tokens: Longest response allowed, raised for batched prompts
+        
+        Returns:
+            Response text
+        """
+        response = self.model.generate_content(
+            prompt,
+            generation_config=genai.GenerationConfig(
+                temperature=0.3,
+                max_output_tokens=max_output_tokens,
+            )
+        )
+        return response.text
+    
+    def stream_content(self, prompt: str) -> Iterator[str]:
+        """
+        Stream the model's response to a prompt as it is generated.
+        
+        Callers that can decide from the start of the response may stop
+        iterating early, which stops reading the rest of the stream.
+        
+        Args:
+            prompt: Prompt to send to the model
+        
+        Returns:
+            Iterator over the response text, chunk by chunk
+        """
+        response = self.model.generate_content(
+            prompt,
+            generation_config=genai.GenerationConfig(
+                temperature=0.3,
+                max_output_tokens=1000,
+            ),
+            stream=True
+        )
+        for chunk in response:
+            yield chunk.text
+    
     def _build_analysis_prompt(self, email_data: Dict) -> str:
         """Build the prompt for email analysis."""
         return f"""
@@ -6,6 +6,7 @@ Handles secure authentication and token management.
 import os
 import json
 import pickle
+from functools import cache
 from typing import Optional, List
 from pathlib import Path
 
@@ -352,11 +353,7 @@ class GoogleAuthService:
 
 
 # Global authentication instance
-_auth_service = None
-
+@cache
 def get_auth_service() -> GoogleAuthService:
     """Get the global authentication service instance."""
-    global _auth_service
-    if _auth_service is None:
-        _auth_service = GoogleAuthService()
-    return _auth_service
+    return GoogleAuthService()
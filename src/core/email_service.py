@@ -10,6 +10,7 @@ from email.mime.multipart import MIMEMultipart
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from functools import cache
 import html2text
 import re
 
@@ -866,11 +867,7 @@ class EmailService:
 
 
 # Global email service instance
-_email_service = None
-
+@cache
 def get_email_service() -> EmailService:
     """Get the global email service instance."""
-    global _email_service
-    if _email_service is None:
-        _email_service = EmailService()
-    return _email_service
+    return EmailService()
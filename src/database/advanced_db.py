@@ -5,15 +5,34 @@ Extends the learning database with enhanced tracking capabilities.
 
 import sqlite3
 import json
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+from enum import IntEnum
+from functools import cache
 from pathlib import Path
 from loguru import logger
 
 from .learning_db import get_learning_db
 
 
+class Priority(IntEnum):
+    """Follow-up priority levels, ordered from least to most pressing."""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    URGENT = 3
+
+
+class ReminderType(IntEnum):
+    """Reminder categories."""
+    MEETING = 0
+    DEADLINE = 1
+    FOLLOWUP = 2
+    IMPORTANT_EMAIL = 3
+    CUSTOM = 4
+
+
 @dataclass
 class FollowUp:
     """Represents a follow-up item."""
@@ -29,6 +48,12 @@ class FollowUp:
     priority: str = "medium"  # low, medium, high, urgent
     created_at: datetime = None
     updated_at: datetime = None
+    priority_idx: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Resolve the priority name to its Priority index once."""
+        member = Priority.__members__.get(self.priority.upper()) if self.priority else None
+        self.priority_idx = int(member) if member is not None else None
 
 
 @dataclass
@@ -44,6 +69,12 @@ class Reminder:
     snooze_until: Optional[datetime] = None
     reminder_type: str = "followup"  # followup, deadline, meeting, custom
     created_at: datetime = None
+    type_idx: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Resolve the reminder type name to its ReminderType index once."""
+        member = ReminderType.__members__.get(self.reminder_type.upper()) if self.reminder_type else None
+        self.type_idx = int(member) if member is not None else None
 
 
 @dataclass
@@ -159,6 +190,7 @@ class AdvancedDatabase:
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_follow_ups_date ON follow_ups(follow_up_date)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_follow_ups_status ON follow_ups(status)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_time ON reminders(reminder_time)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_status_time ON reminders(status, reminder_time)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_feedback_feature ON user_feedback(feature_type)")
                 
                 conn.commit()
@@ -193,6 +225,23 @@ class AdvancedDatabase:
             logger.error(f"Error creating follow-up: {e}")
             return -1
     
+    def _row_to_follow_up(self, row: sqlite3.Row) -> FollowUp:
+        """Build a FollowUp from a follow_ups row."""
+        return FollowUp(
+            id=row['id'],
+            email_id=row['email_id'],
+            thread_id=row['thread_id'],
+            subject=row['subject'],
+            recipient=row['recipient'],
+            follow_up_date=datetime.fromisoformat(row['follow_up_date']) if row['follow_up_date'] else None,
+            reminder_date=datetime.fromisoformat(row['reminder_date']) if row['reminder_date'] else None,
+            status=row['status'],
+            notes=row['notes'] or "",
+            priority=row['priority'],
+            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
+            updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
+        )
+    
     def get_pending_follow_ups(self) -> List[FollowUp]:
         """Get all pending follow-ups."""
         try:
@@ -204,30 +253,137 @@ class AdvancedDatabase:
                     ORDER BY follow_up_date ASC
                 """)
                 
-                follow_ups = []
-                for row in cursor.fetchall():
-                    follow_up = FollowUp(
-                        id=row['id'],
-                        email_id=row['email_id'],
-                        thread_id=row['thread_id'],
-                        subject=row['subject'],
-                        recipient=row['recipient'],
-                        follow_up_date=datetime.fromisoformat(row['follow_up_date']) if row['follow_up_date'] else None,
-                        reminder_date=datetime.fromisoformat(row['reminder_date']) if row['reminder_date'] else None,
-                        status=row['status'],
-                        notes=row['notes'] or "",
-                        priority=row['priority'],
-                        created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None,
-                        updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None
-                    )
-                    follow_ups.append(follow_up)
-                
-                return follow_ups
+                return [self._row_to_follow_up(row) for row in cursor.fetchall()]
                 
         except Exception as e:
             logger.error(f"Error getting pending follow-ups: {e}")
             return []
     
+    def get_pending_follow_ups_page(self, after: Optional[Tuple[str, int]] = None,
+                                    limit: int = 25) -> Tuple[List[FollowUp], Optional[Tuple[str, int]]]:
+        """
+        Get one page of pending follow-ups using keyset pagination.
+        
+        Args:
+            after: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of follow-ups to return
+            
+        Returns:
+            Tuple of (follow-ups, cursor for the next page or None if this is the last page)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                after_date, after_id = after if after else ("", 0)
+                # Fetch one extra row to know whether another page follows
+                cursor = conn.execute("""
+                    SELECT * FROM follow_ups 
+                    WHERE status IN ('pending', 'overdue')
+                      AND (COALESCE(follow_up_date, ''), id) > (?, ?)
+                    ORDER BY COALESCE(follow_up_date, ''), id
+                    LIMIT ?
+                """, (after_date, after_id, limit + 1))
+                rows = cursor.fetchall()
+                
+                next_cursor = None
+                if len(rows) > limit:
+                    rows = rows[:limit]
+                    last_row = rows[-1]
+                    next_cursor = (last_row['follow_up_date'] or "", last_row['id'])
+                
+                return [self._row_to_follow_up(row) for row in rows], next_cursor
+                
+        except Exception as e:
+            logger.error(f"Error getting pending follow-ups page: {e}")
+            return [], None
+    
+    def count_pending_follow_ups(self) -> int:
+        """Count pending follow-ups without loading them."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    SELECT COUNT(*) FROM follow_ups 
+                    WHERE status IN ('pending', 'overdue')
+                """)
+                return cursor.fetchone()[0]
+                
+        except Exception as e:
+            logger.error(f"Error counting pending follow-ups: {e}")
+            return 0
+    
+    def get_pending_follow_up_ids(self) -> List[int]:
+        """Get the ids of all pending follow-ups without loading the rows."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    SELECT id FROM follow_ups 
+                    WHERE status IN ('pending', 'overdue')
+                    ORDER BY COALESCE(follow_up_date, ''), id
+                """)
+                return [row[0] for row in cursor.fetchall()]
+                
+        except Exception as e:
+            logger.error(f"Error getting pending follow-up ids: {e}")
+            return []
+    
+    def get_follow_up_statistics(self, day_start: datetime, week_end: datetime) -> Dict[str, int]:
+        """
+        Count pending follow-ups for the statistics view in a single scan.
+        
+        Like get_overdue_follow_up_counts, this is read-only and leaves statuses unchanged.
+        
+        Args:
+            day_start: Start of today
+            week_end: Follow-ups dated before this count as due this week
+            
+        Returns:
+            Dictionary of counts, or an empty dictionary on error
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute("""
+                    SELECT COUNT(*) as total_pending,
+                           COALESCE(SUM(CASE WHEN follow_up_date < ? THEN 1 ELSE 0 END), 0) as overdue_count,
+                           COALESCE(SUM(CASE WHEN priority IN ('high', 'urgent') THEN 1 ELSE 0 END), 0) as high_priority,
+                           COALESCE(SUM(CASE WHEN follow_up_date >= ? AND follow_up_date < ?
+                                             THEN 1 ELSE 0 END), 0) as due_today,
+                           COALESCE(SUM(CASE WHEN follow_up_date < ? THEN 1 ELSE 0 END), 0) as due_this_week
+                    FROM follow_ups 
+                    WHERE status IN ('pending', 'overdue')
+                """, (datetime.now(), day_start, day_start + timedelta(days=1), week_end))
+                return dict(cursor.fetchone())
+                
+        except Exception as e:
+            logger.error(f"Error getting follow-up statistics: {e}")
+            return {}
+    
+    def get_overdue_follow_up_counts(self) -> List[Dict]:
+        """
+        Count open follow-ups past their date, grouped by whole days overdue and priority.
+        
+        Unlike get_overdue_follow_ups, this is read-only and leaves statuses unchanged.
+        
+        Returns:
+            List of dicts with overdue_days, priority and count
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                now = datetime.now()
+                cursor = conn.execute("""
+                    SELECT CAST(julianday(?) - julianday(follow_up_date) AS INTEGER) as overdue_days,
+                           priority, COUNT(*) as count
+                    FROM follow_ups 
+                    WHERE follow_up_date < ? AND status IN ('pending', 'overdue')
+                    GROUP BY overdue_days, priority
+                """, (now, now))
+                return [dict(row) for row in cursor.fetchall()]
+                
+        except Exception as e:
+            logger.error(f"Error counting overdue follow-ups: {e}")
+            return []
+    
     def get_overdue_follow_ups(self) -> List[FollowUp]:
         """Get overdue follow-ups."""
         try:
@@ -274,6 +430,56 @@ class AdvancedDatabase:
             logger.error(f"Error getting overdue follow-ups: {e}")
             return []
     
+    def iter_overdue_follow_ups(self, batch_size: int = 512) -> Iterator[Tuple]:
+        """
+        Stream open follow-ups past their date as plain tuples, marking pending ones overdue.
+        
+        Rows already marked overdue are included, so the list matches
+        get_overdue_follow_up_counts. Rows are fetched batch_size at a time;
+        statuses are updated once the iterator is exhausted, as
+        get_overdue_follow_ups does after loading.
+        
+        Args:
+            batch_size: Rows fetched from the cursor at a time
+            
+        Yields:
+            (id, subject, recipient, follow_up_date, priority, notes, email_id) tuples
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                now = datetime.now()
+                cursor = conn.execute("""
+                    SELECT id, subject, recipient, follow_up_date, priority, notes, email_id
+                    FROM follow_ups 
+                    WHERE follow_up_date < ? AND status IN ('pending', 'overdue')
+                    ORDER BY follow_up_date ASC
+                """, (now,))
+                
+                overdue_ids = []
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for follow_up_id, subject, recipient, follow_up_date, priority, notes, email_id in rows:
+                        overdue_ids.append(follow_up_id)
+                        yield (
+                            follow_up_id, subject, recipient,
+                            datetime.fromisoformat(follow_up_date) if follow_up_date else None,
+                            priority, notes or "", email_id
+                        )
+                
+                # Update status in database
+                if overdue_ids:
+                    placeholders = ','.join(['?'] * len(overdue_ids))
+                    conn.execute(f"""
+                        UPDATE follow_ups SET status = 'overdue', updated_at = ?
+                        WHERE id IN ({placeholders}) AND status = 'pending'
+                    """, [datetime.now()] + overdue_ids)
+                    conn.commit()
+                
+        except Exception as e:
+            logger.error(f"Error iterating overdue follow-ups: {e}")
+    
     def update_follow_up_status(self, follow_up_id: int, status: str) -> bool:
         """Update follow-up status."""
         try:
@@ -291,6 +497,45 @@ class AdvancedDatabase:
             logger.error(f"Error updating follow-up status: {e}")
             return False
     
+    def update_follow_up_dates(self, follow_up_id: int, follow_up_date: datetime,
+                               reminder_date: Optional[datetime]) -> bool:
+        """Reschedule a pending follow-up. Returns False if no such follow-up is pending."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    UPDATE follow_ups 
+                    SET follow_up_date = ?, reminder_date = ?, updated_at = ?
+                    WHERE id = ? AND status IN ('pending', 'overdue')
+                """, (follow_up_date, reminder_date, datetime.now(), follow_up_id))
+                conn.commit()
+                if cursor.rowcount:
+                    logger.info(f"Rescheduled follow-up {follow_up_id} to {follow_up_date}")
+                return cursor.rowcount > 0
+                
+        except Exception as e:
+            logger.error(f"Error updating follow-up dates: {e}")
+            return False
+    
+    def update_follow_ups_status(self, follow_up_ids: List[int], status: str) -> int:
+        """Update the status of several follow-ups in a single statement."""
+        if not follow_up_ids:
+            return 0
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                placeholders = ','.join(['?'] * len(follow_up_ids))
+                cursor = conn.execute(f"""
+                    UPDATE follow_ups 
+                    SET status = ?, updated_at = ?
+                    WHERE id IN ({placeholders})
+                """, [status, datetime.now()] + list(follow_up_ids))
+                conn.commit()
+                logger.info(f"Updated {cursor.rowcount} follow-ups status to {status}")
+                return cursor.rowcount
+                
+        except Exception as e:
+            logger.error(f"Error updating follow-ups status: {e}")
+            return 0
+    
     # Reminder operations
     def create_reminder(self, reminder: Reminder) -> int:
         """Create a new reminder."""
@@ -315,6 +560,59 @@ class AdvancedDatabase:
             logger.error(f"Error creating reminder: {e}")
             return -1
     
+    def create_reminders(self, reminders: List[Reminder]) -> List[int]:
+        """
+        Create several reminders in one transaction.
+        
+        Args:
+            reminders: Reminders to insert
+            
+        Returns:
+            List of new reminder IDs, all -1 if the transaction failed
+        """
+        if not reminders:
+            return []
+        
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                # Rows are inserted one at a time to read back each ID, but
+                # committed together
+                reminder_ids = []
+                for reminder in reminders:
+                    cursor = conn.execute("""
+                        INSERT INTO reminders 
+                        (email_id, thread_id, title, description, reminder_time, 
+                         status, reminder_type)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        reminder.email_id, reminder.thread_id, reminder.title,
+                        reminder.description, reminder.reminder_time,
+                        reminder.status, reminder.reminder_type
+                    ))
+                    reminder_ids.append(cursor.lastrowid)
+                conn.commit()
+                logger.info(f"Created {len(reminder_ids)} reminders")
+                return reminder_ids
+                
+        except Exception as e:
+            logger.error(f"Error creating reminders: {e}")
+            return [-1] * len(reminders)
+    
+    def _row_to_reminder(self, row: sqlite3.Row) -> Reminder:
+        """Build a Reminder from a reminders row."""
+        return Reminder(
+            id=row['id'],
+            email_id=row['email_id'],
+            thread_id=row['thread_id'],
+            title=row['title'],
+            description=row['description'] or "",
+            reminder_time=datetime.fromisoformat(row['reminder_time']),
+            status=row['status'],
+            snooze_until=datetime.fromisoformat(row['snooze_until']) if row['snooze_until'] else None,
+            reminder_type=row['reminder_type'],
+            created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
+        )
+    
     def get_due_reminders(self) -> List[Reminder]:
         """Get reminders that are due."""
         try:
@@ -327,28 +625,94 @@ class AdvancedDatabase:
                     ORDER BY reminder_time ASC
                 """, (now,))
                 
-                reminders = []
-                for row in cursor.fetchall():
-                    reminder = Reminder(
-                        id=row['id'],
-                        email_id=row['email_id'],
-                        thread_id=row['thread_id'],
-                        title=row['title'],
-                        description=row['description'] or "",
-                        reminder_time=datetime.fromisoformat(row['reminder_time']),
-                        status=row['status'],
-                        snooze_until=datetime.fromisoformat(row['snooze_until']) if row['snooze_until'] else None,
-                        reminder_type=row['reminder_type'],
-                        created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
-                    )
-                    reminders.append(reminder)
-                
-                return reminders
+                return [self._row_to_reminder(row) for row in cursor.fetchall()]
                 
         except Exception as e:
             logger.error(f"Error getting due reminders: {e}")
             return []
     
+    def get_due_reminders_page(self, after: Optional[Tuple[str, int]] = None,
+                               limit: int = 25) -> Tuple[List[Reminder], Optional[Tuple[str, int]]]:
+        """
+        Get one page of due reminders using keyset pagination.
+        
+        Args:
+            after: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of reminders to return
+            
+        Returns:
+            Tuple of (reminders, cursor for the next page or None if this is the last page)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                after_time, after_id = after if after else ("", 0)
+                # Fetch one extra row to know whether another page follows
+                cursor = conn.execute("""
+                    SELECT * FROM reminders 
+                    WHERE reminder_time <= ? AND status = 'active'
+                      AND (reminder_time, id) > (?, ?)
+                    ORDER BY reminder_time, id
+                    LIMIT ?
+                """, (datetime.now(), after_time, after_id, limit + 1))
+                rows = cursor.fetchall()
+                
+                next_cursor = None
+                if len(rows) > limit:
+                    rows = rows[:limit]
+                    last_row = rows[-1]
+                    next_cursor = (last_row['reminder_time'], last_row['id'])
+                
+                return [self._row_to_reminder(row) for row in rows], next_cursor
+                
+        except Exception as e:
+            logger.error(f"Error getting due reminders page: {e}")
+            return [], None
+    
+    def count_due_reminders(self) -> int:
+        """Count due reminders without loading them."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    SELECT COUNT(*) FROM reminders 
+                    WHERE reminder_time <= ? AND status = 'active'
+                """, (datetime.now(),))
+                return cursor.fetchone()[0]
+                
+        except Exception as e:
+            logger.error(f"Error counting due reminders: {e}")
+            return 0
+    
+    def get_due_reminder_ids(self) -> List[int]:
+        """Get the ids of all due reminders without loading the rows."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    SELECT id FROM reminders 
+                    WHERE reminder_time <= ? AND status = 'active'
+                    ORDER BY reminder_time, id
+                """, (datetime.now(),))
+                return [row[0] for row in cursor.fetchall()]
+                
+        except Exception as e:
+            logger.error(f"Error getting due reminder ids: {e}")
+            return []
+    
+    def get_due_reminder_type_counts(self) -> Dict[str, int]:
+        """Count due reminders by reminder type without loading them."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    SELECT reminder_type, COUNT(*) FROM reminders 
+                    WHERE reminder_time <= ? AND status = 'active'
+                    GROUP BY reminder_type
+                """, (datetime.now(),))
+                return dict(cursor.fetchall())
+                
+        except Exception as e:
+            logger.error(f"Error counting due reminders by type: {e}")
+            return {}
+    
     def snooze_reminder(self, reminder_id: int, snooze_minutes: int) -> bool:
         """Snooze a reminder for specified minutes."""
         try:
@@ -367,6 +731,47 @@ class AdvancedDatabase:
             logger.error(f"Error snoozing reminder: {e}")
             return False
     
+    def snooze_reminders(self, reminder_ids: List[int], snooze_minutes: int) -> int:
+        """Snooze several reminders for specified minutes in a single statement."""
+        if not reminder_ids:
+            return 0
+        try:
+            snooze_until = datetime.now() + timedelta(minutes=snooze_minutes)
+            with sqlite3.connect(self.db_path) as conn:
+                placeholders = ','.join(['?'] * len(reminder_ids))
+                cursor = conn.execute(f"""
+                    UPDATE reminders 
+                    SET status = 'snoozed', snooze_until = ?
+                    WHERE id IN ({placeholders})
+                """, [snooze_until] + list(reminder_ids))
+                conn.commit()
+                logger.info(f"Snoozed {cursor.rowcount} reminders until {snooze_until}")
+                return cursor.rowcount
+                
+        except Exception as e:
+            logger.error(f"Error snoozing reminders: {e}")
+            return 0
+    
+    def update_reminders_status(self, reminder_ids: List[int], status: str) -> int:
+        """Update the status of several reminders in a single statement."""
+        if not reminder_ids:
+            return 0
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                placeholders = ','.join(['?'] * len(reminder_ids))
+                cursor = conn.execute(f"""
+                    UPDATE reminders 
+                    SET status = ?
+                    WHERE id IN ({placeholders})
+                """, [status] + list(reminder_ids))
+                conn.commit()
+                logger.info(f"Updated {cursor.rowcount} reminders status to {status}")
+                return cursor.rowcount
+                
+        except Exception as e:
+            logger.error(f"Error updating reminders status: {e}")
+            return 0
+    
     # Feedback operations
     def store_user_feedback(self, feedback: UserFeedback) -> int:
         """Store user feedback."""
@@ -552,11 +957,7 @@ class AdvancedDatabase:
 
 
 # Global advanced database instance
-_advanced_db = None
-
+@cache
 def get_advanced_db() -> AdvancedDatabase:
     """Get the global advanced database instance."""
-    global _advanced_db
-    if _advanced_db is None:
-        _advanced_db = AdvancedDatabase()
-    return _advanced_db
+    return AdvancedDatabase()
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from contextlib import contextmanager
+from functools import cache
 
 from loguru import logger
 from ..core.config import get_settings
@@ -770,11 +771,7 @@ class LearningDatabase:
 
 
 # Global database instance
-_learning_db = None
-
+@cache
 def get_learning_db() -> LearningDatabase:
     """Get the global learning database instance."""
-    global _learning_db
-    if _learning_db is None:
-        _learning_db = LearningDatabase()
-    return _learning_db
+    return LearningDatabase()
@@ -3,18 +3,74 @@ Task management panel for the GUI.
 Provides interface for follow-ups, overdue items, and reminders.
 """
 
+import csv
+import functools
+import json
+import queue
+import threading
+import time
 import tkinter as tk
-from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox, filedialog
 import customtkinter as ctk
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from loguru import logger
 
-from ..tasks import FollowupManager, OverdueDetector, ReminderSystem
+from ..tasks import FollowupManager, OverdueDetector, OverdueItem, ReminderSystem
 from ..database.advanced_db import AdvancedDatabase, FollowUp, Reminder
 from .feedback_dialog import FeedbackDialog
 
 
+# Number of rows materialized per list page
+PAGE_SIZE = 25
+
+# Delay used to coalesce back-to-back refresh requests
+REFRESH_DEBOUNCE_MS = 150
+
+# Rows filled per Tk event-loop tick when rendering a list
+RENDER_CHUNK_SIZE = 10
+
+# Items sent per batched service call during bulk actions
+BULK_CHUNK_SIZE = 100
+
+# Follow-ups fetched and written per page during an export
+EXPORT_PAGE_SIZE = 500
+
+# Column headers of exported follow-ups
+_EXPORT_FIELDS = ["Subject", "Recipient", "Due Date", "Priority", "Status", "Notes"]
+
+# Supported export formats: file type description and extension
+_EXPORT_FORMATS = {
+    "csv": ("CSV files", ".csv"),
+    "xlsx": ("Excel workbooks", ".xlsx"),
+    "json": ("JSON files", ".json"),
+    "pdf": ("PDF documents", ".pdf")
+}
+
+# Seconds a service's statistics are reused before being recomputed
+STATS_CACHE_TTL = 30
+
+# Tab names mapped to the list sections they display
+_TAB_SECTIONS = {
+    "Follow-ups": "followups",
+    "Overdue": "overdue",
+    "Reminders": "reminders",
+    "Statistics": "stats"
+}
+
+# Row indicator colors, indexed by Priority / EscalationLevel / ReminderType
+_PRIORITY_COLORS = ("green", "orange", "red", "dark red")
+_ESCALATION_COLORS = ("green", "orange", "red", "dark red")
+_TYPE_COLORS = ("blue", "red", "orange", "purple", "gray")
+_UNKNOWN_COLOR = "gray"
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}…"
+
+
 class TaskPanel(ctk.CTkFrame):
     """Task management panel widget."""
     
@@ -30,9 +86,47 @@ class TaskPanel(ctk.CTkFrame):
         
         # Current data
         self.followups: List[FollowUp] = []
-        self.overdue_items: List[Dict] = []
+        self.overdue_items: List[OverdueItem] = []
         self.reminders: List[Reminder] = []
         
+        # Paging state per list
+        self._page = {"followups": 0, "overdue": 0, "reminders": 0}
+        self._totals = {"followups": 0, "overdue": 0, "reminders": 0}
+        self._page_labels: Dict[str, ctk.CTkLabel] = {}
+        
+        # Keyset cursors: start cursor of each visited page, and of the next page
+        self._page_cursors: Dict[str, List[Optional[Tuple[str, int]]]] = {
+            "followups": [None],
+            "reminders": [None]
+        }
+        self._next_cursors: Dict[str, Optional[Tuple[str, int]]] = {
+            "followups": None,
+            "reminders": None
+        }
+        
+        # Pooled row widgets reused across refreshes
+        self._followup_rows: List[Dict] = []
+        self._overdue_rows: List[Dict] = []
+        self._reminder_rows: List[Dict] = []
+        self._render_jobs: Dict[str, Optional[str]] = {}
+        self._pending_refresh: Optional[str] = None
+        self._bulk_running = False
+        self._export_running = False
+        self._export_cancelled = False
+        
+        # Sections whose data changed since they were last displayed
+        self._dirty = {"followups": True, "overdue": True, "reminders": True, "stats": True}
+        
+        # Statistics cache keyed by service name: (fetched_at, stats)
+        self._stats_cache: Dict[str, Tuple[float, Dict]] = {}
+        
+        # Fonts shared by every row and statistics label
+        self._font_bold14 = ctk.CTkFont(size=14, weight="bold")
+        self._font_bold12 = ctk.CTkFont(size=12, weight="bold")
+        self._font_11 = ctk.CTkFont(size=11)
+        self._font_10 = ctk.CTkFont(size=10)
+        self._font_9 = ctk.CTkFont(size=9)
+        
         # Setup UI
         self.setup_ui()
         
@@ -53,13 +147,24 @@ class TaskPanel(ctk.CTkFrame):
         refresh_button = ctk.CTkButton(
             self,
             text="Refresh",
-            command=self.refresh_all_data,
+            command=self._schedule_refresh,
             width=100
         )
         refresh_button.pack(pady=5)
         
+        # Progress bar shown while a bulk action runs
+        self.progress_bar = ctk.CTkProgressBar(self)
+        
+        # Cancel button shown while an export runs
+        self.cancel_export_button = ctk.CTkButton(
+            self,
+            text="Cancel Export",
+            command=self.cancel_export,
+            width=120
+        )
+        
         # Create tabview for different task types
-        self.tabview = ctk.CTkTabview(self)
+        self.tabview = ctk.CTkTabview(self, command=self._on_tab_change)
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Follow-ups tab
@@ -95,6 +200,14 @@ class TaskPanel(ctk.CTkFrame):
         )
         self.followups_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
+        self.followups_empty_label = ctk.CTkLabel(
+            self.followups_frame,
+            text="No pending follow-ups",
+            text_color="gray"
+        )
+        
+        self.create_pager(self.followups_tab, "followups")
+        
         # Controls frame
         followups_controls = ctk.CTkFrame(self.followups_tab)
         followups_controls.pack(fill="x", padx=10, pady=5)
@@ -109,9 +222,16 @@ class TaskPanel(ctk.CTkFrame):
         ctk.CTkButton(
             followups_controls,
             text="Export List",
-            command=self.export_followups,
+            command=lambda: self.export_followups(self.export_format_menu.get().lower()),
             width=100
         ).pack(side="left", padx=5)
+        
+        self.export_format_menu = ctk.CTkOptionMenu(
+            followups_controls,
+            values=["CSV", "XLSX", "JSON", "PDF"],
+            width=80
+        )
+        self.export_format_menu.pack(side="left", padx=5)
     
     def setup_overdue_tab(self):
         """Setup the overdue items tab."""
@@ -143,6 +263,15 @@ class TaskPanel(ctk.CTkFrame):
         )
         self.overdue_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
+        self.overdue_empty_label = ctk.CTkLabel(
+            self.overdue_frame,
+            text="No overdue items! 🎉",
+            text_color="green",
+            font=ctk.CTkFont(size=14)
+        )
+        
+        self.create_pager(self.overdue_tab, "overdue")
+        
         # Controls frame
         overdue_controls = ctk.CTkFrame(self.overdue_tab)
         overdue_controls.pack(fill="x", padx=10, pady=5)
@@ -178,6 +307,14 @@ class TaskPanel(ctk.CTkFrame):
         )
         self.reminders_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
+        self.reminders_empty_label = ctk.CTkLabel(
+            self.reminders_frame,
+            text="No active reminders",
+            text_color="gray"
+        )
+        
+        self.create_pager(self.reminders_tab, "reminders")
+        
         # Controls frame
         reminders_controls = ctk.CTkFrame(self.reminders_tab)
         reminders_controls.pack(fill="x", padx=10, pady=5)
@@ -196,6 +333,34 @@ class TaskPanel(ctk.CTkFrame):
             width=100
         ).pack(side="left", padx=5)
     
+    def create_pager(self, parent, section: str):
+        """Create Prev/Next paging controls for a list section."""
+        pager_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        pager_frame.pack(fill="x", padx=10)
+        
+        ctk.CTkButton(
+            pager_frame,
+            text="< Prev",
+            command=lambda: self._turn_page(section, -1),
+            width=80
+        ).pack(side="left", padx=5)
+        
+        page_label = ctk.CTkLabel(
+            pager_frame,
+            text="Page 1 of 1",
+            font=self._font_10,
+            text_color="gray"
+        )
+        page_label.pack(side="left", expand=True)
+        self._page_labels[section] = page_label
+        
+        ctk.CTkButton(
+            pager_frame,
+            text="Next >",
+            command=lambda: self._turn_page(section, +1),
+            width=80
+        ).pack(side="right", padx=5)
+    
     def setup_statistics_tab(self):
         """Setup the statistics tab."""
         # Statistics display
@@ -215,70 +380,199 @@ class TaskPanel(ctk.CTkFrame):
     
     def refresh_all_data(self):
         """Refresh all task data."""
+        # A direct refresh supersedes any scheduled one
+        if self._pending_refresh:
+            self.after_cancel(self._pending_refresh)
+            self._pending_refresh = None
+        
         try:
-            # Load follow-ups
-            self.followups = self.followup_manager.get_pending_followups()
-            
-            # Load overdue items
-            self.overdue_items = self.overdue_detector.check_overdue_items()
+            # Hidden tabs are refreshed when they are next selected
+            for section in self._dirty:
+                self._dirty[section] = True
+            self._refresh_visible_tab()
             
-            # Load reminders
-            self.reminders = self.reminder_system.get_due_reminders()
+            logger.info("Task data refreshed successfully")
             
-            # Update UI
+        except Exception as e:
+            logger.error(f"Error refreshing task data: {e}")
+            messagebox.showerror("Error", f"Failed to refresh task data: {str(e)}")
+    
+    def _on_tab_change(self):
+        """Refresh the newly selected tab if its data is stale."""
+        try:
+            self._refresh_visible_tab()
+        except Exception as e:
+            logger.error(f"Error refreshing tab: {e}")
+            messagebox.showerror("Error", f"Failed to refresh task data: {str(e)}")
+    
+    def _refresh_visible_tab(self):
+        """Reload and redisplay the selected tab if it is marked dirty."""
+        section = _TAB_SECTIONS.get(self.tabview.get())
+        if section and self._dirty[section]:
+            self._refresh_section(section)
+            self._dirty[section] = False
+    
+    def _refresh_section(self, section: str):
+        """Reload and redisplay a single section."""
+        if section == "stats":
+            self.refresh_statistics()
+            return
+        
+        self._load_page(section)
+        if section == "followups":
             self.update_followups_display()
+        elif section == "overdue":
             self.update_overdue_display()
+        else:
             self.update_reminders_display()
-            self.refresh_statistics()
-            
-            logger.info("Task data refreshed successfully")
+    
+    def _load_page(self, section: str):
+        """Load the current page of a list section from its service."""
+        if section == "overdue":
+            # Overdue items are computed in memory; slice them on display
+            self.overdue_items = self.overdue_detector.check_overdue_items()
+            total = len(self.overdue_items)
             
+            # Clamp the page in case items were removed since the last load
+            last_page = max(0, (total - 1) // PAGE_SIZE)
+            self._page[section] = min(self._page[section], last_page)
+            self._totals[section] = total
+            return
+        
+        if section == "followups":
+            total = self.followup_manager.count_pending_followups()
+            fetch_page = self.followup_manager.get_pending_followups_page
+        else:
+            total = self.reminder_system.count_due_reminders()
+            fetch_page = self.reminder_system.get_due_reminders_page
+        
+        cursors = self._page_cursors[section]
+        items, next_cursor = fetch_page(after=cursors[-1], limit=PAGE_SIZE)
+        
+        # Step back if the page emptied since it was last shown
+        while not items and len(cursors) > 1:
+            cursors.pop()
+            items, next_cursor = fetch_page(after=cursors[-1], limit=PAGE_SIZE)
+        
+        self._page[section] = len(cursors) - 1
+        self._totals[section] = total
+        self._next_cursors[section] = next_cursor
+        
+        if section == "followups":
+            self.followups = items
+        else:
+            self.reminders = items
+    
+    def _turn_page(self, section: str, step: int):
+        """Move a list section to the previous or next page."""
+        if section == "overdue":
+            last_page = max(0, (self._totals[section] - 1) // PAGE_SIZE)
+            new_page = min(max(self._page[section] + step, 0), last_page)
+            if new_page == self._page[section]:
+                return
+            self._page[section] = new_page
+        else:
+            cursors = self._page_cursors[section]
+            if step > 0:
+                if self._next_cursors[section] is None:
+                    return
+                cursors.append(self._next_cursors[section])
+            else:
+                if len(cursors) == 1:
+                    return
+                cursors.pop()
+        
+        try:
+            self._refresh_section(section)
         except Exception as e:
-            logger.error(f"Error refreshing task data: {e}")
-            messagebox.showerror("Error", f"Failed to refresh task data: {str(e)}")
+            logger.error(f"Error loading {section} page: {e}")
+            messagebox.showerror("Error", f"Failed to load page: {str(e)}")
+    
+    def _update_page_label(self, section: str):
+        """Update the page indicator of a list section."""
+        page_count = max(1, (self._totals[section] + PAGE_SIZE - 1) // PAGE_SIZE)
+        self._page_labels[section].configure(
+            text=f"Page {self._page[section] + 1} of {page_count}"
+        )
+    
+    def _schedule_refresh(self):
+        """Schedule a data refresh, coalescing calls made in quick succession."""
+        if self._pending_refresh:
+            self.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.after(REFRESH_DEBOUNCE_MS, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run a scheduled data refresh."""
+        self._pending_refresh = None
+        self.refresh_all_data()
     
     def update_followups_display(self):
         """Update the follow-ups display."""
-        # Clear existing widgets
-        for widget in self.followups_frame.winfo_children():
-            widget.destroy()
-        
         # Update header
-        count = len(self.followups)
+        count = self._totals["followups"]
         self.followups_header.configure(text=f"Pending Follow-ups ({count})")
+        self._update_page_label("followups")
+        
+        # Display follow-ups, reusing existing rows where possible
+        now = datetime.now()
+        self._render_rows(
+            "followups", self.followups, self._followup_rows,
+            self.create_followup_widget, functools.partial(self.update_followup_widget, now=now),
+            self.followups_frame
+        )
         
         if not self.followups:
-            no_items_label = ctk.CTkLabel(
-                self.followups_frame,
-                text="No pending follow-ups",
-                text_color="gray"
-            )
-            no_items_label.pack(pady=20)
-            return
+            self.followups_empty_label.pack(pady=20)
+        else:
+            self.followups_empty_label.pack_forget()
+    
+    def _render_rows(self, section: str, items: List, rows: List[Dict],
+                     create_row: Callable[[], Dict], update_row: Callable[[Dict, object], None],
+                     frame: ctk.CTkScrollableFrame):
+        """Fill pooled rows in chunks, yielding to the Tk event loop between chunks."""
+        # Drop any render still in flight for this list
+        pending_job = self._render_jobs.get(section)
+        if pending_job:
+            self.after_cancel(pending_job)
+            self._render_jobs[section] = None
+        
+        self._hide_rows(rows, len(items))
+        
+        def render_chunk(start: int):
+            end = min(start + RENDER_CHUNK_SIZE, len(items))
+            for index in range(start, end):
+                if index == len(rows):
+                    rows.append(create_row())
+                update_row(rows[index], items[index])
+            
+            if end < len(items):
+                self._render_jobs[section] = self.after(1, lambda: render_chunk(end))
+            else:
+                self._render_jobs[section] = None
+                frame.update_idletasks()
         
-        # Display follow-ups
-        for followup in self.followups:
-            self.create_followup_widget(followup)
+        render_chunk(0)
+    
+    def _hide_rows(self, rows: List[Dict], visible_count: int):
+        """Unpack pooled rows beyond the number currently needed."""
+        for row in rows[visible_count:]:
+            if row["visible"]:
+                row["frame"].pack_forget()
+                row["visible"] = False
+    
+    def _show_row(self, row: Dict):
+        """Pack a pooled row if it is currently hidden."""
+        if not row["visible"]:
+            row["frame"].pack(fill="x", padx=5, pady=5)
+            row["visible"] = True
     
-    def create_followup_widget(self, followup: FollowUp):
-        """Create a widget for a follow-up item."""
+    def create_followup_widget(self) -> Dict:
+        """Create a reusable row widget for follow-up items."""
         # Main frame for this follow-up
         item_frame = ctk.CTkFrame(self.followups_frame)
-        item_frame.pack(fill="x", padx=5, pady=5)
         
         # Priority indicator
-        priority_colors = {
-            "low": "green",
-            "medium": "orange", 
-            "high": "red",
-            "urgent": "dark red"
-        }
-        
-        priority_frame = ctk.CTkFrame(
-            item_frame, 
-            fg_color=priority_colors.get(followup.priority, "gray"),
-            width=5
-        )
+        priority_frame = ctk.CTkFrame(item_frame, fg_color="gray", width=5)
         priority_frame.pack(side="left", fill="y", padx=(5, 10))
         
         # Content frame
@@ -286,59 +580,38 @@ class TaskPanel(ctk.CTkFrame):
         content_frame.pack(side="left", fill="both", expand=True, padx=5)
         
         # Subject and recipient
-        title_text = f"{followup.subject[:50]}..." if len(followup.subject) > 50 else followup.subject
         title_label = ctk.CTkLabel(
             content_frame,
-            text=title_text,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            text="",
+            font=self._font_bold12,
             anchor="w"
         )
         title_label.pack(fill="x")
         
         recipient_label = ctk.CTkLabel(
             content_frame,
-            text=f"To: {followup.recipient}",
-            font=ctk.CTkFont(size=10),
+            text="",
+            font=self._font_10,
             text_color="gray",
             anchor="w"
         )
         recipient_label.pack(fill="x")
         
-        # Due date
-        if followup.follow_up_date:
-            due_date_str = followup.follow_up_date.strftime("%Y-%m-%d %H:%M")
-            days_until = (followup.follow_up_date - datetime.now()).days
-            
-            if days_until < 0:
-                due_text = f"Due: {due_date_str} (OVERDUE)"
-                due_color = "red"
-            elif days_until == 0:
-                due_text = f"Due: {due_date_str} (TODAY)"
-                due_color = "orange"
-            else:
-                due_text = f"Due: {due_date_str} ({days_until} days)"
-                due_color = "white"
-            
-            due_label = ctk.CTkLabel(
-                content_frame,
-                text=due_text,
-                font=ctk.CTkFont(size=10),
-                text_color=due_color,
-                anchor="w"
-            )
-            due_label.pack(fill="x")
+        # Due date and notes are packed per item when present
+        due_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self._font_10,
+            anchor="w"
+        )
         
-        # Notes
-        if followup.notes:
-            notes_text = followup.notes[:100] + "..." if len(followup.notes) > 100 else followup.notes
-            notes_label = ctk.CTkLabel(
-                content_frame,
-                text=f"Notes: {notes_text}",
-                font=ctk.CTkFont(size=9),
-                text_color="light gray",
-                anchor="w"
-            )
-            notes_label.pack(fill="x")
+        notes_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self._font_9,
+            text_color="light gray",
+            anchor="w"
+        )
         
         # Action buttons
         buttons_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
@@ -347,34 +620,86 @@ class TaskPanel(ctk.CTkFrame):
         complete_btn = ctk.CTkButton(
             buttons_frame,
             text="Complete",
-            command=lambda: self.complete_followup(followup.id),
             width=80,
             height=25,
-            font=ctk.CTkFont(size=10)
+            font=self._font_10
         )
         complete_btn.pack(pady=2)
         
         snooze_btn = ctk.CTkButton(
             buttons_frame,
             text="Snooze",
-            command=lambda: self.snooze_followup_dialog(followup),
             width=80,
             height=25,
-            font=ctk.CTkFont(size=10)
+            font=self._font_10
         )
         snooze_btn.pack(pady=2)
+        
+        return {
+            "frame": item_frame,
+            "visible": False,
+            "priority_frame": priority_frame,
+            "title_label": title_label,
+            "recipient_label": recipient_label,
+            "due_label": due_label,
+            "notes_label": notes_label,
+            "complete_btn": complete_btn,
+            "snooze_btn": snooze_btn
+        }
+    
+    def update_followup_widget(self, row: Dict, followup: FollowUp, now: datetime):
+        """Fill a follow-up row widget with an item's data."""
+        # Priority indicator
+        priority_idx = followup.priority_idx
+        row["priority_frame"].configure(
+            fg_color=_PRIORITY_COLORS[priority_idx] if priority_idx is not None else _UNKNOWN_COLOR
+        )
+        
+        # Subject and recipient
+        row["title_label"].configure(text=_truncate(followup.subject, 50))
+        row["recipient_label"].configure(text=f"To: {followup.recipient}")
+        
+        # Optional labels are repacked in order below
+        row["due_label"].pack_forget()
+        row["notes_label"].pack_forget()
+        
+        # Due date
+        if followup.follow_up_date:
+            due_date_str = followup.follow_up_date.strftime("%Y-%m-%d %H:%M")
+            days_until = (followup.follow_up_date - now).days
+            
+            if days_until < 0:
+                due_text = f"Due: {due_date_str} (OVERDUE)"
+                due_color = "red"
+            elif days_until == 0:
+                due_text = f"Due: {due_date_str} (TODAY)"
+                due_color = "orange"
+            else:
+                due_text = f"Due: {due_date_str} ({days_until} days)"
+                due_color = "white"
+            
+            row["due_label"].configure(text=due_text, text_color=due_color)
+            row["due_label"].pack(fill="x")
+        
+        # Notes
+        if followup.notes:
+            row["notes_label"].configure(text=f"Notes: {_truncate(followup.notes, 100)}")
+            row["notes_label"].pack(fill="x")
+        
+        # Action buttons
+        row["complete_btn"].configure(command=functools.partial(self.complete_followup, followup.id))
+        row["snooze_btn"].configure(command=functools.partial(self.snooze_followup_dialog, followup.id))
+        
+        self._show_row(row)
     
     def update_overdue_display(self):
         """Update the overdue items display."""
-        # Clear existing widgets
-        for widget in self.overdue_frame.winfo_children():
-            widget.destroy()
-        
         # Update header and alert
         count = len(self.overdue_items)
-        critical_count = sum(1 for item in self.overdue_items if item.get('escalation') == 'critical')
+        critical_count = sum(1 for item in self.overdue_items if item.escalation == 'critical')
         
         self.overdue_header.configure(text=f"Overdue Items ({count})")
+        self._update_page_label("overdue")
         
         if critical_count > 0:
             self.alert_label.configure(
@@ -389,39 +714,26 @@ class TaskPanel(ctk.CTkFrame):
             )
             self.alert_frame.configure(fg_color="gray")
         
-        if not self.overdue_items:
-            no_items_label = ctk.CTkLabel(
-                self.overdue_frame,
-                text="No overdue items! 🎉",
-                text_color="green",
-                font=ctk.CTkFont(size=14)
-            )
-            no_items_label.pack(pady=20)
-            return
+        # Display the current page of overdue items
+        start = self._page["overdue"] * PAGE_SIZE
+        self._render_rows(
+            "overdue", self.overdue_items[start:start + PAGE_SIZE], self._overdue_rows,
+            self.create_overdue_widget, self.update_overdue_widget,
+            self.overdue_frame
+        )
         
-        # Display overdue items
-        for item in self.overdue_items:
-            self.create_overdue_widget(item)
+        if not self.overdue_items:
+            self.overdue_empty_label.pack(pady=20)
+        else:
+            self.overdue_empty_label.pack_forget()
     
-    def create_overdue_widget(self, item: Dict):
-        """Create a widget for an overdue item."""
+    def create_overdue_widget(self) -> Dict:
+        """Create a reusable row widget for overdue items."""
         # Main frame
         item_frame = ctk.CTkFrame(self.overdue_frame)
-        item_frame.pack(fill="x", padx=5, pady=5)
         
         # Escalation indicator
-        escalation_colors = {
-            "low": "green",
-            "medium": "orange",
-            "high": "red", 
-            "critical": "dark red"
-        }
-        
-        escalation_frame = ctk.CTkFrame(
-            item_frame,
-            fg_color=escalation_colors.get(item.get('escalation'), "gray"),
-            width=5
-        )
+        escalation_frame = ctk.CTkFrame(item_frame, fg_color="gray", width=5)
         escalation_frame.pack(side="left", fill="y", padx=(5, 10))
         
         # Content frame
@@ -431,36 +743,30 @@ class TaskPanel(ctk.CTkFrame):
         # Title
         title_label = ctk.CTkLabel(
             content_frame,
-            text=item.get('title', 'Unknown Item'),
-            font=ctk.CTkFont(size=12, weight="bold"),
+            text="",
+            font=self._font_bold12,
             anchor="w"
         )
         title_label.pack(fill="x")
         
         # Overdue info
-        overdue_days = item.get('overdue_days', 0)
-        escalation = item.get('escalation', 'low').upper()
-        
         overdue_label = ctk.CTkLabel(
             content_frame,
-            text=f"Overdue: {overdue_days} days | Escalation: {escalation}",
-            font=ctk.CTkFont(size=10),
+            text="",
+            font=self._font_10,
             text_color="orange",
             anchor="w"
         )
         overdue_label.pack(fill="x")
         
-        # Description
-        if item.get('description'):
-            desc_text = item['description'][:80] + "..." if len(item['description']) > 80 else item['description']
-            desc_label = ctk.CTkLabel(
-                content_frame,
-                text=desc_text,
-                font=ctk.CTkFont(size=9),
-                text_color="light gray",
-                anchor="w"
-            )
-            desc_label.pack(fill="x")
+        # Description is packed per item when present
+        desc_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self._font_9,
+            text_color="light gray",
+            anchor="w"
+        )
         
         # Action buttons
         buttons_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
@@ -469,66 +775,86 @@ class TaskPanel(ctk.CTkFrame):
         resolve_btn = ctk.CTkButton(
             buttons_frame,
             text="Resolve",
-            command=lambda: self.resolve_overdue_item(item),
             width=80,
             height=25,
-            font=ctk.CTkFont(size=10)
+            font=self._font_10
         )
         resolve_btn.pack(pady=2)
         
         escalate_btn = ctk.CTkButton(
             buttons_frame,
             text="Escalate",
-            command=lambda: self.escalate_overdue_item(item),
             width=80,
             height=25,
-            font=ctk.CTkFont(size=10)
+            font=self._font_10
         )
         escalate_btn.pack(pady=2)
+        
+        return {
+            "frame": item_frame,
+            "visible": False,
+            "escalation_frame": escalation_frame,
+            "title_label": title_label,
+            "overdue_label": overdue_label,
+            "desc_label": desc_label,
+            "resolve_btn": resolve_btn,
+            "escalate_btn": escalate_btn
+        }
+    
+    def update_overdue_widget(self, row: Dict, item: OverdueItem):
+        """Fill an overdue row widget with an item's data."""
+        # Escalation indicator
+        escalation_level = item.escalation_level
+        row["escalation_frame"].configure(
+            fg_color=_ESCALATION_COLORS[escalation_level] if escalation_level is not None else _UNKNOWN_COLOR
+        )
+        
+        # Title
+        row["title_label"].configure(text=item.title or 'Unknown Item')
+        
+        # Overdue info
+        escalation = item.escalation.upper()
+        row["overdue_label"].configure(text=f"Overdue: {item.overdue_days} days | Escalation: {escalation}")
+        
+        # Description
+        if item.description:
+            row["desc_label"].configure(text=_truncate(item.description, 80))
+            row["desc_label"].pack(fill="x")
+        else:
+            row["desc_label"].pack_forget()
+        
+        # Action buttons
+        row["resolve_btn"].configure(command=functools.partial(self.resolve_overdue_item, item))
+        row["escalate_btn"].configure(command=functools.partial(self.escalate_overdue_item, item))
+        
+        self._show_row(row)
     
     def update_reminders_display(self):
         """Update the reminders display."""
-        # Clear existing widgets
-        for widget in self.reminders_frame.winfo_children():
-            widget.destroy()
-        
         # Update header
-        count = len(self.reminders)
+        count = self._totals["reminders"]
         self.reminders_header.configure(text=f"Active Reminders ({count})")
+        self._update_page_label("reminders")
         
-        if not self.reminders:
-            no_items_label = ctk.CTkLabel(
-                self.reminders_frame,
-                text="No active reminders",
-                text_color="gray"
-            )
-            no_items_label.pack(pady=20)
-            return
+        # Display reminders, reusing existing rows where possible
+        self._render_rows(
+            "reminders", self.reminders, self._reminder_rows,
+            self.create_reminder_widget, self.update_reminder_widget,
+            self.reminders_frame
+        )
         
-        # Display reminders
-        for reminder in self.reminders:
-            self.create_reminder_widget(reminder)
+        if not self.reminders:
+            self.reminders_empty_label.pack(pady=20)
+        else:
+            self.reminders_empty_label.pack_forget()
     
-    def create_reminder_widget(self, reminder: Reminder):
-        """Create a widget for a reminder."""
+    def create_reminder_widget(self) -> Dict:
+        """Create a reusable row widget for reminders."""
         # Main frame
         item_frame = ctk.CTkFrame(self.reminders_frame)
-        item_frame.pack(fill="x", padx=5, pady=5)
         
         # Type indicator
-        type_colors = {
-            "meeting": "blue",
-            "deadline": "red",
-            "followup": "orange",
-            "important_email": "purple",
-            "custom": "gray"
-        }
-        
-        type_frame = ctk.CTkFrame(
-            item_frame,
-            fg_color=type_colors.get(reminder.reminder_type, "gray"),
-            width=5
-        )
+        type_frame = ctk.CTkFrame(item_frame, fg_color="gray", width=5)
         type_frame.pack(side="left", fill="y", padx=(5, 10))
         
         # Content frame
@@ -538,35 +864,28 @@ class TaskPanel(ctk.CTkFrame):
         # Title
         title_label = ctk.CTkLabel(
             content_frame,
-            text=reminder.title,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            text="",
+            font=self._font_bold12,
             anchor="w"
         )
         title_label.pack(fill="x")
         
-        # Type and time
-        if reminder.reminder_time:
-            time_str = reminder.reminder_time.strftime("%Y-%m-%d %H:%M")
-            type_label = ctk.CTkLabel(
-                content_frame,
-                text=f"Type: {reminder.reminder_type.title()} | Due: {time_str}",
-                font=ctk.CTkFont(size=10),
-                text_color="gray",
-                anchor="w"
-            )
-            type_label.pack(fill="x")
+        # Type/time and description are packed per item when present
+        type_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self._font_10,
+            text_color="gray",
+            anchor="w"
+        )
         
-        # Description
-        if reminder.description:
-            desc_text = reminder.description[:100] + "..." if len(reminder.description) > 100 else reminder.description
-            desc_label = ctk.CTkLabel(
-                content_frame,
-                text=desc_text,
-                font=ctk.CTkFont(size=9),
-                text_color="light gray",
-                anchor="w"
-            )
-            desc_label.pack(fill="x")
+        desc_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self._font_9,
+            text_color="light gray",
+            anchor="w"
+        )
         
         # Action buttons
         buttons_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
@@ -575,48 +894,131 @@ class TaskPanel(ctk.CTkFrame):
         dismiss_btn = ctk.CTkButton(
             buttons_frame,
             text="Dismiss",
-            command=lambda: self.dismiss_reminder(reminder.id),
             width=80,
             height=25,
-            font=ctk.CTkFont(size=10)
+            font=self._font_10
         )
         dismiss_btn.pack(pady=2)
         
         snooze_btn = ctk.CTkButton(
             buttons_frame,
             text="Snooze",
-            command=lambda: self.snooze_reminder_dialog(reminder),
             width=80,
             height=25,
-            font=ctk.CTkFont(size=10)
+            font=self._font_10
         )
         snooze_btn.pack(pady=2)
+        
+        return {
+            "frame": item_frame,
+            "visible": False,
+            "type_frame": type_frame,
+            "title_label": title_label,
+            "type_label": type_label,
+            "desc_label": desc_label,
+            "dismiss_btn": dismiss_btn,
+            "snooze_btn": snooze_btn
+        }
+    
+    def update_reminder_widget(self, row: Dict, reminder: Reminder):
+        """Fill a reminder row widget with a reminder's data."""
+        # Type indicator
+        type_idx = reminder.type_idx
+        row["type_frame"].configure(
+            fg_color=_TYPE_COLORS[type_idx] if type_idx is not None else _UNKNOWN_COLOR
+        )
+        
+        # Title
+        row["title_label"].configure(text=reminder.title)
+        
+        # Optional labels are repacked in order below
+        row["type_label"].pack_forget()
+        row["desc_label"].pack_forget()
+        
+        # Type and time
+        if reminder.reminder_time:
+            time_str = reminder.reminder_time.strftime("%Y-%m-%d %H:%M")
+            row["type_label"].configure(text=f"Type: {reminder.reminder_type.title()} | Due: {time_str}")
+            row["type_label"].pack(fill="x")
+        
+        # Description
+        if reminder.description:
+            row["desc_label"].configure(text=_truncate(reminder.description, 100))
+            row["desc_label"].pack(fill="x")
+        
+        # Action buttons
+        row["dismiss_btn"].configure(command=functools.partial(self.dismiss_reminder, reminder.id))
+        row["snooze_btn"].configure(command=functools.partial(self.snooze_reminder_dialog, reminder))
+        
+        self._show_row(row)
     
     def refresh_statistics(self):
         """Refresh the statistics display."""
+        def stats_thread():
+            try:
+                # Services are independent, so fetch their statistics concurrently
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    followup_future = executor.submit(
+                        self._cached_stats, "followup", self.followup_manager.get_statistics
+                    )
+                    overdue_future = executor.submit(
+                        self._cached_stats, "overdue", self.overdue_detector.get_statistics
+                    )
+                    reminder_future = executor.submit(
+                        self._cached_stats, "reminder", self.reminder_system.get_statistics
+                    )
+                    sections = [
+                        ("Follow-up Statistics", followup_future.result()),
+                        ("Overdue Statistics", overdue_future.result()),
+                        ("Reminder Statistics", reminder_future.result())
+                    ]
+                
+                self.after(0, lambda: self.display_statistics(sections))
+                
+            except Exception as e:
+                logger.error(f"Error refreshing statistics: {e}")
+                error_message = str(e)
+                self.after(0, lambda: self.display_statistics_error(error_message))
+        
+        threading.Thread(target=stats_thread, daemon=True).start()
+    
+    def display_statistics(self, sections: List[Tuple[str, Dict]]):
+        """Display fetched statistics sections."""
         # Clear existing widgets
         for widget in self.stats_frame.winfo_children():
             widget.destroy()
         
-        try:
-            # Get statistics from all services
-            followup_stats = self.followup_manager.get_statistics()
-            overdue_stats = self.overdue_detector.get_statistics()
-            reminder_stats = self.reminder_system.get_statistics()
-            
-            # Display statistics
-            self.create_stats_section("Follow-up Statistics", followup_stats)
-            self.create_stats_section("Overdue Statistics", overdue_stats)
-            self.create_stats_section("Reminder Statistics", reminder_stats)
-            
-        except Exception as e:
-            logger.error(f"Error refreshing statistics: {e}")
-            error_label = ctk.CTkLabel(
-                self.stats_frame,
-                text=f"Error loading statistics: {str(e)}",
-                text_color="red"
-            )
-            error_label.pack(pady=20)
+        for title, stats in sections:
+            self.create_stats_section(title, stats)
+    
+    def display_statistics_error(self, error_message: str):
+        """Display a statistics loading error."""
+        # Clear existing widgets
+        for widget in self.stats_frame.winfo_children():
+            widget.destroy()
+        
+        error_label = ctk.CTkLabel(
+            self.stats_frame,
+            text=f"Error loading statistics: {error_message}",
+            text_color="red"
+        )
+        error_label.pack(pady=20)
+    
+    def _cached_stats(self, name: str, fetch: Callable[[], Dict], ttl: float = STATS_CACHE_TTL) -> Dict:
+        """Return a service's statistics, reusing a recent result if available."""
+        cached = self._stats_cache.get(name)
+        now = time.monotonic()
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        
+        stats = fetch()
+        self._stats_cache[name] = (now, stats)
+        return stats
+    
+    def _invalidate_caches(self):
+        """Drop cached statistics after data changes."""
+        self._stats_cache.clear()
+        self.followup_manager.invalidate_statistics()
     
     def create_stats_section(self, title: str, stats: Dict):
         """Create a statistics section."""
@@ -624,7 +1026,7 @@ class TaskPanel(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self.stats_frame,
             text=title,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_bold14
         )
         title_label.pack(anchor="w", padx=10, pady=(10, 5))
         
@@ -639,7 +1041,7 @@ class TaskPanel(ctk.CTkFrame):
                 sub_title = ctk.CTkLabel(
                     section_frame,
                     text=f"{key.replace('_', ' ').title()}:",
-                    font=ctk.CTkFont(size=12, weight="bold")
+                    font=self._font_bold12
                 )
                 sub_title.pack(anchor="w", padx=10, pady=(5, 2))
                 
@@ -647,7 +1049,7 @@ class TaskPanel(ctk.CTkFrame):
                     stat_label = ctk.CTkLabel(
                         section_frame,
                         text=f"  {sub_key.replace('_', ' ').title()}: {sub_value}",
-                        font=ctk.CTkFont(size=10)
+                        font=self._font_10
                     )
                     stat_label.pack(anchor="w", padx=20, pady=1)
             else:
@@ -655,7 +1057,7 @@ class TaskPanel(ctk.CTkFrame):
                 stat_label = ctk.CTkLabel(
                     section_frame,
                     text=f"{key.replace('_', ' ').title()}: {value}",
-                    font=ctk.CTkFont(size=11)
+                    font=self._font_11
                 )
                 stat_label.pack(anchor="w", padx=10, pady=2)
     
@@ -665,15 +1067,17 @@ class TaskPanel(ctk.CTkFrame):
         try:
             success = self.followup_manager.complete_followup(followup_id)
             if success:
+                self._followups_left_overdue(self._overdue_followups([followup_id]), [followup_id])
                 messagebox.showinfo("Success", "Follow-up marked as completed!")
-                self.refresh_all_data()
+                self._invalidate_caches()
+                self._schedule_refresh()
             else:
                 messagebox.showerror("Error", "Failed to complete follow-up.")
         except Exception as e:
             logger.error(f"Error completing follow-up: {e}")
             messagebox.showerror("Error", f"Failed to complete follow-up: {str(e)}")
     
-    def snooze_followup_dialog(self, followup: FollowUp):
+    def snooze_followup_dialog(self, followup_id: int):
         """Show snooze dialog for follow-up."""
         dialog = ctk.CTkInputDialog(
             text="Enter days to snooze:",
@@ -683,40 +1087,46 @@ class TaskPanel(ctk.CTkFrame):
         
         if days and days.isdigit():
             try:
-                success = self.followup_manager.snooze_followup(followup.id, int(days))
+                success = self.followup_manager.snooze_followup(followup_id, int(days))
                 if success:
+                    self._followups_left_overdue(self._overdue_followups([followup_id]), [followup_id])
                     messagebox.showinfo("Success", f"Follow-up snoozed for {days} days!")
-                    self.refresh_all_data()
+                    self._invalidate_caches()
+                    self._schedule_refresh()
                 else:
                     messagebox.showerror("Error", "Failed to snooze follow-up.")
             except Exception as e:
                 logger.error(f"Error snoozing follow-up: {e}")
                 messagebox.showerror("Error", f"Failed to snooze follow-up: {str(e)}")
     
-    def resolve_overdue_item(self, item: Dict):
+    def resolve_overdue_item(self, item: OverdueItem):
         """Resolve an overdue item."""
         try:
-            if item.get('type') == 'followup' and item.get('id'):
-                success = self.followup_manager.complete_followup(item['id'])
+            if item.type == 'followup' and item.id:
+                success = self.followup_manager.complete_followup(item.id)
                 if success:
+                    self.overdue_detector.on_task_changed(item, None)
                     messagebox.showinfo("Success", "Overdue item resolved!")
-                    self.refresh_all_data()
+                    self._invalidate_caches()
+                    self._schedule_refresh()
                 else:
                     messagebox.showerror("Error", "Failed to resolve overdue item.")
             else:
                 messagebox.showinfo("Info", "Item marked as resolved (manual tracking).")
-                self.refresh_all_data()
+                self._invalidate_caches()
+                self._schedule_refresh()
         except Exception as e:
             logger.error(f"Error resolving overdue item: {e}")
             messagebox.showerror("Error", f"Failed to resolve item: {str(e)}")
     
-    def escalate_overdue_item(self, item: Dict):
+    def escalate_overdue_item(self, item: OverdueItem):
         """Escalate an overdue item."""
         try:
             success = self.overdue_detector.escalate_overdue_item(item)
             if success:
                 messagebox.showinfo("Success", "Item escalated successfully!")
-                self.refresh_all_data()
+                self._invalidate_caches()
+                self._schedule_refresh()
             else:
                 messagebox.showinfo("Info", "Item already at maximum escalation level.")
         except Exception as e:
@@ -729,7 +1139,8 @@ class TaskPanel(ctk.CTkFrame):
             success = self.reminder_system.dismiss_reminder(reminder_id)
             if success:
                 messagebox.showinfo("Success", "Reminder dismissed!")
-                self.refresh_all_data()
+                self._invalidate_caches()
+                self._schedule_refresh()
             else:
                 messagebox.showerror("Error", "Failed to dismiss reminder.")
         except Exception as e:
@@ -753,7 +1164,8 @@ class TaskPanel(ctk.CTkFrame):
                 success = self.reminder_system.snooze_reminder(reminder.id, int(minutes))
                 if success:
                     messagebox.showinfo("Success", f"Reminder snoozed for {minutes} minutes!")
-                    self.refresh_all_data()
+                    self._invalidate_caches()
+                    self._schedule_refresh()
                 else:
                     messagebox.showerror("Error", "Failed to snooze reminder.")
             except Exception as e:
@@ -763,111 +1175,354 @@ class TaskPanel(ctk.CTkFrame):
     # Bulk action methods
     def mark_all_followups_completed(self):
         """Mark all follow-ups as completed."""
-        if not self.followups:
+        # The list only holds the current page, so act on every pending id
+        followup_ids = self.followup_manager.get_pending_followup_ids()
+        if not followup_ids:
             messagebox.showinfo("Info", "No follow-ups to complete.")
             return
         
         result = messagebox.askyesno(
             "Confirm", 
-            f"Mark all {len(self.followups)} follow-ups as completed?"
+            f"Mark all {len(followup_ids)} follow-ups as completed?"
         )
         
         if result:
-            completed_count = 0
-            for followup in self.followups:
-                try:
-                    if self.followup_manager.complete_followup(followup.id):
-                        completed_count += 1
-                except Exception as e:
-                    logger.error(f"Error completing follow-up {followup.id}: {e}")
-            
-            messagebox.showinfo("Success", f"Completed {completed_count} follow-ups!")
-            self.refresh_all_data()
+            # Snapshot the overdue items here; the worker must not read
+            # self.overdue_items while a refresh replaces it
+            overdue_followups = self._overdue_followups(followup_ids)
+            self._run_bulk_action(
+                followup_ids,
+                lambda chunk: self._complete_followups(chunk, overdue_followups),
+                "Completed {count} follow-ups!"
+            )
+    
+    def _complete_followups(self, followup_ids: List[int],
+                            overdue_followups: Dict[int, OverdueItem]) -> int:
+        """Complete a batch of follow-ups and update the overdue summary."""
+        completed = self.followup_manager.complete_followups(followup_ids)
+        self._followups_left_overdue(overdue_followups, followup_ids)
+        return completed
+    
+    def _overdue_followups(self, followup_ids: List[int]) -> Dict[int, OverdueItem]:
+        """Get the displayed overdue items for follow-ups by id; call on the Tk thread."""
+        ids = set(followup_ids)
+        return {
+            item.id: item for item in self.overdue_items
+            if item.type == 'followup' and item.id in ids
+        }
+    
+    def _followups_left_overdue(self, overdue_followups: Dict[int, OverdueItem],
+                                followup_ids: List[int]):
+        """Remove follow-ups that are no longer overdue from the overdue summary."""
+        rebuild = False
+        for followup_id in followup_ids:
+            item = overdue_followups.get(followup_id)
+            if item is not None:
+                self.overdue_detector.on_task_changed(item, None)
+            else:
+                rebuild = True
+        
+        # The overdue list loads lazily, so a follow-up missing from it may
+        # still be counted; rebuild the summary rather than serve stale counts
+        if rebuild:
+            self.overdue_detector.invalidate_summary()
     
     def escalate_all_overdue(self):
         """Escalate all overdue items."""
+        # The overdue list only loads with its tab, so load it now if it is
+        # stale; the tab still redraws when it is next selected
+        if self._dirty["overdue"]:
+            self._load_page("overdue")
+        
         if not self.overdue_items:
             messagebox.showinfo("Info", "No overdue items to escalate.")
             return
         
-        escalated_count = 0
-        for item in self.overdue_items:
-            try:
-                if self.overdue_detector.escalate_overdue_item(item):
-                    escalated_count += 1
-            except Exception as e:
-                logger.error(f"Error escalating item: {e}")
-        
-        messagebox.showinfo("Success", f"Escalated {escalated_count} items!")
-        self.refresh_all_data()
+        self._run_bulk_action(
+            self.overdue_items,
+            self.overdue_detector.escalate_items,
+            "Escalated {count} items!"
+        )
     
     def snooze_all_reminders(self, minutes: int):
         """Snooze all reminders."""
-        if not self.reminders:
+        # The list only holds the current page, so act on every due id
+        reminder_ids = self.reminder_system.get_due_reminder_ids()
+        if not reminder_ids:
             messagebox.showinfo("Info", "No reminders to snooze.")
             return
         
-        snoozed_count = 0
-        for reminder in self.reminders:
-            try:
-                if self.reminder_system.snooze_reminder(reminder.id, minutes):
-                    snoozed_count += 1
-            except Exception as e:
-                logger.error(f"Error snoozing reminder {reminder.id}: {e}")
-        
-        messagebox.showinfo("Success", f"Snoozed {snoozed_count} reminders!")
-        self.refresh_all_data()
+        self._run_bulk_action(
+            reminder_ids,
+            lambda chunk: self.reminder_system.snooze_reminders(chunk, minutes),
+            "Snoozed {count} reminders!"
+        )
     
     def dismiss_all_reminders(self):
         """Dismiss all reminders."""
-        if not self.reminders:
+        # The list only holds the current page, so act on every due id
+        reminder_ids = self.reminder_system.get_due_reminder_ids()
+        if not reminder_ids:
             messagebox.showinfo("Info", "No reminders to dismiss.")
             return
         
         result = messagebox.askyesno(
             "Confirm",
-            f"Dismiss all {len(self.reminders)} reminders?"
+            f"Dismiss all {len(reminder_ids)} reminders?"
         )
         
         if result:
-            dismissed_count = 0
-            for reminder in self.reminders:
-                try:
-                    if self.reminder_system.dismiss_reminder(reminder.id):
-                        dismissed_count += 1
-                except Exception as e:
-                    logger.error(f"Error dismissing reminder {reminder.id}: {e}")
-            
-            messagebox.showinfo("Success", f"Dismissed {dismissed_count} reminders!")
-            self.refresh_all_data()
+            self._run_bulk_action(
+                reminder_ids,
+                self.reminder_system.dismiss_reminders,
+                "Dismissed {count} reminders!"
+            )
+    
+    def _run_bulk_action(self, items: List, action: Callable[[List], int], success_message: str):
+        """
+        Run a batched bulk action on a worker thread while showing progress.
+        
+        Args:
+            items: Items (or ids) to act on
+            action: Batch service call returning the number of items affected
+            success_message: Message shown when done, formatted with {count}
+        """
+        if self._bulk_running:
+            messagebox.showinfo("Info", "A bulk action is already running.")
+            return
+        
+        self._bulk_running = True
+        progress_queue: queue.Queue = queue.Queue()
+        
+        def bulk_thread():
+            affected = 0
+            try:
+                for start in range(0, len(items), BULK_CHUNK_SIZE):
+                    affected += action(items[start:start + BULK_CHUNK_SIZE])
+                    progress_queue.put(("progress", min(1.0, (start + BULK_CHUNK_SIZE) / len(items))))
+                progress_queue.put(("done", affected))
+            except Exception as e:
+                logger.error(f"Error running bulk action: {e}")
+                progress_queue.put(("error", str(e)))
+        
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=10, pady=(0, 5), before=self.tabview)
+        
+        threading.Thread(target=bulk_thread, daemon=True).start()
+        self.after(50, lambda: self._poll_bulk_progress(progress_queue, success_message))
+    
+    def _poll_bulk_progress(self, progress_queue: queue.Queue, success_message: str):
+        """Apply queued bulk-action progress updates to the UI."""
+        try:
+            while True:
+                kind, value = progress_queue.get_nowait()
+                if kind == "progress":
+                    self.progress_bar.set(value)
+                    continue
+                
+                self._bulk_running = False
+                self.progress_bar.pack_forget()
+                if kind == "done":
+                    messagebox.showinfo("Success", success_message.format(count=value))
+                else:
+                    messagebox.showerror("Error", f"Bulk action failed: {value}")
+                self._invalidate_caches()
+                self._schedule_refresh()
+                return
+        except queue.Empty:
+            pass
+        
+        self.after(50, lambda: self._poll_bulk_progress(progress_queue, success_message))
+    
+    def export_followups(self, fmt: str = "csv"):
+        """
+        Export all pending follow-ups to a file.
+        
+        Args:
+            fmt: Output format - csv, xlsx, json or pdf
+        """
+        if fmt not in _EXPORT_FORMATS:
+            messagebox.showerror("Error", f"Unsupported export format: {fmt}")
+            return
+        
+        description, extension = _EXPORT_FORMATS[fmt]
+        path = filedialog.asksaveasfilename(
+            title="Export Follow-ups",
+            defaultextension=extension,
+            filetypes=[(description, f"*{extension}")]
+        )
+        if not path:
+            return
+        
+        if self._export_running:
+            messagebox.showinfo("Info", "An export is already running.")
+            return
+        
+        self._export_running = True
+        self._export_cancelled = False
+        progress_queue: queue.Queue = queue.Queue()
+        # Each format writer streams rows straight from the paged source
+        writer = getattr(self, f"_export_{fmt}")
+        
+        def export_thread():
+            try:
+                total = max(1, self.followup_manager.count_pending_followups())
+                row_count = writer(path, self._iter_export_rows(total, progress_queue))
+                progress_queue.put(("done", row_count))
+            except Exception as e:
+                logger.error(f"Error exporting follow-ups: {e}")
+                progress_queue.put(("error", str(e)))
+        
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=10, pady=(0, 5), before=self.tabview)
+        self.cancel_export_button.pack(pady=(0, 5), before=self.tabview)
+        
+        threading.Thread(target=export_thread, daemon=True).start()
+        self.after(50, lambda: self._poll_export_progress(progress_queue, path))
     
-    def export_followups(self):
-        """Export follow-ups list."""
+    def _poll_export_progress(self, progress_queue: queue.Queue, path: str):
+        """Apply queued export progress updates to the UI."""
         try:
-            # Simple export to show the concept
-            export_data = []
-            for followup in self.followups:
-                export_data.append({
-                    'Subject': followup.subject,
-                    'Recipient': followup.recipient,
-                    'Due Date': followup.follow_up_date.isoformat() if followup.follow_up_date else '',
-                    'Priority': followup.priority,
-                    'Status': followup.status,
-                    'Notes': followup.notes
-                })
+            while True:
+                kind, value = progress_queue.get_nowait()
+                if kind == "progress":
+                    self.progress_bar.set(value)
+                    continue
+                
+                self._export_running = False
+                self.progress_bar.pack_forget()
+                self.cancel_export_button.pack_forget()
+                if kind == "error":
+                    messagebox.showerror("Error", f"Failed to export follow-ups: {value}")
+                elif self._export_cancelled:
+                    messagebox.showinfo("Export", f"Export cancelled after {value} follow-ups.")
+                else:
+                    messagebox.showinfo("Export", f"Exported {value} follow-ups to {path}")
+                return
+        except queue.Empty:
+            pass
+        
+        self.after(50, lambda: self._poll_export_progress(progress_queue, path))
+    
+    def _iter_export_rows(self, total: int, progress_queue: queue.Queue) -> Iterator[List[str]]:
+        """Yield export rows page by page, queueing progress between pages."""
+        row_count = 0
+        # Fetch one page at a time so only a page is held in memory
+        for page in self.followup_manager.iter_pending_followups(page_size=EXPORT_PAGE_SIZE):
+            if self._export_cancelled:
+                return
             
-            # For now, just show count
-            messagebox.showinfo("Export", f"Would export {len(export_data)} follow-ups to CSV")
+            for followup in page:
+                yield [
+                    followup.subject,
+                    followup.recipient,
+                    followup.follow_up_date.isoformat() if followup.follow_up_date else '',
+                    followup.priority,
+                    followup.status,
+                    followup.notes
+                ]
+            row_count += len(page)
+            progress_queue.put(("progress", min(1.0, row_count / total)))
+    
+    def _export_csv(self, path: str, rows: Iterator[List[str]]) -> int:
+        """Write export rows to a CSV file."""
+        row_count = 0
+        with open(path, "w", newline="", encoding="utf-8") as export_file:
+            writer = csv.writer(export_file)
+            writer.writerow(_EXPORT_FIELDS)
+            for row in rows:
+                writer.writerow(row)
+                row_count += 1
+        return row_count
+    
+    def _export_json(self, path: str, rows: Iterator[List[str]]) -> int:
+        """Write export rows to a JSON array, one object at a time."""
+        row_count = 0
+        with open(path, "w", encoding="utf-8") as export_file:
+            export_file.write("[")
+            for row in rows:
+                if row_count:
+                    export_file.write(",")
+                export_file.write("\n  ")
+                json.dump(dict(zip(_EXPORT_FIELDS, row)), export_file, ensure_ascii=False)
+                row_count += 1
+            export_file.write("\n]\n")
+        return row_count
+    
+    def _export_xlsx(self, path: str, rows: Iterator[List[str]]) -> int:
+        """Write export rows to an XLSX workbook in write-only (streaming) mode."""
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ImportError("XLSX export requires openpyxl (pip install openpyxl)")
+        
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Follow-ups")
+        sheet.append(_EXPORT_FIELDS)
+        
+        row_count = 0
+        for row in rows:
+            sheet.append(row)
+            row_count += 1
+        
+        workbook.save(path)
+        return row_count
+    
+    def _export_pdf(self, path: str, rows: Iterator[List[str]]) -> int:
+        """Write export rows to a PDF, one line per follow-up."""
+        try:
+            from reportlab.lib.pagesizes import letter
+            from reportlab.pdfgen import canvas
+        except ImportError:
+            raise ImportError("PDF export requires reportlab (pip install reportlab)")
+        
+        pdf = canvas.Canvas(path, pagesize=letter)
+        _, page_height = letter
+        
+        pdf.setFont("Helvetica-Bold", 12)
+        pdf.drawString(40, page_height - 50, "Pending Follow-ups")
+        pdf.setFont("Helvetica", 9)
+        y = page_height - 74
+        
+        row_count = 0
+        for subject, recipient, due_date, priority, status, notes in rows:
+            if y < 50:
+                pdf.showPage()
+                pdf.setFont("Helvetica", 9)
+                y = page_height - 50
             
-        except Exception as e:
-            logger.error(f"Error exporting follow-ups: {e}")
-            messagebox.showerror("Error", f"Failed to export follow-ups: {str(e)}")
+            line = f"{due_date[:16] or 'No date':<16}  [{priority}/{status}]  {subject} - {recipient}"
+            pdf.drawString(40, y, _truncate(line, 110))
+            y -= 14
+            row_count += 1
+        
+        pdf.save()
+        return row_count
+    
+    def cancel_export(self):
+        """Stop a running export after the current page."""
+        self._export_cancelled = True
     
     def generate_overdue_report(self):
         """Generate overdue items report."""
+        # The detector keeps its summary current as tasks change, so repeat
+        # clicks are cheap without a cache here
+        def report_thread():
+            try:
+                overdue_summary = self.overdue_detector.get_overdue_summary()
+                self.after(0, lambda: self.show_overdue_report(overdue_summary))
+            except Exception as e:
+                logger.error(f"Error generating overdue report: {e}")
+                error_message = str(e)
+                self.after(0, lambda: messagebox.showerror(
+                    "Error", f"Failed to generate report: {error_message}"
+                ))
+        
+        threading.Thread(target=report_thread, daemon=True).start()
+    
+    def show_overdue_report(self, overdue_summary: Dict):
+        """Show an overdue summary in a report dialog."""
         try:
-            overdue_summary = self.overdue_detector.get_overdue_summary()
-            
             report = f"""Overdue Items Report
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
@@ -896,5 +1551,5 @@ Escalation Breakdown:
             close_btn.pack(pady=10)
             
         except Exception as e:
-            logger.error(f"Error generating overdue report: {e}")
+            logger.error(f"Error showing overdue report: {e}")
             messagebox.showerror("Error", f"Failed to generate report: {str(e)}")
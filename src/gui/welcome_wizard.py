@@ -5,14 +5,105 @@ Guides users through the initial API setup process.
 
 import customtkinter as ctk
 from tkinter import messagebox
-import webbrowser
 import os
-from dotenv import set_key, find_dotenv
+import re
+import threading
+
+
+# Matches the key of a "KEY=value" or "export KEY=value" line in a .env file
+_ENV_KEY_PATTERN = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=")
+
+
+def _write_env_values(env_path, values):
+    """Set several keys in a .env file with a single read and write."""
+    lines = []
+    if os.path.exists(env_path):
+        with open(env_path, "r", encoding="utf-8") as env_file:
+            lines = env_file.read().splitlines()
+    
+    # Quote values the same way dotenv's set_key does
+    pending = {key: "{}='{}'".format(key, value.replace("'", "\\'")) for key, value in values.items()}
+    for index, line in enumerate(lines):
+        match = _ENV_KEY_PATTERN.match(line)
+        if match and match.group(1) in pending:
+            lines[index] = pending.pop(match.group(1))
+    lines.extend(pending.values())
+    
+    temp_path = env_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as env_file:
+        env_file.write("\n".join(lines) + "\n")
+    os.replace(temp_path, env_path)
 
 
 class WelcomeWizard(ctk.CTkToplevel):
     """A welcome wizard that guides users through initial setup."""
 
+    _WELCOME_TEXT = """
+Transform your email experience with intelligent AI automation!
+
+This wizard will help you set up the necessary API keys to get started:
+
+🧠 AI Features:
+• Smart email classification and prioritization
+• Automatic thread summaries
+• Intelligent response suggestions
+• Learning from your feedback
+
+🔐 Secure Setup:
+• Your credentials are stored locally and encrypted
+• OAuth2 authentication with Google
+• Full control over your data
+
+Let's get you set up in just a few minutes!
+    """
+
+    _FEATURES = [
+        "✨ Intelligent email triage and classification",
+        "📊 AI-powered insights and summaries", 
+        "🎯 Personalized recommendations",
+        "⚡ Significant time savings on email management"
+    ]
+
+    _GEMINI_INSTRUCTIONS = """
+The Gemini API powers all AI features in the application.
+Getting your API key is free and takes just 30 seconds!
+    """
+
+    _GEMINI_STEPS = [
+        "1. Click 'Open Google AI Studio' below",
+        "2. Sign in with your Google account",  
+        "3. Click 'Create API key'",
+        "4. Copy the generated API key",
+        "5. Paste it in the field below"
+    ]
+
+    _OAUTH_INSTRUCTIONS = """
+Set up secure access to your Gmail and Calendar.
+This is a one-time setup that ensures your data stays private and secure.
+    """
+
+    _QUICK_STEPS = """
+Quick Setup Steps:
+1. Create a new project (name it 'AI Email Manager')
+2. Enable Gmail API and Google Calendar API  
+3. Set up OAuth consent screen (External, use your email)
+4. Create OAuth 2.0 credentials (Desktop app)
+5. Copy Client ID and Client Secret below
+    """
+
+    _SUCCESS_TEXT = """
+Congratulations! Your AI Email Manager is now configured and ready to use.
+
+Your credentials have been saved securely and the application will restart automatically.
+    """
+
+    _NEXT_STEPS = [
+        "✅ Application will restart with your settings",
+        "🔐 Click 'Authenticate' to connect to Google",
+        "📧 Click 'Refresh Emails' to load your inbox",
+        "🧠 Watch as AI intelligently organizes your emails!"
+    ]
+
     def __init__(self, *args, **kwargs):
         """Initialize the welcome wizard."""
         super().__init__(*args, **kwargs)
@@ -30,6 +121,19 @@ class WelcomeWizard(ctk.CTkToplevel):
         self.current_page = 0
         self.pages = []
         
+        # Shared fonts, created once and reused by every page
+        self._font_bold28 = ctk.CTkFont(size=28, weight="bold")
+        self._font_bold24 = ctk.CTkFont(size=24, weight="bold")
+        self._font_bold16 = ctk.CTkFont(size=16, weight="bold")
+        self._font_bold14 = ctk.CTkFont(size=14, weight="bold")
+        self._font_bold13 = ctk.CTkFont(size=13, weight="bold")
+        self._font_bold12 = ctk.CTkFont(size=12, weight="bold")
+        self._font_16 = ctk.CTkFont(size=16)
+        self._font_14 = ctk.CTkFont(size=14)
+        self._font_13 = ctk.CTkFont(size=13)
+        self._font_12 = ctk.CTkFont(size=12)
+        self._font_11 = ctk.CTkFont(size=11)
+        
         self.setup_ui()
         self.show_page(0)
 
@@ -78,55 +182,31 @@ class WelcomeWizard(ctk.CTkToplevel):
         self.create_pages()
 
     def create_pages(self):
-        """Create all wizard pages."""
+        """Create all wizard pages once; show_page only swaps which one is packed."""
         self.pages = [
-            self.create_welcome_page,
-            self.create_gemini_page,
-            self.create_google_oauth_page,
-            self.create_completion_page
+            self.create_welcome_page(),
+            self.create_gemini_page(),
+            self.create_google_oauth_page(),
+            self.create_completion_page()
         ]
 
     def create_welcome_page(self):
         """Create the welcome page."""
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-            
         content = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=30, pady=30)
         
         # Welcome title
         title = ctk.CTkLabel(
             content, 
             text="Welcome to AI Email Manager! 🎉",
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=self._font_bold28
         )
         title.pack(pady=(0, 20))
         
         # Welcome message
-        welcome_text = """
-Transform your email experience with intelligent AI automation!
-
-This wizard will help you set up the necessary API keys to get started:
-
-🧠 AI Features:
-• Smart email classification and prioritization
-• Automatic thread summaries
-• Intelligent response suggestions
-• Learning from your feedback
-
-🔐 Secure Setup:
-• Your credentials are stored locally and encrypted
-• OAuth2 authentication with Google
-• Full control over your data
-
-Let's get you set up in just a few minutes!
-        """
-        
         welcome_label = ctk.CTkLabel(
             content, 
-            text=welcome_text,
-            font=ctk.CTkFont(size=14),
+            text=self._WELCOME_TEXT,
+            font=self._font_14,
             justify="left"
         )
         welcome_label.pack(pady=20)
@@ -138,54 +218,40 @@ Let's get you set up in just a few minutes!
         features_title = ctk.CTkLabel(
             features_frame,
             text="What You'll Get:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_bold16
         )
         features_title.pack(pady=(15, 10))
         
-        features = [
-            "✨ Intelligent email triage and classification",
-            "📊 AI-powered insights and summaries", 
-            "🎯 Personalized recommendations",
-            "⚡ Significant time savings on email management"
-        ]
-        
-        for feature in features:
-            feature_label = ctk.CTkLabel(
-                features_frame,
-                text=feature,
-                font=ctk.CTkFont(size=12)
-            )
-            feature_label.pack(anchor="w", padx=20, pady=2)
+        # One multi-line label instead of a label per line
+        features_label = ctk.CTkLabel(
+            features_frame,
+            text="\n".join(self._FEATURES),
+            font=self._font_12,
+            justify="left"
+        )
+        features_label.pack(anchor="w", padx=20, pady=2)
             
         ctk.CTkLabel(features_frame, text="").pack(pady=5)  # Spacer
+        
+        return content
 
     def create_gemini_page(self):
         """Create the Gemini API setup page."""
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-            
         content = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=30, pady=30)
         
         # Page title
         title = ctk.CTkLabel(
             content, 
             text="Step 1: Gemini AI Setup 🧠",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._font_bold24
         )
         title.pack(pady=(0, 20))
         
         # Instructions
-        instructions_text = """
-The Gemini API powers all AI features in the application.
-Getting your API key is free and takes just 30 seconds!
-        """
-        
         instructions = ctk.CTkLabel(
             content, 
-            text=instructions_text,
-            font=ctk.CTkFont(size=14)
+            text=self._GEMINI_INSTRUCTIONS,
+            font=self._font_14
         )
         instructions.pack(pady=(0, 20))
         
@@ -196,34 +262,26 @@ Getting your API key is free and takes just 30 seconds!
         steps_title = ctk.CTkLabel(
             steps_frame,
             text="Quick Steps:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_bold16
         )
         steps_title.pack(pady=(15, 10))
         
-        steps = [
-            "1. Click 'Open Google AI Studio' below",
-            "2. Sign in with your Google account",  
-            "3. Click 'Create API key'",
-            "4. Copy the generated API key",
-            "5. Paste it in the field below"
-        ]
-        
-        for step in steps:
-            step_label = ctk.CTkLabel(
-                steps_frame,
-                text=step,
-                font=ctk.CTkFont(size=12)
-            )
-            step_label.pack(anchor="w", padx=20, pady=2)
+        steps_label = ctk.CTkLabel(
+            steps_frame,
+            text="\n".join(self._GEMINI_STEPS),
+            font=self._font_12,
+            justify="left"
+        )
+        steps_label.pack(anchor="w", padx=20, pady=2)
         
         # Open button
         open_button = ctk.CTkButton(
             steps_frame,
             text="🔗 Open Google AI Studio",
-            command=lambda: webbrowser.open("https://aistudio.google.com/app/apikey"),
+            command=lambda: self.open_url("https://aistudio.google.com/app/apikey"),
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_bold14
         )
         open_button.pack(pady=15)
         
@@ -234,14 +292,14 @@ Getting your API key is free and takes just 30 seconds!
         ctk.CTkLabel(
             input_frame, 
             text="Paste your Gemini API Key here:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_bold14
         ).pack(pady=(15, 5))
         
         self.gemini_key_entry = ctk.CTkEntry(
             input_frame, 
             width=500,
             height=40,
-            font=ctk.CTkFont(size=12),
+            font=self._font_12,
             show="*"
         )
         self.gemini_key_entry.pack(pady=(0, 15))
@@ -251,37 +309,29 @@ Getting your API key is free and takes just 30 seconds!
         ctk.CTkLabel(
             input_frame,
             text=help_text,
-            font=ctk.CTkFont(size=11),
+            font=self._font_11,
             text_color="gray"
         ).pack(pady=(0, 10))
+        
+        return content
 
     def create_google_oauth_page(self):
         """Create the Google OAuth setup page."""
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-            
         content = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=30, pady=30)
         
         # Page title
         title = ctk.CTkLabel(
             content, 
             text="Step 2: Google Workspace Setup 🔐",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._font_bold24
         )
         title.pack(pady=(0, 15))
         
         # Instructions
-        instructions_text = """
-Set up secure access to your Gmail and Calendar.
-This is a one-time setup that ensures your data stays private and secure.
-        """
-        
         instructions = ctk.CTkLabel(
             content, 
-            text=instructions_text,
-            font=ctk.CTkFont(size=14)
+            text=self._OAUTH_INSTRUCTIONS,
+            font=self._font_14
         )
         instructions.pack(pady=(0, 15))
         
@@ -293,27 +343,18 @@ This is a one-time setup that ensures your data stays private and secure.
         console_button = ctk.CTkButton(
             steps_frame,
             text="🔗 Open Google Cloud Console",
-            command=lambda: webbrowser.open("https://console.cloud.google.com/"),
+            command=lambda: self.open_url("https://console.cloud.google.com/"),
             width=250,
             height=35,
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=self._font_bold13
         )
         console_button.pack(pady=15)
         
         # Quick steps
-        quick_steps_text = """
-Quick Setup Steps:
-1. Create a new project (name it 'AI Email Manager')
-2. Enable Gmail API and Google Calendar API  
-3. Set up OAuth consent screen (External, use your email)
-4. Create OAuth 2.0 credentials (Desktop app)
-5. Copy Client ID and Client Secret below
-        """
-        
         steps_label = ctk.CTkLabel(
             steps_frame,
-            text=quick_steps_text,
-            font=ctk.CTkFont(size=11),
+            text=self._QUICK_STEPS,
+            font=self._font_11,
             justify="left"
         )
         steps_label.pack(pady=10)
@@ -336,7 +377,7 @@ Quick Setup Steps:
         ctk.CTkLabel(
             input_frame, 
             text="Google Client ID:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font_bold12
         ).pack(anchor="w", padx=20, pady=(15, 5))
         
         self.client_id_entry = ctk.CTkEntry(
@@ -350,7 +391,7 @@ Quick Setup Steps:
         ctk.CTkLabel(
             input_frame, 
             text="Google Client Secret:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font_bold12
         ).pack(anchor="w", padx=20, pady=(5, 5))
         
         self.client_secret_entry = ctk.CTkEntry(
@@ -360,36 +401,27 @@ Quick Setup Steps:
             show="*"
         )
         self.client_secret_entry.pack(padx=20, pady=(0, 15))
+        
+        return content
 
     def create_completion_page(self):
         """Create the completion page."""
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-            
         content = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=30, pady=30)
         
         # Success title
         title = ctk.CTkLabel(
             content, 
             text="🎉 Setup Complete!",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=self._font_bold28,
             text_color="green"
         )
         title.pack(pady=(0, 20))
         
         # Success message
-        success_text = """
-Congratulations! Your AI Email Manager is now configured and ready to use.
-
-Your credentials have been saved securely and the application will restart automatically.
-        """
-        
         success_label = ctk.CTkLabel(
             content, 
-            text=success_text,
-            font=ctk.CTkFont(size=16)
+            text=self._SUCCESS_TEXT,
+            font=self._font_16
         )
         success_label.pack(pady=20)
         
@@ -400,37 +432,32 @@ Your credentials have been saved securely and the application will restart autom
         next_title = ctk.CTkLabel(
             next_frame,
             text="What happens next:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_bold16
         )
         next_title.pack(pady=(15, 10))
         
-        next_steps = [
-            "✅ Application will restart with your settings",
-            "🔐 Click 'Authenticate' to connect to Google",
-            "📧 Click 'Refresh Emails' to load your inbox",
-            "🧠 Watch as AI intelligently organizes your emails!"
-        ]
-        
-        for step in next_steps:
-            step_label = ctk.CTkLabel(
-                next_frame,
-                text=step,
-                font=ctk.CTkFont(size=13)
-            )
-            step_label.pack(anchor="w", padx=20, pady=3)
+        next_steps_label = ctk.CTkLabel(
+            next_frame,
+            text="\n".join(self._NEXT_STEPS),
+            font=self._font_13,
+            justify="left"
+        )
+        next_steps_label.pack(anchor="w", padx=20, pady=3)
         
         # Finish button
-        finish_button = ctk.CTkButton(
+        self.finish_button = ctk.CTkButton(
             next_frame,
             text="🚀 Finish Setup & Start",
             command=self.finish_setup,
             width=250,
             height=50,
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_bold16
         )
-        finish_button.pack(pady=20)
+        self.finish_button.pack(pady=20)
         
         ctk.CTkLabel(next_frame, text="").pack(pady=5)  # Spacer
+        
+        return content
 
     def show_page(self, page_index):
         """Show the specified page."""
@@ -448,8 +475,10 @@ Your credentials have been saved securely and the application will restart autom
         else:
             self.next_button.configure(text="Next →", state="normal")
         
-        # Create page content
-        self.pages[page_index]()
+        # Swap the visible page
+        for page in self.pages:
+            page.pack_forget()
+        self.pages[page_index].pack(fill="both", expand=True, padx=30, pady=30)
 
     def previous_page(self):
         """Go to the previous page."""
@@ -497,6 +526,12 @@ Your credentials have been saved securely and the application will restart autom
         if result:
             self.destroy()
 
+    def open_url(self, url):
+        """Open a setup link in the default browser."""
+        # Only needed on click, so keep it off the wizard's import path
+        import webbrowser
+        webbrowser.open(url)
+
     def open_detailed_guide(self):
         """Open the detailed setup guide."""
         # Try to open the API setup guide
@@ -511,40 +546,59 @@ Your credentials have been saved securely and the application will restart autom
                 parent=self
             )
 
-    def save_settings(self):
-        """Save the entered settings to .env file."""
+    def save_settings(self, gemini_key, client_id, client_secret):
+        """Save the entered settings to .env file. Safe to call off the Tk thread."""
+        from dotenv import find_dotenv
+        
         env_path = find_dotenv()
         if not env_path:
             env_path = os.path.join(os.getcwd(), ".env")
 
         try:
-            # Get values
-            gemini_key = self.gemini_key_entry.get().strip()
-            client_id = self.client_id_entry.get().strip()
-            client_secret = self.client_secret_entry.get().strip()
-            
-            # Save to .env
-            set_key(env_path, "GEMINI_API_KEY", gemini_key)
-            set_key(env_path, "GOOGLE_CLIENT_ID", client_id)
-            set_key(env_path, "GOOGLE_CLIENT_SECRET", client_secret)
+            # Save to .env in one rewrite
+            _write_env_values(env_path, {
+                "GEMINI_API_KEY": gemini_key,
+                "GOOGLE_CLIENT_ID": client_id,
+                "GOOGLE_CLIENT_SECRET": client_secret
+            })
             
             return True
         except Exception as e:
-            messagebox.showerror(
+            error_message = str(e)
+            self.after(0, lambda: messagebox.showerror(
                 "Save Error", 
-                f"Failed to save settings: {str(e)}",
+                f"Failed to save settings: {error_message}",
                 parent=self
-            )
+            ))
             return False
 
     def finish_setup(self):
-        """Finish the setup and close the wizard."""
-        if self.save_settings():
-            messagebox.showinfo(
-                "Setup Complete!",
-                "Your settings have been saved. The application will now restart.",
-                parent=self
-            )
-            # Close the wizard and restart the app
-            self.master.destroy()  # Close main app
-            # The main script should handle restarting
+        """Save the settings on a worker thread, then close the wizard."""
+        # Read the entries on the Tk thread; only the file writes run in the background
+        values = (
+            self.gemini_key_entry.get().strip(),
+            self.client_id_entry.get().strip(),
+            self.client_secret_entry.get().strip()
+        )
+        self.finish_button.configure(state="disabled", text="Saving...")
+        
+        def save_thread():
+            if self.save_settings(*values):
+                self.after(0, self.complete_setup)
+            else:
+                self.after(0, lambda: self.finish_button.configure(
+                    state="normal", text="🚀 Finish Setup & Start"
+                ))
+        
+        threading.Thread(target=save_thread, daemon=True).start()
+
+    def complete_setup(self):
+        """Confirm the saved settings and close the wizard."""
+        messagebox.showinfo(
+            "Setup Complete!",
+            "Your settings have been saved. The application will now restart.",
+            parent=self
+        )
+        # Close the wizard and restart the app
+        self.master.destroy()  # Close main app
+        # The main script should handle restarting
@@ -4,17 +4,31 @@ Handles calendar operations, meeting scheduling, and event management.
 """
 
 import os
-from typing import List, Dict, Optional, Tuple
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Iterator, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta, timezone
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from googleapiclient.errors import HttpError
 from loguru import logger
 
 from ..auth.google_auth import get_auth_service
-from ..ai.gemini_service import GeminiEmailAI
 
+try:
+    # C parser for RFC 3339 timestamps, including the 'Z' suffix
+    from ciso8601 import parse_datetime as _parse_rfc3339
+except ImportError:
+    def _parse_rfc3339(value: str) -> datetime:
+        """Parse an RFC 3339 timestamp or date with the standard library."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
-@dataclass
+
+@dataclass(slots=True)
 class CalendarEvent:
     """Represents a calendar event."""
     id: str
@@ -30,7 +44,7 @@ class CalendarEvent:
     calendar_id: str = "primary"
 
 
-@dataclass
+@dataclass(slots=True)
 class MeetingRequest:
     """Represents a meeting request extracted from email."""
     title: str
@@ -43,6 +57,100 @@ class MeetingRequest:
     requires_response: bool = True
 
 
+# Seconds a calendar API result is reused before being fetched again
+CALENDAR_CACHE_TTL = 120
+
+# Maximum number of cached results per cache
+CALENDAR_CACHE_SIZE = 256
+
+# Largest page the events().list endpoint returns
+EVENT_PAGE_SIZE = 250
+
+# Days of upcoming events preloaded for local conflict checks
+EVENT_INDEX_DAYS = 30
+
+# Length in seconds of one cell of the busy-time grid used for slot searches
+GRID_SECONDS = 15 * 60
+
+# Partial response mask covering the event fields read by _parse_calendar_event
+EVENT_LIST_FIELDS = (
+    'nextPageToken,items(id,summary,description,location,status,start,end,'
+    'attendees/email,organizer/email,'
+    'conferenceData/entryPoints(entryPointType,uri))'
+)
+
+# Field mask for unexpanded listings, which also need the recurrence rules
+EVENT_RECURRENCE_FIELDS = EVENT_LIST_FIELDS.replace(
+    'status,', 'status,recurrence,recurringEventId,originalStartTime,', 1
+)
+
+# Field mask for incremental sync pages, which also carry the next sync token
+EVENT_SYNC_FIELDS = 'nextSyncToken,' + EVENT_LIST_FIELDS
+
+
+# Keys an event needs before it can be parsed
+_REQUIRED_EVENT_KEYS = ('start', 'end')
+
+# Stand-in for calendars missing from a freebusy response
+_NO_BUSY = {'busy': ()}
+_get_busy = itemgetter('busy')
+
+
+def _merge_intervals(intervals: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Merge (start, end) intervals into a sorted list of disjoint intervals."""
+    merged: List[Tuple[float, float]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _busy_mask(busy: List[Tuple[float, float]], base_ts: float, cell_count: int) -> int:
+    """
+    Build a bitset over a grid of GRID_SECONDS cells starting at base_ts.
+    
+    Bit i is set when any busy interval overlaps cell i, so a run of free
+    cells can be tested with a single shift-and-mask.
+    """
+    mask = 0
+    for start, end in busy:
+        first = max(0, int((start - base_ts) // GRID_SECONDS))
+        last = min(cell_count, -int(-(end - base_ts) // GRID_SECONDS))
+        if last > first:
+            mask |= ((1 << (last - first)) - 1) << first
+    return mask
+
+
+@lru_cache(maxsize=32)
+def _working_start_mask(first_weekday: int, days: int, start_hour: int,
+                        end_hour: int, duration_minutes: int) -> int:
+    """
+    Bitset of valid meeting start cells for a window of whole days.
+    
+    A bit is set at each on-the-hour weekday start within working hours whose
+    meeting still ends before end_hour. Results are cached per configuration,
+    so a changed configuration simply builds a new mask.
+    """
+    cells_per_day = 24 * 3600 // GRID_SECONDS
+    cells_per_hour = 3600 // GRID_SECONDS
+    
+    day_mask = 0
+    for hour in range(start_hour, end_hour):
+        # Don't suggest times that go past working hours
+        if ((hour * 60 + duration_minutes) // 60) % 24 < end_hour:
+            day_mask |= 1 << (hour * cells_per_hour)
+    
+    mask = 0
+    for day in range(days):
+        # Skip weekends
+        if (first_weekday + day) % 7 < 5:
+            mask |= day_mask << (day * cells_per_day)
+    return mask
+
+
 class CalendarService:
     """Handles Google Calendar operations and meeting management."""
     
@@ -50,6 +158,180 @@ class CalendarService:
         """Initialize the Calendar service."""
         self.auth_service = get_auth_service()
         self._calendar_service = None
+        self._ai_service = None
+        self._user_email: Optional[str] = None
+        
+        # (fetched_at, result) keyed by query parameters
+        self._availability_cache: Dict[Tuple, Tuple[float, Dict[str, bool]]] = {}
+        self._events_cache: Dict[Tuple, Tuple[float, List[CalendarEvent]]] = {}
+        
+        # Upcoming events sorted by start, for local conflict queries
+        self._index_starts: Optional[List[float]] = None
+        self._index_events: List[CalendarEvent] = []
+        self._index_window: Tuple[float, float] = (0.0, 0.0)
+        self._index_max_duration = 0.0
+        self._index_loaded_at = 0.0
+        
+        # Events kept current through incremental sync (syncToken) for the index
+        self._sync_token: Optional[str] = None
+        self._synced_events: Dict[str, CalendarEvent] = {}
+        self._synced_until = 0.0
+        
+        # Per-thread HTTP connections for concurrent requests (httplib2 is not thread-safe)
+        self._thread_local = threading.local()
+        
+    def _cache_get(self, cache: Dict, key: Tuple):
+        """Return a cached result if it is younger than the TTL, else None."""
+        entry = cache.get(key)
+        if entry and time.monotonic() - entry[0] < CALENDAR_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def _cache_put(self, cache: Dict, key: Tuple, value):
+        """Store a result, evicting the oldest entry when the cache is full."""
+        cache.pop(key, None)
+        if len(cache) >= CALENDAR_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = (time.monotonic(), value)
+    
+    def invalidate_cache(self):
+        """Drop cached events and availability after the calendar changes."""
+        self._availability_cache.clear()
+        self._events_cache.clear()
+        self.invalidate_index()
+    
+    def invalidate_index(self):
+        """Force the local event index to be reloaded on its next use."""
+        self._index_starts = None
+    
+    def _sync_events(self, time_min: datetime):
+        """
+        Bring the synced event set up to date.
+        
+        Uses the stored sync token to fetch only changes since the last sync.
+        A full sync of the next 2 * EVENT_INDEX_DAYS days runs on first use,
+        when the token has expired (HTTP 410) or when the index window has
+        moved past the synced range. API errors propagate to the caller.
+        """
+        events_api = self.get_calendar_service().events()
+        
+        if self._sync_token and (time_min + timedelta(days=EVENT_INDEX_DAYS)).timestamp() <= self._synced_until:
+            try:
+                self._apply_event_pages(events_api, events_api.list(
+                    calendarId='primary',
+                    syncToken=self._sync_token,
+                    singleEvents=True,
+                    maxResults=EVENT_PAGE_SIZE,
+                    fields=EVENT_SYNC_FIELDS
+                ))
+                return
+            except HttpError as e:
+                if e.resp.status != 410:
+                    raise
+                logger.info("Calendar sync token expired, running a full sync")
+        
+        # Full sync
+        self._sync_token = None
+        self._synced_events = {}
+        synced_until = time_min + timedelta(days=2 * EVENT_INDEX_DAYS)
+        self._apply_event_pages(events_api, events_api.list(
+            calendarId='primary',
+            timeMin=time_min.isoformat(),
+            timeMax=synced_until.isoformat(),
+            singleEvents=True,
+            maxResults=EVENT_PAGE_SIZE,
+            fields=EVENT_SYNC_FIELDS
+        ))
+        self._synced_until = synced_until.timestamp()
+    
+    def _apply_event_pages(self, events_api, request):
+        """Merge every page of an events().list request into the synced events."""
+        while request is not None:
+            response = request.execute()
+            for event in response.get('items', []):
+                if event.get('status') == 'cancelled':
+                    self._synced_events.pop(event.get('id'), None)
+                    continue
+                calendar_event = self._safe_parse(event)
+                if calendar_event is not None:
+                    self._synced_events[calendar_event.id] = calendar_event
+            
+            # Only the last page carries the token for the next sync
+            if response.get('nextSyncToken'):
+                self._sync_token = response['nextSyncToken']
+            request = events_api.list_next(request, response)
+    
+    def _load_event_index(self) -> bool:
+        """Refresh the local index of upcoming events from the synced event set."""
+        try:
+            now = datetime.now(timezone.utc)
+            time_max = now + timedelta(days=EVENT_INDEX_DAYS)
+            self._sync_events(now)
+            
+            now_ts, time_max_ts = now.timestamp(), time_max.timestamp()
+            events = sorted(
+                (event for event in self._synced_events.values()
+                 if event.end_time.timestamp() > now_ts and event.start_time.timestamp() < time_max_ts),
+                key=lambda event: event.start_time.timestamp()
+            )
+            starts = [event.start_time.timestamp() for event in events]
+            max_duration = max(
+                (event.end_time.timestamp() - start for event, start in zip(events, starts)),
+                default=0.0
+            )
+            
+            self._index_starts = starts
+            self._index_events = events
+            self._index_window = (now.timestamp(), time_max.timestamp())
+            self._index_max_duration = max_duration
+            self._index_loaded_at = time.monotonic()
+            logger.info(f"Indexed {len(events)} upcoming events for conflict checks")
+            return True
+            
+        except HttpError as e:
+            logger.error(f"Calendar API error loading event index: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Error loading event index: {e}")
+            return False
+    
+    def conflicts_local(self, start_time: datetime, end_time: datetime) -> List[CalendarEvent]:
+        """
+        Get events overlapping a time range from the preloaded event index.
+        
+        Ranges outside the indexed window fall back to get_calendar_conflicts.
+        
+        Args:
+            start_time: Start of time range to check
+            end_time: End of time range to check
+            
+        Returns:
+            List of conflicting CalendarEvent objects
+        """
+        if (self._index_starts is None or
+                time.monotonic() - self._index_loaded_at >= CALENDAR_CACHE_TTL):
+            if not self._load_event_index():
+                return self.get_calendar_conflicts(start_time, end_time)
+        
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp()
+        window_start, window_end = self._index_window
+        if start_ts < window_start or end_ts > window_end:
+            return self.get_calendar_conflicts(start_time, end_time)
+        
+        # Events starting before the range ends; walk back until no earlier
+        # event can still be running at the range start
+        conflicts = []
+        earliest_start = start_ts - self._index_max_duration
+        index = bisect_left(self._index_starts, end_ts) - 1
+        while index >= 0 and self._index_starts[index] >= earliest_start:
+            event = self._index_events[index]
+            if event.end_time.timestamp() > start_ts:
+                conflicts.append(event)
+            index -= 1
+        
+        conflicts.reverse()
+        return conflicts
         
     def get_calendar_service(self):
         """Get authenticated Calendar API service."""
@@ -61,48 +343,46 @@ class CalendarService:
         
         return self._calendar_service
     
-    def get_upcoming_events(self, days_ahead: int = 7, max_results: int = 50) -> List[CalendarEvent]:
+    @property
+    def user_email(self) -> Optional[str]:
+        """Email address of the authenticated user, looked up once."""
+        if self._user_email is None:
+            self._user_email = self.auth_service.get_user_info().get('email')
+        return self._user_email
+    
+    def get_upcoming_events(self, days_ahead: int = 7, max_results: int = 50,
+                            expand_recurrence: bool = True) -> List[CalendarEvent]:
         """
         Get upcoming calendar events.
         
         Args:
             days_ahead: Number of days to look ahead
             max_results: Maximum number of events to return
+            expand_recurrence: Let the server expand recurring events; when
+                False they are expanded locally within the window only
             
         Returns:
             List of CalendarEvent objects
         """
+        cache_key = (days_ahead, max_results, expand_recurrence)
+        cached = self._cache_get(self._events_cache, cache_key)
+        if cached is not None:
+            return list(cached)
+        
         try:
-            service = self.get_calendar_service()
-            
-            # Calculate time range
-            now = datetime.now(timezone.utc)
-            time_max = now + timedelta(days=days_ahead)
-            
-            # Fetch events
-            events_result = service.events().list(
-                calendarId='primary',
-                timeMin=now.isoformat(),
-                timeMax=time_max.isoformat(),
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
-            
-            # Convert to CalendarEvent objects
-            calendar_events = []
-            for event in events:
-                try:
-                    calendar_event = self._parse_calendar_event(event)
-                    calendar_events.append(calendar_event)
-                except Exception as e:
-                    logger.warning(f"Failed to parse calendar event: {e}")
-                    continue
+            # Stop paging as soon as max_results events have been parsed
+            calendar_events = list(islice(
+                self.iter_upcoming_events(
+                    days_ahead,
+                    page_size=min(max_results, EVENT_PAGE_SIZE),
+                    expand_recurrence=expand_recurrence
+                ),
+                max_results
+            ))
             
             logger.info(f"Retrieved {len(calendar_events)} upcoming events")
-            return calendar_events
+            self._cache_put(self._events_cache, cache_key, calendar_events)
+            return list(calendar_events)
             
         except HttpError as e:
             logger.error(f"Calendar API error: {e}")
@@ -111,6 +391,54 @@ class CalendarService:
             logger.error(f"Error fetching calendar events: {e}")
             return []
     
+    def iter_upcoming_events(self, days_ahead: int = 7, page_size: int = EVENT_PAGE_SIZE,
+                             time_min: Optional[datetime] = None,
+                             expand_recurrence: bool = True) -> Iterator[CalendarEvent]:
+        """
+        Yield upcoming calendar events page by page, in start time order.
+        
+        The next page is only requested once the previous one has been consumed,
+        so callers can stop early. API errors propagate to the caller.
+        
+        Args:
+            days_ahead: Number of days to look ahead
+            page_size: Events requested per page (at most 250)
+            time_min: Start of the window, defaults to now
+            expand_recurrence: Let the server expand recurring events; when
+                False the window is fetched unexpanded and expanded locally
+            
+        Yields:
+            CalendarEvent objects
+        """
+        service = self.get_calendar_service()
+        
+        # Calculate time range
+        time_min = time_min or datetime.now(timezone.utc)
+        time_max = time_min + timedelta(days=days_ahead)
+        
+        if not expand_recurrence:
+            yield from self._list_unexpanded_events(time_min, time_max)
+            return
+        
+        events_api = service.events()
+        request = events_api.list(
+            calendarId='primary',
+            timeMin=time_min.isoformat(),
+            timeMax=time_max.isoformat(),
+            maxResults=min(page_size, EVENT_PAGE_SIZE),
+            singleEvents=True,
+            orderBy='startTime',
+            showDeleted=False,
+            fields=EVENT_LIST_FIELDS
+        )
+        while request is not None:
+            response = request.execute()
+            for event in response.get('items', []):
+                calendar_event = self._safe_parse(event)
+                if calendar_event is not None:
+                    yield calendar_event
+            request = events_api.list_next(request, response)
+    
     def check_availability(self, start_time: datetime, end_time: datetime, 
                           attendees: List[str] = None) -> Dict[str, bool]:
         """
@@ -124,32 +452,36 @@ class CalendarService:
         Returns:
             Dictionary mapping email addresses to availability (True = available)
         """
+        attendees = attendees or []
+        cache_key = (
+            start_time.isoformat(timespec='minutes'),
+            end_time.isoformat(timespec='minutes'),
+            tuple(sorted(attendees))
+        )
+        cached = self._cache_get(self._availability_cache, cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
             service = self.get_calendar_service()
             
             # Prepare request body
-            attendees = attendees or []
             request_body = {
                 'timeMin': start_time.isoformat(),
                 'timeMax': end_time.isoformat(),
+                'timeZone': 'UTC',
                 'items': [{'id': email} for email in attendees + ['primary']]
             }
             
             # Query free/busy information
-            freebusy = service.freebusy().query(body=request_body).execute()
-            
-            availability = {}
-            for email in attendees:
-                busy_times = freebusy['calendars'].get(email, {}).get('busy', [])
-                is_available = len(busy_times) == 0
-                availability[email] = is_available
-            
-            # Check user's own availability
-            primary_busy = freebusy['calendars'].get('primary', {}).get('busy', [])
-            availability['primary'] = len(primary_busy) == 0
+            freebusy = service.freebusy().query(body=request_body).execute(
+                http=getattr(self._thread_local, 'http', None)
+            )
+            availability = self._availability_from_freebusy(freebusy, attendees)
             
             logger.info(f"Availability check completed for {len(attendees)} attendees")
-            return availability
+            self._cache_put(self._availability_cache, cache_key, availability)
+            return dict(availability)
             
         except HttpError as e:
             logger.error(f"Calendar API error during availability check: {e}")
@@ -158,6 +490,193 @@ class CalendarService:
             logger.error(f"Error checking availability: {e}")
             return {}
     
+    def check_availability_many(self, slots: List[Tuple[datetime, datetime]],
+                                attendees: List[str] = None,
+                                max_workers: int = 4) -> List[Dict[str, bool]]:
+        """
+        Check availability for several time slots concurrently.
+        
+        Args:
+            slots: List of (start_time, end_time) tuples
+            attendees: List of attendee emails to check
+            max_workers: Number of requests in flight at once
+            
+        Returns:
+            Availability dictionaries in the same order as slots
+        """
+        if not slots:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max_workers, initializer=self._init_worker_http) as executor:
+            return list(executor.map(
+                lambda slot: self.check_availability(slot[0], slot[1], attendees), slots
+            ))
+    
+    def _init_worker_http(self):
+        """Give a worker thread its own authorized HTTP connection."""
+        try:
+            import httplib2
+            import google_auth_httplib2
+        except ImportError:
+            logger.warning("google-auth-httplib2 not available, sharing the default connection")
+            return
+        
+        self._thread_local.http = google_auth_httplib2.AuthorizedHttp(
+            self.auth_service.credentials, http=httplib2.Http()
+        )
+    
+    def batch_check_availability(self, slots: List[Tuple[datetime, datetime]],
+                                 attendees: List[str] = None) -> List[Dict[str, bool]]:
+        """
+        Check availability for several time slots in one batched HTTP request.
+        
+        Args:
+            slots: List of (start_time, end_time) tuples
+            attendees: List of attendee emails to check
+            
+        Returns:
+            Availability dictionaries in the same order as slots; a slot whose
+            sub-request failed gets an empty dictionary
+        """
+        if not slots:
+            return []
+        
+        try:
+            service = self.get_calendar_service()
+            attendees = attendees or []
+            results: Dict[str, Dict[str, bool]] = {}
+            
+            def on_response(request_id, response, exception):
+                if exception is not None:
+                    logger.error(f"Calendar API error during availability check: {exception}")
+                    return
+                results[request_id] = self._availability_from_freebusy(response, attendees)
+            
+            # Google's batch endpoint accepts up to 50 sub-requests per call
+            for chunk_start in range(0, len(slots), 50):
+                batch = service.new_batch_http_request(callback=on_response)
+                for index in range(chunk_start, min(chunk_start + 50, len(slots))):
+                    start_time, end_time = slots[index]
+                    batch.add(service.freebusy().query(body={
+                        'timeMin': start_time.isoformat(),
+                        'timeMax': end_time.isoformat(),
+                        'timeZone': 'UTC',
+                        'items': [{'id': email} for email in attendees + ['primary']]
+                    }), request_id=str(index))
+                batch.execute()
+            
+            logger.info(f"Batched availability check completed for {len(slots)} slots")
+            return [results.get(str(index), {}) for index in range(len(slots))]
+            
+        except HttpError as e:
+            logger.error(f"Calendar API error during batched availability check: {e}")
+            return [{} for _ in slots]
+        except Exception as e:
+            logger.error(f"Error checking availability in batch: {e}")
+            return [{} for _ in slots]
+    
+    def _availability_from_freebusy(self, freebusy: Dict, attendees: List[str]) -> Dict[str, bool]:
+        """Map a freebusy response to attendee availability (True = available)."""
+        calendars = freebusy['calendars']
+        availability = {email: not _get_busy(calendars.get(email, _NO_BUSY)) for email in attendees}
+        
+        # Check user's own availability
+        availability['primary'] = not _get_busy(calendars.get('primary', _NO_BUSY))
+        return availability
+    
+    def get_busy_intervals(self, start_time: datetime, end_time: datetime,
+                           attendees: List[str] = None) -> Optional[List[Tuple[float, float]]]:
+        """
+        Get the combined busy time of the user and attendees with one freebusy query.
+        
+        Args:
+            start_time: Start of the window (timezone-aware)
+            end_time: End of the window (timezone-aware)
+            attendees: List of attendee emails
+            
+        Returns:
+            Sorted, disjoint (start, end) POSIX timestamps, or None on error
+        """
+        busy_by_calendar = self.get_busy_by_calendar(start_time, end_time, attendees)
+        if busy_by_calendar is None:
+            return None
+        
+        return _merge_intervals([
+            interval
+            for intervals in busy_by_calendar.values()
+            for interval in intervals
+        ])
+    
+    def get_busy_by_calendar(self, start_time: datetime, end_time: datetime,
+                             attendees: List[str] = None) -> Optional[Dict[str, List[Tuple[float, float]]]]:
+        """
+        Get the busy time of the user and each attendee with one freebusy query.
+        
+        Args:
+            start_time: Start of the window (timezone-aware)
+            end_time: End of the window (timezone-aware)
+            attendees: List of attendee emails
+            
+        Returns:
+            Dictionary mapping each calendar ('primary' for the user) to sorted,
+            disjoint (start, end) POSIX timestamps, or None on error
+        """
+        try:
+            service = self.get_calendar_service()
+            
+            attendees = attendees or []
+            request_body = {
+                'timeMin': start_time.isoformat(),
+                'timeMax': end_time.isoformat(),
+                'timeZone': 'UTC',
+                'items': [{'id': email} for email in attendees + ['primary']]
+            }
+            freebusy = service.freebusy().query(body=request_body).execute(
+                http=getattr(self._thread_local, 'http', None)
+            )
+            
+            busy_by_calendar = {}
+            for calendar_id, calendar in freebusy.get('calendars', {}).items():
+                busy_by_calendar[calendar_id] = _merge_intervals([
+                    (_parse_rfc3339(busy['start']).timestamp(),
+                     _parse_rfc3339(busy['end']).timestamp())
+                    for busy in calendar.get('busy', [])
+                ])
+            
+            return busy_by_calendar
+            
+        except HttpError as e:
+            logger.error(f"Calendar API error fetching busy times: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error fetching busy times: {e}")
+            return None
+    
+    def get_busy_and_conflicts(self, start_time: datetime, end_time: datetime,
+                               attendees: List[str] = None) -> Tuple[Dict[str, List[Tuple[float, float]]], List[CalendarEvent]]:
+        """
+        Fetch per-calendar busy time and the user's events for a window concurrently.
+        
+        The freebusy query runs on a worker thread with its own connection
+        while the events are listed on the calling thread.
+        
+        Args:
+            start_time: Start of the window (timezone-aware)
+            end_time: End of the window (timezone-aware)
+            attendees: List of attendee emails; busy time is skipped when empty
+            
+        Returns:
+            Tuple of (get_busy_by_calendar result or empty dict on error,
+            get_calendar_conflicts result)
+        """
+        if not attendees:
+            return {}, self.get_calendar_conflicts(start_time, end_time)
+        
+        with ThreadPoolExecutor(max_workers=1, initializer=self._init_worker_http) as executor:
+            busy_future = executor.submit(self.get_busy_by_calendar, start_time, end_time, attendees)
+            events = self.get_calendar_conflicts(start_time, end_time)
+            return busy_future.result() or {}, events
+    
     def suggest_meeting_times(self, duration_minutes: int = 60, 
                             days_ahead: int = 14,
                             attendees: List[str] = None) -> List[datetime]:
@@ -179,38 +698,48 @@ class CalendarService:
             # Working hours (9 AM to 5 PM)
             start_hour, end_hour = 9, 17
             
-            # Check each day
+            # Check each day, as local wall-clock midnights
             base_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            days = [base_date + timedelta(days=day_offset) for day_offset in range(1, days_ahead + 1)]
+            if not days:
+                return []
             
-            for day_offset in range(1, days_ahead + 1):
-                current_date = base_date + timedelta(days=day_offset)
-                
-                # Skip weekends
-                if current_date.weekday() >= 5:
-                    continue
-                
-                # Check each hour slot
-                for hour in range(start_hour, end_hour):
-                    start_time = current_date.replace(hour=hour)
-                    end_time = start_time + timedelta(minutes=duration_minutes)
-                    
-                    # Don't suggest times that go past working hours
-                    if end_time.hour >= end_hour:
-                        continue
-                    
-                    # Check availability
-                    availability = self.check_availability(start_time, end_time, attendees)
-                    
-                    # If everyone is available, add to suggestions
-                    if all(availability.values()):
-                        suggestions.append(start_time)
-                        
-                        # Limit suggestions
-                        if len(suggestions) >= 5:
-                            break
-                
-                if len(suggestions) >= 5:
-                    break
+            # Fetch busy time for the whole window once, then test slots locally
+            busy = self.get_busy_intervals(
+                days[0].astimezone(),
+                (days[-1] + timedelta(days=1)).astimezone(),
+                attendees
+            )
+            if busy is None:
+                return []
+            
+            # Busy time as a bitset of 15-minute cells, one day of cells per day.
+            # Each day's cells are anchored at its working-hours start using that
+            # date's own UTC offset, so a DST change in the window does not shift
+            # later days off local working hours
+            cells_per_day = 24 * 3600 // GRID_SECONDS
+            busy_cells = 0
+            for day_index, day in enumerate(days):
+                day_base = day.replace(hour=start_hour).timestamp() - start_hour * 3600
+                busy_cells |= _busy_mask(busy, day_base, cells_per_day) << (day_index * cells_per_day)
+            
+            # A start cell is blocked if any cell the meeting would cover is busy
+            blocked_starts = busy_cells
+            for offset in range(1, -(-duration_minutes * 60 // GRID_SECONDS)):
+                blocked_starts |= busy_cells >> offset
+            
+            # Valid working-hour starts that everyone is free for, lowest first
+            candidates = _working_start_mask(
+                days[0].weekday(), days_ahead, start_hour, end_hour, duration_minutes
+            ) & ~blocked_starts
+            
+            # Datetimes are only built for the slots that are suggested, from the
+            # wall-clock time so each carries its own date's UTC offset
+            while candidates and len(suggestions) < 5:
+                lowest = candidates & -candidates
+                day_index, day_cell = divmod(lowest.bit_length() - 1, cells_per_day)
+                suggestions.append((days[day_index] + timedelta(seconds=day_cell * GRID_SECONDS)).astimezone())
+                candidates ^= lowest
             
             logger.info(f"Generated {len(suggestions)} meeting time suggestions")
             return suggestions
@@ -301,6 +830,7 @@ class CalendarService:
                 ).execute()
                 
                 event_id = event.get('id')
+                self.invalidate_cache()
                 logger.info(f"Created calendar event: {event_id} ({title})")
                 return event_id
                 
@@ -339,7 +869,7 @@ class CalendarService:
             
             # Update attendee response
             attendees = event.get('attendees', [])
-            user_email = self.auth_service.get_user_info().get('email')
+            user_email = self.user_email
             
             for attendee in attendees:
                 if attendee.get('email') == user_email:
@@ -354,6 +884,7 @@ class CalendarService:
                 sendUpdates='all'
             ).execute()
             
+            self.invalidate_cache()
             logger.info(f"Responded to meeting {event_id} with: {response}")
             return True
             
@@ -375,9 +906,11 @@ class CalendarService:
             MeetingRequest object if meeting details found, None otherwise
         """
         try:
-            # Use AI to extract meeting details
-            ai_service = GeminiEmailAI()
-            meeting_details = ai_service.extract_meeting_details(email_data)
+            # Use AI to extract meeting details; the Gemini SDK is only loaded when needed
+            if self._ai_service is None:
+                from ..ai.gemini_service import GeminiEmailAI
+                self._ai_service = GeminiEmailAI()
+            meeting_details = self._ai_service.extract_meeting_details(email_data)
             
             if meeting_details.get('error') or not meeting_details.get('is_meeting_request'):
                 return None
@@ -399,8 +932,11 @@ class CalendarService:
                 try:
                     date_str = meeting_details['date']
                     time_str = meeting_details['time']
-                    # Simple parsing - could be enhanced
-                    meeting_time = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+                    # ISO parse first; strptime still accepts unpadded hours like "9:30"
+                    try:
+                        meeting_time = _parse_rfc3339(f"{date_str}T{time_str}")
+                    except ValueError:
+                        meeting_time = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
                     meeting_request.proposed_times = [meeting_time]
                 except ValueError:
                     logger.warning("Failed to parse meeting date/time")
@@ -412,13 +948,16 @@ class CalendarService:
             logger.error(f"Error extracting meeting from email: {e}")
             return None
     
-    def get_calendar_conflicts(self, start_time: datetime, end_time: datetime) -> List[CalendarEvent]:
+    def get_calendar_conflicts(self, start_time: datetime, end_time: datetime,
+                               expand_recurrence: bool = True) -> List[CalendarEvent]:
         """
         Get calendar events that conflict with the specified time range.
         
         Args:
             start_time: Start of time range to check
             end_time: End of time range to check
+            expand_recurrence: Let the server expand recurring events; when
+                False they are expanded locally within the range only
             
         Returns:
             List of conflicting CalendarEvent objects
@@ -428,27 +967,25 @@ class CalendarService:
             return []
             
         try:
+            if not expand_recurrence:
+                conflicts = self._list_unexpanded_events(start_time, end_time)
+                logger.info(f"Found {len(conflicts)} calendar conflicts")
+                return conflicts
+            
             service = self.get_calendar_service()
             
-            # Get upcoming events
+            # Get events overlapping the range
             events_result = service.events().list(
                 calendarId='primary',
-                timeMin=now.isoformat(),
-                timeMax=time_max.isoformat(),
+                timeMin=start_time.isoformat(),
+                timeMax=end_time.isoformat(),
                 singleEvents=True,
-                orderBy='startTime'
+                orderBy='startTime',
+                fields=EVENT_LIST_FIELDS
             ).execute()
             
             events = events_result.get('items', [])
-            conflicts = []
-            
-            for event in events:
-                try:
-                    calendar_event = self._parse_calendar_event(event)
-                    conflicts.append(calendar_event)
-                except Exception as e:
-                    logger.warning(f"Failed to parse conflicting event: {e}")
-                    continue
+            conflicts = [ce for ce in map(self._safe_parse, events) if ce is not None]
             
             logger.info(f"Found {len(conflicts)} calendar conflicts")
             return conflicts
@@ -457,23 +994,112 @@ class CalendarService:
             logger.error(f"Error checking calendar conflicts: {e}")
             return []
     
+    def _list_unexpanded_events(self, time_min: datetime, time_max: datetime) -> List[CalendarEvent]:
+        """
+        Fetch events without server-side instance expansion and expand
+        recurring events locally, only within [time_min, time_max).
+        
+        Returns:
+            Events overlapping the window, sorted by start time
+        """
+        events_api = self.get_calendar_service().events()
+        request = events_api.list(
+            calendarId='primary',
+            timeMin=time_min.isoformat(),
+            timeMax=time_max.isoformat(),
+            maxResults=EVENT_PAGE_SIZE,
+            singleEvents=False,
+            # Needed so cancelled instances of recurring events are reported
+            showDeleted=True,
+            fields=EVENT_RECURRENCE_FIELDS
+        )
+        
+        items = []
+        while request is not None:
+            response = request.execute()
+            items.extend(response.get('items', []))
+            request = events_api.list_next(request, response)
+        
+        # Instances that were moved or cancelled come back as separate exception items
+        overridden: Dict[str, set] = {}
+        for item in items:
+            original = item.get('originalStartTime')
+            if item.get('recurringEventId') and original:
+                original_start = _parse_rfc3339(original.get('dateTime') or original['date'])
+                overridden.setdefault(item['recurringEventId'], set()).add(original_start.timestamp())
+        
+        window_start, window_end = time_min.timestamp(), time_max.timestamp()
+        events: List[CalendarEvent] = []
+        for item in items:
+            if item.get('status') == 'cancelled':
+                continue
+            calendar_event = self._safe_parse(item)
+            if calendar_event is None:
+                continue
+            
+            if item.get('recurrence'):
+                events.extend(self._expand_recurrence(
+                    calendar_event, item['recurrence'], time_min, time_max,
+                    overridden.get(calendar_event.id, set())
+                ))
+            elif (calendar_event.end_time.timestamp() > window_start and
+                    calendar_event.start_time.timestamp() < window_end):
+                events.append(calendar_event)
+        
+        events.sort(key=lambda event: event.start_time.timestamp())
+        return events
+    
+    def _expand_recurrence(self, event: CalendarEvent, recurrence: List[str],
+                           time_min: datetime, time_max: datetime,
+                           skip_starts: set) -> List[CalendarEvent]:
+        """Expand a recurring event into its instances overlapping the window."""
+        from dateutil.rrule import rrulestr
+        
+        duration = event.end_time - event.start_time
+        # All-day events have naive dates; compare them in local time
+        if event.start_time.tzinfo is None:
+            time_min = time_min.astimezone().replace(tzinfo=None)
+            time_max = time_max.astimezone().replace(tzinfo=None)
+        
+        try:
+            rule_set = rrulestr("\n".join(recurrence), dtstart=event.start_time, forceset=True)
+            starts = rule_set.between(time_min - duration, time_max, inc=False)
+        except Exception as e:
+            logger.warning(f"Failed to expand recurring event {event.id}: {e}")
+            return [event] if event.start_time < time_max and event.end_time > time_min else []
+        
+        instances = []
+        for start in starts:
+            if start.timestamp() in skip_starts:
+                continue
+            instance_id = start.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ') \
+                if start.tzinfo else start.strftime('%Y%m%d')
+            instances.append(replace(
+                event, id=f"{event.id}_{instance_id}",
+                start_time=start, end_time=start + duration
+            ))
+        return instances
+    
+    def _safe_parse(self, event_data: Dict) -> Optional[CalendarEvent]:
+        """Parse an event, returning None (and logging) if required fields are missing."""
+        # Validate up front rather than using exceptions for flow control;
+        # unexpected parse errors are handled at the API call boundary
+        for key in _REQUIRED_EVENT_KEYS:
+            value = event_data.get(key)
+            if not value or not (value.get('dateTime') or value.get('date')):
+                logger.warning(f"Skipping calendar event {event_data.get('id', '')} without {key} time")
+                return None
+        return self._parse_calendar_event(event_data)
+    
     def _parse_calendar_event(self, event_data: Dict) -> CalendarEvent:
         """Parse Google Calendar event data into CalendarEvent object."""
         # Parse start/end times
         start = event_data.get('start', {})
         end = event_data.get('end', {})
         
-        if 'dateTime' in start:
-            start_time = datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00'))
-        else:
-            # All-day event
-            start_time = datetime.fromisoformat(start['date'])
-        
-        if 'dateTime' in end:
-            end_time = datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00'))
-        else:
-            # All-day event
-            end_time = datetime.fromisoformat(end['date'])
+        # All-day events only carry a date
+        start_time = _parse_rfc3339(start.get('dateTime') or start['date'])
+        end_time = _parse_rfc3339(end.get('dateTime') or end['date'])
         
         # Parse attendees
         attendees = []
@@ -505,10 +1131,14 @@ class CalendarService:
 
 # Global calendar service instance
 _calendar_service = None
+_calendar_service_lock = threading.Lock()
 
 def get_calendar_service() -> CalendarService:
     """Get the global calendar service instance."""
     global _calendar_service
     if _calendar_service is None:
-        _calendar_service = CalendarService()
+        with _calendar_service_lock:
+            # Re-check: another thread may have created it while we waited
+            if _calendar_service is None:
+                _calendar_service = CalendarService()
     return _calendar_service
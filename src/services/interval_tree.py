@@ -0,0 +1,136 @@
+"""
+Interval tree for calendar scheduling.
+Answers "which intervals overlap this range" in O(log n + k) time.
+"""
+
+from typing import Any, List, Optional
+
+
+class _Node:
+    """AVL tree node keyed by interval start, tracking the largest end below it."""
+
+    __slots__ = ('lo', 'hi', 'value', 'max_hi', 'height', 'left', 'right')
+
+    def __init__(self, lo: float, hi: float, value: Any):
+        self.lo = lo
+        self.hi = hi
+        self.value = value
+        self.max_hi = hi
+        self.height = 1
+        self.left: Optional['_Node'] = None
+        self.right: Optional['_Node'] = None
+
+
+def _height(node: Optional[_Node]) -> int:
+    return node.height if node else 0
+
+
+def _update(node: _Node):
+    """Recompute a node's height and max_hi from its children."""
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.max_hi = node.hi
+    if node.left and node.left.max_hi > node.max_hi:
+        node.max_hi = node.left.max_hi
+    if node.right and node.right.max_hi > node.max_hi:
+        node.max_hi = node.right.max_hi
+
+
+def _rotate_right(node: _Node) -> _Node:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: _Node) -> _Node:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node: _Node) -> _Node:
+    """Restore the AVL height invariant at node after an insert below it."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+
+    return node
+
+
+class IntervalTree:
+    """Augmented AVL tree of half-open [lo, hi) intervals with attached values."""
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self._root: Optional[_Node] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, lo: float, hi: float, value: Any = None):
+        """
+        Add an interval to the tree.
+
+        Args:
+            lo: Interval start
+            hi: Interval end
+            value: Object returned by queries that overlap the interval
+        """
+        self._root = self._insert(self._root, _Node(lo, hi, value))
+        self._size += 1
+
+    def _insert(self, node: Optional[_Node], new: _Node) -> _Node:
+        if node is None:
+            return new
+        if new.lo < node.lo:
+            node.left = self._insert(node.left, new)
+        else:
+            node.right = self._insert(node.right, new)
+        return _rebalance(node)
+
+    def query(self, lo: float, hi: float) -> List[Any]:
+        """
+        Get the values of intervals overlapping [lo, hi), in start order.
+
+        Intervals that only touch the range at an endpoint do not overlap it.
+
+        Args:
+            lo: Range start
+            hi: Range end
+
+        Returns:
+            List of values for overlapping intervals
+        """
+        found: List[Any] = []
+        self._query(self._root, lo, hi, found)
+        return found
+
+    def _query(self, node: Optional[_Node], lo: float, hi: float, found: List[Any]):
+        # No interval in this subtree ends after the range starts
+        if node is None or node.max_hi <= lo:
+            return
+
+        self._query(node.left, lo, hi, found)
+
+        # Everything to the right starts at or after this node
+        if node.lo >= hi:
+            return
+        if node.hi > lo:
+            found.append(node.value)
+
+        self._query(node.right, lo, hi, found)
@@ -6,14 +6,120 @@ Handles intelligent scheduling, conflict detection, and optimal time slot sugges
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from functools import cache
+from bisect import bisect_left, bisect_right
+import heapq
 import itertools
 from loguru import logger
 
-from .calendar_service import CalendarService, CalendarEvent, MeetingRequest
+from .calendar_service import CalendarService, CalendarEvent, MeetingRequest, _merge_intervals
+from .interval_tree import IntervalTree
 from ..ai.gemini_service import GeminiEmailAI
 
 
-@dataclass
+# Calendar context around a slot considered when scoring buffer time
+BUFFER_WINDOW = timedelta(hours=2)
+
+# Spacing between candidate slot start times
+SLOT_STEP = timedelta(minutes=30)
+
+# Number of time slots suggested by resolve_conflicts
+SUGGESTED_SLOT_COUNT = 5
+
+
+def _slot_conflicts(schedule: Dict, start_ts: float, end_ts: float) -> Dict[str, List[CalendarEvent]]:
+    """Map each busy calendar to the user's events overlapping the slot."""
+    conflicts = {}
+    slot_events = None
+    for calendar_id, (busy_starts, busy_ends) in schedule['busy'].items():
+        # Busy intervals are disjoint, so only the last one starting
+        # before the slot ends can overlap it
+        index = bisect_left(busy_starts, end_ts) - 1
+        if index >= 0 and busy_ends[index] > start_ts:
+            if slot_events is None:
+                slot_events = schedule['events'].query(start_ts, end_ts)
+            if slot_events:
+                conflicts[calendar_id] = slot_events
+    return conflicts
+
+
+def _min_buffer_minutes(schedule: Dict, start_ts: float, end_ts: float) -> float:
+    """
+    Get the smallest gap in minutes between the slot and a nearby event.
+    
+    Only the latest event ending before the slot and the earliest event
+    starting after it, within BUFFER_WINDOW, are considered. Returns inf
+    when there are none.
+    """
+    window_seconds = BUFFER_WINDOW.total_seconds()
+    min_buffer = float('inf')
+    
+    event_ends = schedule['event_ends']
+    index = bisect_right(event_ends, start_ts) - 1
+    if index >= 0 and event_ends[index] > start_ts - window_seconds:
+        min_buffer = (start_ts - event_ends[index]) / 60
+    
+    event_starts = schedule['event_starts']
+    index = bisect_left(event_starts, end_ts)
+    if index < len(event_starts) and event_starts[index] < end_ts + window_seconds:
+        min_buffer = min(min_buffer, (event_starts[index] - end_ts) / 60)
+    
+    return min_buffer
+
+
+def _has_free_gap(intervals: List[Tuple[float, float]], lo: float, hi: float,
+                  length: float) -> bool:
+    """Whether sorted, disjoint intervals leave a gap of at least length within [lo, hi)."""
+    # Start from the first interval still running at lo
+    index = bisect_left(intervals, (lo,))
+    if index and intervals[index - 1][1] > lo:
+        index -= 1
+    
+    cursor = lo
+    while index < len(intervals) and intervals[index][0] < hi:
+        start, end = intervals[index]
+        if start - cursor >= length:
+            return True
+        cursor = max(cursor, end)
+        index += 1
+    
+    return hi - cursor >= length
+
+
+def _min_buffer_column(schedule: Dict, starts: List[float], ends: List[float]) -> List[float]:
+    """
+    Get _min_buffer_minutes for every slot in one merge pass.
+    
+    Slot starts and ends must both be in ascending order, which holds for
+    equal-length slots generated in time order. Each pointer only moves
+    forward, so the whole column costs O(slots + events).
+    """
+    window_seconds = BUFFER_WINDOW.total_seconds()
+    event_ends = schedule['event_ends']
+    event_starts = schedule['event_starts']
+    end_count = len(event_ends)
+    start_count = len(event_starts)
+    
+    buffers = []
+    before = 0  # Events ending at or before the slot start
+    after = 0  # First event starting at or after the slot end
+    for start_ts, end_ts in zip(starts, ends):
+        while before < end_count and event_ends[before] <= start_ts:
+            before += 1
+        while after < start_count and event_starts[after] < end_ts:
+            after += 1
+        
+        min_buffer = float('inf')
+        if before and event_ends[before - 1] > start_ts - window_seconds:
+            min_buffer = (start_ts - event_ends[before - 1]) / 60
+        if after < start_count and event_starts[after] < end_ts + window_seconds:
+            min_buffer = min(min_buffer, (event_starts[after] - end_ts) / 60)
+        buffers.append(min_buffer)
+    
+    return buffers
+
+
+@dataclass(slots=True)
 class TimeSlot:
     """Represents an available time slot with additional metadata."""
     start_time: datetime
@@ -42,6 +148,21 @@ class SmartScheduler:
             'lunch_time': (12, 13),  # Typical lunch hour
             'working_hours': (9, 17),  # Standard working hours
         }
+        self.apply_preferences()
+    
+    def apply_preferences(self):
+        """
+        Precompute the values slot scoring reads from the preferences.
+        
+        Call again after changing self.preferences.
+        """
+        self._preferred_hours = frozenset(
+            hour
+            for start, end in self.preferences['preferred_meeting_times']
+            for hour in range(start, end)
+        )
+        self._lunch_start, self._lunch_end = self.preferences['lunch_time']
+        self._min_buffer = self.preferences['min_buffer_minutes']
     
     def resolve_conflicts(self, meeting: MeetingRequest) -> List[TimeSlot]:
         """
@@ -70,46 +191,85 @@ class SmartScheduler:
             if not attendees:
                 logger.warning("No attendees specified in meeting request")
             
-            # Start with all possible time slots in the next 2 weeks
-            potential_slots = self._generate_time_slots(
-                days_ahead=14,
-                duration_minutes=duration
-            )
-            
-            if not potential_slots:
+            # Consider working days in the next 2 weeks
+            working_days = self._working_days(days_ahead=14)
+            if not working_days:
                 logger.warning("No potential time slots found")
                 return []
             
-            # Score and filter the slots
-            scored_slots = []
-            for slot in potential_slots:
-                try:
-                    score, conflicts, notes = self._evaluate_time_slot(
-                        slot.start_time, 
-                        slot.end_time,
-                        attendees
-                    )
-                    
-                    if score > 0:  # Slot is viable
-                        slot.score = score
-                        slot.attendee_conflicts = conflicts
-                        slot.notes = notes
-                        scored_slots.append(slot)
-                except Exception as e:
-                    logger.warning(f"Error evaluating time slot: {e}")
+            # Fetch calendar data for the whole window once, rather than
+            # querying the API for every candidate slot
+            day_length = self._working_day_length()
+            schedule = self._load_schedule(
+                attendees,
+                working_days[0].astimezone() - BUFFER_WINDOW,
+                (working_days[-1] + day_length).astimezone() + BUFFER_WINDOW
+            )
+            
+            # Skip days where no slot could avoid a conflict
+            skip_days = set()
+            if attendees:
+                skip_days = self._fully_booked_days(
+                    schedule, working_days, duration * 60
+                )
+            
+            # Best slots so far as a min-heap of (score, -order, slot); among
+            # equal scores the earlier slot ranks higher, as in a stable sort
+            best = []
+            order = 0
+            candidate_count = 0
+            viable_count = 0
+            max_score = 1.0 + 0.2 * bool(self._preferred_hours) + 0.1
+            
+            # Score day by day in time order, stopping once no later slot
+            # could displace the current top slots
+            for day in working_days:
+                if len(best) == SUGGESTED_SLOT_COUNT and best[0][0] >= max_score:
+                    break
+                if day in skip_days:
                     continue
+                
+                columns = self._generate_time_slots([day], duration_minutes=duration)
+                candidate_count += len(columns[0])
+                scores = self._score_time_slots(*columns, attendees, schedule)
+                
+                for score, slot in zip(scores, zip(*columns)):
+                    if score <= 0:
+                        continue
+                    viable_count += 1
+                    entry = (score, -order, slot)
+                    order += 1
+                    if len(best) < SUGGESTED_SLOT_COUNT:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
             
-            # Sort by score (highest first)
-            scored_slots.sort(key=lambda x: x.score, reverse=True)
+            if not candidate_count:
+                logger.warning("No potential time slots found")
+                return []
             
             # Log results
-            if scored_slots:
-                logger.info(f"Found {len(scored_slots)} viable time slots")
+            if viable_count:
+                logger.info(f"Found {viable_count} viable time slots")
             else:
                 logger.warning("No viable time slots found after conflict resolution")
             
-            # Return top 5 slots
-            return scored_slots[:5]
+            # Return the top slots, best first; only these are built into
+            # TimeSlot objects
+            top_slots = []
+            for _, _, (start_ts, end_ts, start_hour, end_hour) in sorted(best, reverse=True):
+                score, conflicts, notes = self._describe_time_slot(
+                    start_ts, end_ts, start_hour, end_hour, attendees, schedule
+                )
+                top_slots.append(TimeSlot(
+                    start_time=datetime.fromtimestamp(start_ts),
+                    end_time=datetime.fromtimestamp(end_ts),
+                    score=score,
+                    attendee_conflicts=conflicts,
+                    notes=notes
+                ))
+            
+            return top_slots
             
         except Exception as e:
             logger.error(f"Error resolving conflicts: {e}")
@@ -139,56 +299,45 @@ class SmartScheduler:
             if not events:
                 return suggestions
             
-            # Group events by day
-            events_by_day = {}
+            # Sweep events in start order, closing out each day's totals
+            # when the next day begins
+            events = sorted(events, key=lambda event: event.start_time.timestamp())
+            current_day = None
+            day_count = 0
+            lunch_conflicts = []
+            prev_event = None
+            
             for event in events:
                 day = event.start_time.date()
-                if day not in events_by_day:
-                    events_by_day[day] = []
-                events_by_day[day].append(event)
-            
-            # Analyze each day
-            for day, day_events in events_by_day.items():
-                # Check for overbooked days
-                if len(day_events) > self.preferences['max_meetings_per_day']:
-                    suggestions.append({
-                        'type': 'overbooked_day',
-                        'date': day,
-                        'severity': 'high',
-                        'message': f"Day is overbooked with {len(day_events)} meetings"
-                    })
+                if day != current_day:
+                    self._close_day(suggestions, current_day, day_count, lunch_conflicts)
+                    current_day = day
+                    day_count = 0
+                    lunch_conflicts = []
+                    prev_event = None
+                
+                day_count += 1
                 
                 # Check for insufficient breaks
-                for i in range(len(day_events) - 1):
-                    current = day_events[i]
-                    next_event = day_events[i + 1]
-                    break_duration = (next_event.start_time - current.end_time).total_seconds() / 60
+                if prev_event is not None:
+                    break_duration = (event.start_time - prev_event.end_time).total_seconds() / 60
                     
-                    if break_duration < self.preferences['min_buffer_minutes']:
+                    if break_duration < self._min_buffer:
                         suggestions.append({
                             'type': 'insufficient_break',
                             'date': day,
-                            'events': [current.id, next_event.id],
+                            'events': [prev_event.id, event.id],
                             'severity': 'medium',
                             'message': f"Only {break_duration:.0f} minutes between meetings"
                         })
                 
                 # Check for lunch time conflicts
-                lunch_start, lunch_end = self.preferences['lunch_time']
-                lunch_conflicts = [
-                    event for event in day_events
-                    if (event.start_time.hour < lunch_end and 
-                        event.end_time.hour > lunch_start)
-                ]
+                if event.start_time.hour < self._lunch_end and event.end_time.hour > self._lunch_start:
+                    lunch_conflicts.append(event.id)
                 
-                if lunch_conflicts:
-                    suggestions.append({
-                        'type': 'lunch_conflict',
-                        'date': day,
-                        'events': [e.id for e in lunch_conflicts],
-                        'severity': 'low',
-                        'message': "Meetings scheduled during typical lunch hour"
-                    })
+                prev_event = event
+            
+            self._close_day(suggestions, current_day, day_count, lunch_conflicts)
             
             # Sort suggestions by severity
             severity_order = {'high': 0, 'medium': 1, 'low': 2}
@@ -200,113 +349,285 @@ class SmartScheduler:
             logger.error(f"Error optimizing calendar: {e}")
             return []
     
-    def _generate_time_slots(self, days_ahead: int, 
-                           duration_minutes: int) -> List[TimeSlot]:
-        """Generate potential time slots for scheduling."""
-        slots = []
+    def _close_day(self, suggestions: List[Dict], day, day_count: int,
+                   lunch_conflicts: List[str]):
+        """Add the overbooked and lunch suggestions for a finished day of events."""
+        if day is None:
+            return
+        
+        # Check for overbooked days
+        if day_count > self.preferences['max_meetings_per_day']:
+            suggestions.append({
+                'type': 'overbooked_day',
+                'date': day,
+                'severity': 'high',
+                'message': f"Day is overbooked with {day_count} meetings"
+            })
+        
+        if lunch_conflicts:
+            suggestions.append({
+                'type': 'lunch_conflict',
+                'date': day,
+                'events': lunch_conflicts,
+                'severity': 'low',
+                'message': "Meetings scheduled during typical lunch hour"
+            })
+    
+    def _working_day_length(self) -> timedelta:
+        """Get the length of the working day."""
+        start_hour, end_hour = self.preferences['working_hours']
+        return timedelta(hours=end_hour - start_hour)
+    
+    def _working_days(self, days_ahead: int) -> List[datetime]:
+        """Get the start of working hours on each weekday from tomorrow on."""
         base_date = datetime.now().replace(
             hour=self.preferences['working_hours'][0],
             minute=0, second=0, microsecond=0
         )
         
+        working_days = []
         for day in range(1, days_ahead + 1):
             current_date = base_date + timedelta(days=day)
             
             # Skip weekends
-            if current_date.weekday() >= 5:
-                continue
+            if current_date.weekday() < 5:
+                working_days.append(current_date)
+        
+        return working_days
+    
+    def _fully_booked_days(self, schedule: Dict, working_days: List[datetime],
+                           duration_seconds: float) -> set:
+        """
+        Find working days on which every slot would be disqualified.
+        
+        A slot is disqualified when it overlaps both one of the user's
+        events and a busy calendar, so a day is fully booked when neither
+        leaves a gap long enough for the meeting.
+        """
+        event_intervals = _merge_intervals(list(zip(
+            schedule['event_starts'], schedule['event_ends']
+        )))
+        busy_intervals = _merge_intervals([
+            interval
+            for busy_starts, busy_ends in schedule['busy'].values()
+            for interval in zip(busy_starts, busy_ends)
+        ])
+        day_seconds = self._working_day_length().total_seconds()
+        
+        fully_booked = set()
+        for day in working_days:
+            day_ts = day.timestamp()
+            day_end = day_ts + day_seconds
+            if not (_has_free_gap(event_intervals, day_ts, day_end, duration_seconds) or
+                    _has_free_gap(busy_intervals, day_ts, day_end, duration_seconds)):
+                fully_booked.add(day)
+        
+        if fully_booked:
+            logger.info(f"Skipping {len(fully_booked)} fully booked days")
+        return fully_booked
+    
+    def _generate_time_slots(self, working_days: List[datetime],
+                           duration_minutes: int) -> Tuple[List[int], List[int], List[int], List[int]]:
+        """
+        Generate potential time slots for scheduling.
+        
+        Slots are returned as parallel columns rather than one TimeSlot
+        object each, so they can be scored in a single pass.
+        
+        Args:
+            working_days: Start of working hours on each day to fill
+            duration_minutes: Meeting length
+        
+        Returns:
+            Tuple of (start epoch seconds, end epoch seconds, start hours, end hours)
+        """
+        starts, ends, start_hours, end_hours = [], [], [], []
+        start_hour, end_hour = self.preferences['working_hours']
+        
+        # Slot offsets from the start of the working day; don't go past
+        # working hours
+        step = int(SLOT_STEP.total_seconds())
+        duration = duration_minutes * 60
+        day_length = (end_hour - start_hour) * 3600
+        offsets = [
+            offset for offset in range(0, day_length, step)
+            if offset + duration < day_length
+        ]
+        
+        for current_date in working_days:
+            day_ts = int(current_date.timestamp())
+            for offset in offsets:
+                starts.append(day_ts + offset)
+                ends.append(day_ts + offset + duration)
+                start_hours.append(start_hour + offset // 3600)
+                end_hours.append(start_hour + (offset + duration) // 3600)
+        
+        return starts, ends, start_hours, end_hours
+    
+    def _score_time_slots(self, starts: List[int], ends: List[int],
+                          start_hours: List[int], end_hours: List[int],
+                          attendees: List[str], schedule: Dict) -> List[float]:
+        """
+        Score candidate slots given as parallel columns.
+        
+        Applies the same rules as _describe_time_slot without building notes;
+        slots with attendee conflicts score 0.
+        
+        Returns:
+            List of scores, one per slot
+        """
+        min_buffer_minutes = self._min_buffer
+        lunch_start = self._lunch_start
+        lunch_end = self._lunch_end
+        no_buffer = float('inf')
+        buffers = _min_buffer_column(schedule, starts, ends)
+        
+        # One boolean column per rule
+        preferred = [hour in self._preferred_hours for hour in start_hours]
+        good_buffer = [min_buffer_minutes <= buffer < no_buffer for buffer in buffers]
+        short_buffer = [buffer < min_buffer_minutes for buffer in buffers]
+        lunch = [
+            start_hour < lunch_end and end_hour > lunch_start
+            for start_hour, end_hour in zip(start_hours, end_hours)
+        ]
+        if attendees:
+            free = [
+                not _slot_conflicts(schedule, start_ts, end_ts)
+                for start_ts, end_ts in zip(starts, ends)
+            ]
+        else:
+            free = [True] * len(starts)
+        
+        # Fused in the order _describe_time_slot applies the rules, so the
+        # scores match it exactly; conflicts zero the score
+        return [
+            (1.0 + 0.2 * p + 0.1 * g - 0.1 * b - 0.2 * l) * f
+            for p, g, b, l, f in zip(preferred, good_buffer, short_buffer, lunch, free)
+        ]
+    
+    def _load_schedule(self, attendees: List[str], start_time: datetime,
+                       end_time: datetime) -> Dict:
+        """
+        Fetch the calendar data needed to score slots within a time window.
+        
+        Args:
+            attendees: List of attendee emails
+            start_time: Start of the window (timezone-aware)
+            end_time: End of the window (timezone-aware)
             
-            # Generate slots during working hours
-            start_hour, end_hour = self.preferences['working_hours']
-            for hour in range(start_hour, end_hour):
-                for minute in [0, 30]:  # 30-minute increments
-                    start_time = current_date.replace(hour=hour, minute=minute)
-                    end_time = start_time + timedelta(minutes=duration_minutes)
-                    
-                    # Don't go past working hours
-                    if end_time.hour >= end_hour:
-                        continue
-                    
-                    slots.append(TimeSlot(
-                        start_time=start_time,
-                        end_time=end_time,
-                        attendee_conflicts={},
-                        notes=[]
-                    ))
-        
-        return slots
+        Returns:
+            Request-scoped schedule with each calendar's busy intervals, an
+            interval tree of the user's events and their sorted start and
+            end times
+        """
+        # Busy time and events are fetched in parallel
+        busy_by_calendar, events = self.calendar_service.get_busy_and_conflicts(
+            start_time, end_time, attendees
+        )
+        busy = {}
+        for calendar_id, intervals in busy_by_calendar.items():
+            busy[calendar_id] = (
+                [int(start) for start, _ in intervals],
+                [int(end) for _, end in intervals]
+            )
+        
+        tree = IntervalTree()
+        event_starts = []
+        event_ends = []
+        for event in events:
+            event_start = int(event.start_time.timestamp())
+            event_end = int(event.end_time.timestamp())
+            tree.insert(event_start, event_end, event)
+            event_starts.append(event_start)
+            event_ends.append(event_end)
+        
+        # Sorted separately so the nearest event on either side of a slot
+        # is a single bisect away
+        event_starts.sort()
+        event_ends.sort()
+        
+        return {
+            'busy': busy,
+            'events': tree,
+            'event_starts': event_starts,
+            'event_ends': event_ends,
+        }
     
     def _evaluate_time_slot(self, start_time: datetime, end_time: datetime,
-                          attendees: List[str]) -> Tuple[float, Dict, List[str]]:
+                          attendees: List[str],
+                          schedule: Optional[Dict] = None) -> Tuple[float, Dict, List[str]]:
         """
         Evaluate a time slot for scheduling quality.
         
+        Args:
+            start_time: Slot start time
+            end_time: Slot end time
+            attendees: List of attendee emails
+            schedule: Calendar data from _load_schedule covering the slot;
+                fetched for this slot alone when omitted
+        
         Returns:
             Tuple of (score, conflicts dict, notes list)
         """
-        score = 1.0
-        notes = []
-        conflicts = {}
-        
         # Validate inputs
         if not start_time or not end_time:
             logger.error("Missing start or end time for evaluation")
-            return 0.0, conflicts, ["Invalid time slot"]
+            return 0.0, {}, ["Invalid time slot"]
             
         if start_time >= end_time:
             logger.error("Start time must be before end time")
-            return 0.0, conflicts, ["Invalid time range"]
+            return 0.0, {}, ["Invalid time range"]
         
-        # Convert times to timezone-aware if needed
+        # Convert times to timezone-aware if needed; naive times are local,
+        # and astimezone() picks the right offset for each one
         if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=datetime.now().astimezone().tzinfo)
+            start_time = start_time.astimezone()
         if end_time.tzinfo is None:
-            end_time = end_time.replace(tzinfo=datetime.now().astimezone().tzinfo)
+            end_time = end_time.astimezone()
+        
+        if schedule is None:
+            schedule = self._load_schedule(
+                attendees, start_time - BUFFER_WINDOW, end_time + BUFFER_WINDOW
+            )
+        
+        return self._describe_time_slot(
+            int(start_time.timestamp()), int(end_time.timestamp()),
+            start_time.hour, end_time.hour, attendees, schedule
+        )
+    
+    def _describe_time_slot(self, start_ts: int, end_ts: int, start_hour: int,
+                            end_hour: int, attendees: List[str],
+                            schedule: Dict) -> Tuple[float, Dict, List[str]]:
+        """
+        Score a slot given as epoch seconds and local clock hours, with notes.
+        
+        Returns:
+            Tuple of (score, conflicts dict, notes list)
+        """
+        score = 1.0
+        notes = []
+        conflicts = {}
         
         # Check availability for all attendees
         if attendees:
-            availability = self.calendar_service.check_availability(
-                start_time, end_time, attendees
-            )
-            
-            # Check if any attendee is not available
-            for attendee, is_available in availability.items():
-                if not is_available:
-                    attendee_conflicts = self.calendar_service.get_calendar_conflicts(
-                        start_time, end_time
-                    )
-                    if attendee_conflicts:
-                        conflicts[attendee] = attendee_conflicts
-                        score = 0  # Immediate disqualification
-                        notes.append(f"Conflicts for {attendee}")
+            conflicts = _slot_conflicts(schedule, start_ts, end_ts)
+            for attendee in conflicts:
+                score = 0  # Immediate disqualification
+                notes.append(f"Conflicts for {attendee}")
         
         if score == 0:
             return score, conflicts, notes
         
         # Preferred time bonus
-        for start, end in self.preferences['preferred_meeting_times']:
-            if start <= start_time.hour < end:
-                score += 0.2
-                notes.append("Within preferred hours")
-                break
+        if start_hour in self._preferred_hours:
+            score += 0.2
+            notes.append("Within preferred hours")
         
         # Buffer time bonus
-        day_events = self.calendar_service.get_calendar_conflicts(
-            start_time - timedelta(hours=2),
-            end_time + timedelta(hours=2)
-        )
-        
-        min_buffer = float('inf')
-        for event in day_events:
-            if event.end_time <= start_time:
-                buffer = (start_time - event.end_time).total_seconds() / 60
-                min_buffer = min(min_buffer, buffer)
-            elif event.start_time >= end_time:
-                buffer = (event.start_time - end_time).total_seconds() / 60
-                min_buffer = min(min_buffer, buffer)
+        min_buffer = _min_buffer_minutes(schedule, start_ts, end_ts)
         
         if min_buffer < float('inf'):
-            if min_buffer >= self.preferences['min_buffer_minutes']:
+            if min_buffer >= self._min_buffer:
                 score += 0.1
                 notes.append(f"Good buffer time: {min_buffer:.0f} minutes")
             else:
@@ -314,8 +635,7 @@ class SmartScheduler:
                 notes.append(f"Limited buffer time: {min_buffer:.0f} minutes")
         
         # Lunch time penalty
-        lunch_start, lunch_end = self.preferences['lunch_time']
-        if (start_time.hour < lunch_end and end_time.hour > lunch_start):
+        if start_hour < self._lunch_end and end_hour > self._lunch_start:
             score -= 0.2
             notes.append("Conflicts with typical lunch hour")
         
@@ -323,11 +643,7 @@ class SmartScheduler:
 
 
 # Global smart scheduler instance
-_smart_scheduler = None
-
+@cache
 def get_smart_scheduler() -> SmartScheduler:
     """Get the global smart scheduler instance."""
-    global _smart_scheduler
-    if _smart_scheduler is None:
-        _smart_scheduler = SmartScheduler()
-    return _smart_scheduler
+    return SmartScheduler()
@@ -3,11 +3,17 @@ Task management module for follow-ups, overdue tasks, and reminders.
 """
 
 from .followup_manager import FollowupManager
-from .overdue_detector import OverdueDetector  
-from .reminder_system import ReminderSystem
+from .overdue_detector import OverdueDetector, OverdueItem, EscalationLevel
+from .reminder_system import ReminderSystem, SnoozeSuggestion
+from ..database.advanced_db import Priority, ReminderType
 
 __all__ = [
     "FollowupManager",
     "OverdueDetector", 
-    "ReminderSystem"
+    "OverdueItem",
+    "ReminderSystem",
+    "SnoozeSuggestion",
+    "EscalationLevel",
+    "Priority",
+    "ReminderType"
 ]
@@ -4,14 +4,152 @@ Uses AI to determine follow-up requirements and optimal timing.
 """
 
 import json
+import re
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from loguru import logger
 
 from ..database.advanced_db import AdvancedDatabase, FollowUp
 from ..core.email_service import EmailData
 from ..ai.gemini_service import GeminiEmailAI
 
+try:
+    # Faster JSON parser for AI responses; its errors subclass json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Phrases that suggest an email needs a follow-up
+FOLLOWUP_KEYWORDS = [
+    'please respond', 'get back to', 'let me know', 'waiting for',
+    'deadline', 'due date', 'follow up', 'follow-up', 'meeting',
+    'schedule', 'confirm', 'approval', 'decision', 'feedback'
+]
+
+# Phrases that mark a follow-up as urgent
+URGENT_KEYWORDS = [
+    'urgent', 'asap', 'immediately', 'deadline', 'critical',
+    'important', 'priority', 'time-sensitive'
+]
+
+# Single-pass matchers for the keyword lists; substring semantics are kept,
+# so 'meeting' still matches 'meetings'
+_FOLLOWUP_PATTERN = re.compile('|'.join(map(re.escape, FOLLOWUP_KEYWORDS)), re.IGNORECASE)
+_URGENT_PATTERN = re.compile('|'.join(map(re.escape, URGENT_KEYWORDS)), re.IGNORECASE)
+
+# Seconds follow-up statistics are reused before being recomputed
+STATS_CACHE_TTL = 30
+
+# Urgency levels a follow-up analysis may report
+URGENCY_LEVELS = ('low', 'medium', 'high', 'urgent')
+
+# Emails analyzed per AI request by analyze_followup_requirements_batch
+ANALYSIS_BATCH_SIZE = 20
+
+# Response tokens allowed per email in a batched follow-up request
+ANALYSIS_TOKENS_PER_EMAIL = 150
+
+# Follow-up dates are floored to this many minutes so equal dates compare
+# and cache equal instead of differing by microseconds
+DATE_BUCKET_MINUTES = 10
+
+
+# Follow-up analysis prompt for one email; braces in the JSON example are
+# doubled for str.format
+_FOLLOWUP_PROMPT_TEMPLATE = """
+            Analyze the following email to determine if it requires follow-up action:
+            
+            From: {sender}
+            Subject: {subject}
+            Content: {content}...
+            
+            Please analyze and respond in JSON format with:
+            {{
+                "requires_followup": true/false,
+                "urgency": "low/medium/high/urgent",
+                "suggested_days": number of days to wait before following up,
+                "reason": "explanation of why follow-up is needed",
+                "followup_type": "response_required/deadline_tracking/relationship_maintenance/project_update/meeting_scheduling"
+            }}
+            
+            Consider factors like:
+            - Questions that need answers
+            - Pending decisions or approvals
+            - Project deadlines mentioned
+            - Meeting requests
+            - Important relationships
+            """
+
+# Follow-up analysis prompt for a batch of emails; braces in the JSON example
+# are doubled for str.format
+_FOLLOWUP_BATCH_PROMPT_TEMPLATE = """
+            Analyze the following {count} emails to determine if each requires follow-up action:
+            {emails}
+            Please respond with a JSON array containing one object per email:
+            [
+                {{
+                    "email_id": "the id after EMAIL in the email's header",
+                    "requires_followup": true/false,
+                    "urgency": "low/medium/high/urgent",
+                    "suggested_days": number of days to wait before following up,
+                    "reason": "explanation of why follow-up is needed",
+                    "followup_type": "response_required/deadline_tracking/relationship_maintenance/project_update/meeting_scheduling"
+                }}
+            ]
+            
+            Consider factors like:
+            - Questions that need answers
+            - Pending decisions or approvals
+            - Project deadlines mentioned
+            - Meeting requests
+            - Important relationships
+            """
+
+# One email's section of _FOLLOWUP_BATCH_PROMPT_TEMPLATE
+_FOLLOWUP_EMAIL_TEMPLATE = """
+--- EMAIL {id} ---
+From: {sender}
+Subject: {subject}
+Content: {content}...
+"""
+
+
+def _strip_code_fence(response: str) -> str:
+    """Remove a Markdown code fence the model may wrap its JSON in."""
+    response = response.strip()
+    if response.startswith('```json'):
+        return response[7:-3].strip()
+    if response.startswith('```'):
+        return response[3:-3].strip()
+    return response
+
+
+def _validate_analysis(data) -> Optional[Dict]:
+    """Check a parsed AI follow-up analysis, returning it normalized or None if malformed."""
+    if not isinstance(data, dict) or not isinstance(data.get("requires_followup"), bool):
+        return None
+    
+    suggested_days = data.get("suggested_days", 3)
+    if (isinstance(suggested_days, bool) or
+            not isinstance(suggested_days, (int, float)) or suggested_days < 0):
+        return None
+    
+    urgency = str(data.get("urgency", "medium")).lower()
+    return {
+        "requires_followup": data["requires_followup"],
+        "urgency": urgency if urgency in URGENCY_LEVELS else "medium",
+        "suggested_days": int(suggested_days),
+        "reason": str(data.get("reason", "")),
+        "followup_type": str(data.get("followup_type", "none"))
+    }
+
+
+def _round_bucket(dt: datetime, minutes: int = DATE_BUCKET_MINUTES) -> datetime:
+    """Floor a datetime to the start of its bucket of the given size in minutes."""
+    return dt.replace(minute=dt.minute - dt.minute % minutes, second=0, microsecond=0)
+
 
 class FollowupManager:
     """Manages follow-up tracking and scheduling for emails."""
@@ -22,6 +160,13 @@ class FollowupManager:
         self.advanced_db = advanced_db or AdvancedDatabase()
         self.ai_service = ai_service or GeminiEmailAI()
         
+        # (computed_at, statistics) from the last get_statistics call
+        self._stats_cache: Optional[Tuple[float, Dict]] = None
+        
+    def invalidate_statistics(self):
+        """Drop cached statistics after follow-ups change."""
+        self._stats_cache = None
+        
     def analyze_followup_requirements(self, email: EmailData) -> Dict:
         """
         Analyze if an email requires follow-up using AI.
@@ -34,67 +179,92 @@ class FollowupManager:
         """
         try:
             # Create analysis prompt
-            prompt = f"""
-            Analyze the following email to determine if it requires follow-up action:
-            
-            From: {email.sender}
-            Subject: {email.subject}
-            Content: {email.content[:1000]}...
-            
-            Please analyze and respond in JSON format with:
-            {{
-                "requires_followup": true/false,
-                "urgency": "low/medium/high/urgent",
-                "suggested_days": number of days to wait before following up,
-                "reason": "explanation of why follow-up is needed",
-                "followup_type": "response_required/deadline_tracking/relationship_maintenance/project_update/meeting_scheduling"
-            }}
-            
-            Consider factors like:
-            - Questions that need answers
-            - Pending decisions or approvals
-            - Project deadlines mentioned
-            - Meeting requests
-            - Important relationships
-            """
+            prompt = _FOLLOWUP_PROMPT_TEMPLATE.format(
+                sender=email.sender,
+                subject=email.subject,
+                content=email.content[:1000]
+            )
             
-            response = self.ai_service.generate_content(prompt)
+            response = _strip_code_fence(self.ai_service.generate_content(prompt))
             
-            # Parse the JSON response
+            # Parse and validate the JSON response
             try:
-                analysis = json.loads(response)
-                return analysis
+                analysis = _validate_analysis(_json_loads(response))
             except json.JSONDecodeError:
-                # Fallback analysis if JSON parsing fails
+                analysis = None
+            
+            if analysis is None:
+                # Fallback analysis if the response is not a valid analysis
                 logger.warning("Failed to parse AI follow-up analysis, using fallback")
                 return self._fallback_followup_analysis(email)
+            return analysis
                 
         except Exception as e:
             logger.error(f"Error analyzing follow-up requirements: {e}")
             return self._fallback_followup_analysis(email)
     
-    def _fallback_followup_analysis(self, email: EmailData) -> Dict:
-        """Fallback follow-up analysis using keyword detection."""
-        content_lower = email.content.lower()
-        subject_lower = email.subject.lower()
+    def analyze_followup_requirements_batch(self, emails: List[EmailData]) -> List[Dict]:
+        """
+        Analyze several emails for follow-up requirements, one AI request per batch.
         
-        # Check for follow-up indicators
-        followup_keywords = [
-            'please respond', 'get back to', 'let me know', 'waiting for',
-            'deadline', 'due date', 'follow up', 'follow-up', 'meeting',
-            'schedule', 'confirm', 'approval', 'decision', 'feedback'
-        ]
+        Args:
+            emails: Emails to analyze
+            
+        Returns:
+            List of follow-up analysis results, in the same order as emails
+        """
+        analyses = []
+        for i in range(0, len(emails), ANALYSIS_BATCH_SIZE):
+            analyses.extend(self._analyze_followup_batch(emails[i:i + ANALYSIS_BATCH_SIZE]))
+        return analyses
+    
+    def _analyze_followup_batch(self, batch: List[EmailData]) -> List[Dict]:
+        """Analyze one batch of emails with a single AI request."""
+        try:
+            # Create batch analysis prompt
+            emails_text = "".join(
+                _FOLLOWUP_EMAIL_TEMPLATE.format(
+                    id=email.id,
+                    sender=email.sender,
+                    subject=email.subject,
+                    content=email.content[:1000]
+                )
+                for email in batch
+            )
+            prompt = _FOLLOWUP_BATCH_PROMPT_TEMPLATE.format(count=len(batch), emails=emails_text)
+            
+            response = _strip_code_fence(self.ai_service.generate_content(
+                prompt, max_output_tokens=ANALYSIS_TOKENS_PER_EMAIL * len(batch)
+            ))
+            
+            analyses_by_id = {
+                str(item.get("email_id")): item
+                for item in _json_loads(response)
+                if isinstance(item, dict)
+            }
+            
+        except Exception as e:
+            logger.warning(f"Batch follow-up analysis failed, using fallback: {e}")
+            analyses_by_id = {}
         
-        urgent_keywords = [
-            'urgent', 'asap', 'immediately', 'deadline', 'critical',
-            'important', 'priority', 'time-sensitive'
-        ]
+        # Fall back per email for anything missing from the response
+        analyses = []
+        for email in batch:
+            analysis = _validate_analysis(analyses_by_id.get(str(email.id)))
+            if analysis is None:
+                analysis = self._fallback_followup_analysis(email)
+            analyses.append(analysis)
         
-        requires_followup = any(keyword in content_lower or keyword in subject_lower 
-                              for keyword in followup_keywords)
+        return analyses
+    
+    def _fallback_followup_analysis(self, email: EmailData) -> Dict:
+        """Fallback follow-up analysis using keyword detection."""
+        # Check for follow-up indicators
+        requires_followup = bool(_FOLLOWUP_PATTERN.search(email.subject) or
+                                 _FOLLOWUP_PATTERN.search(email.content))
         
-        is_urgent = any(keyword in content_lower or keyword in subject_lower 
-                       for keyword in urgent_keywords)
+        is_urgent = bool(_URGENT_PATTERN.search(email.subject) or
+                         _URGENT_PATTERN.search(email.content))
         
         if requires_followup:
             urgency = "urgent" if is_urgent else "medium"
@@ -136,7 +306,7 @@ class FollowupManager:
             
             # Calculate follow-up and reminder dates
             suggested_days = analysis.get("suggested_days", 3)
-            followup_date = datetime.now() + timedelta(days=suggested_days)
+            followup_date = _round_bucket(datetime.now() + timedelta(days=suggested_days))
             reminder_date = followup_date - timedelta(days=1)  # Remind 1 day before
             
             # Create follow-up object
@@ -157,6 +327,7 @@ class FollowupManager:
             followup_id = self.advanced_db.create_follow_up(followup)
             
             if followup_id > 0:
+                self.invalidate_statistics()
                 logger.info(f"Created follow-up {followup_id} for email {email.id}")
             
             return followup_id
@@ -165,10 +336,66 @@ class FollowupManager:
             logger.error(f"Error creating follow-up: {e}")
             return -1
     
+    def create_followups(self, emails: List[EmailData]) -> List[int]:
+        """
+        Create follow-up items for several emails, analyzing them in batches.
+        
+        Args:
+            emails: Email data
+            
+        Returns:
+            List of follow-up IDs, -1 where none was created
+        """
+        analyses = self.analyze_followup_requirements_batch(emails)
+        return [
+            self.create_followup(email, analysis)
+            for email, analysis in zip(emails, analyses)
+        ]
+    
     def get_pending_followups(self) -> List[FollowUp]:
         """Get all pending follow-ups."""
         return self.advanced_db.get_pending_follow_ups()
     
+    def get_pending_followups_page(self, after: Optional[Tuple[str, int]] = None,
+                                   limit: int = 25) -> Tuple[List[FollowUp], Optional[Tuple[str, int]]]:
+        """
+        Get one page of pending follow-ups.
+        
+        Args:
+            after: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of follow-ups to return
+            
+        Returns:
+            Tuple of (follow-ups, cursor for the next page or None)
+        """
+        return self.advanced_db.get_pending_follow_ups_page(after=after, limit=limit)
+    
+    def iter_pending_followups(self, page_size: int = 500) -> Iterator[List[FollowUp]]:
+        """
+        Iterate over all pending follow-ups one page at a time.
+        
+        Args:
+            page_size: Number of follow-ups fetched per query
+            
+        Yields:
+            Lists of up to page_size follow-ups
+        """
+        cursor = None
+        while True:
+            page, cursor = self.get_pending_followups_page(after=cursor, limit=page_size)
+            if page:
+                yield page
+            if cursor is None:
+                return
+    
+    def count_pending_followups(self) -> int:
+        """Count pending follow-ups."""
+        return self.advanced_db.count_pending_follow_ups()
+    
+    def get_pending_followup_ids(self) -> List[int]:
+        """Get the ids of all pending follow-ups, for bulk actions."""
+        return self.advanced_db.get_pending_follow_up_ids()
+    
     def get_overdue_followups(self) -> List[FollowUp]:
         """Get overdue follow-ups."""
         return self.advanced_db.get_overdue_follow_ups()
@@ -184,7 +411,29 @@ class FollowupManager:
         Returns:
             True if successful, False otherwise
         """
-        return self.advanced_db.update_follow_up_status(followup_id, "completed")
+        success = self.advanced_db.update_follow_up_status(followup_id, "completed")
+        
+        # Invalidated after the write so a concurrent read cannot re-cache old counts
+        if success:
+            self.invalidate_statistics()
+        return success
+    
+    def complete_followups(self, followup_ids: List[int]) -> int:
+        """
+        Mark several follow-ups as completed in one database call.
+        
+        Args:
+            followup_ids: IDs of the follow-ups
+            
+        Returns:
+            Number of follow-ups updated
+        """
+        completed = self.advanced_db.update_follow_ups_status(followup_ids, "completed")
+        
+        # Invalidated after the write so a concurrent read cannot re-cache old counts
+        if completed:
+            self.invalidate_statistics()
+        return completed
     
     def snooze_followup(self, followup_id: int, days: int) -> bool:
         """
@@ -198,20 +447,14 @@ class FollowupManager:
             True if successful, False otherwise
         """
         try:
-            # Get the follow-up
-            followups = self.get_pending_followups()
-            target_followup = next((f for f in followups if f.id == followup_id), None)
-            
-            if not target_followup:
-                return False
-            
             # Update follow-up date
-            new_followup_date = datetime.now() + timedelta(days=days)
-            target_followup.follow_up_date = new_followup_date
-            target_followup.reminder_date = new_followup_date - timedelta(days=1)
+            new_followup_date = _round_bucket(datetime.now() + timedelta(days=days))
+            if not self.advanced_db.update_follow_up_dates(
+                followup_id, new_followup_date, new_followup_date - timedelta(days=1)
+            ):
+                return False
             
-            # This would require an update method in the database
-            # For now, we'll just log it
+            self.invalidate_statistics()
             logger.info(f"Snoozed follow-up {followup_id} for {days} days")
             return True
             
@@ -220,20 +463,25 @@ class FollowupManager:
             return False
     
     def get_statistics(self) -> Dict:
-        """Get follow-up statistics."""
+        """Get follow-up statistics, cached for STATS_CACHE_TTL seconds."""
+        cached = self._stats_cache
+        if cached is not None and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+            return dict(cached[1])
+        
         try:
-            pending = self.get_pending_followups()
-            overdue = self.get_overdue_followups()
+            # Bucketed like the stored dates, so boundaries stay stable
+            # within a bucket
+            now = _round_bucket(datetime.now())
+            day_start = now.replace(hour=0, minute=0)
+            week_end = now + timedelta(days=7)
             
-            return {
-                "total_pending": len(pending),
-                "overdue_count": len(overdue),
-                "high_priority": len([f for f in pending if f.priority in ["high", "urgent"]]),
-                "due_today": len([f for f in pending if f.follow_up_date and 
-                                f.follow_up_date.date() == datetime.now().date()]),
-                "due_this_week": len([f for f in pending if f.follow_up_date and 
-                                    f.follow_up_date < datetime.now() + timedelta(days=7)])
-            }
+            # Counted in the database instead of loading every pending follow-up
+            statistics = self.advanced_db.get_follow_up_statistics(day_start, week_end)
+            if not statistics:
+                raise RuntimeError("follow-up statistics query failed")
+            
+            self._stats_cache = (time.monotonic(), statistics)
+            return dict(statistics)
             
         except Exception as e:
             logger.error(f"Error getting follow-up statistics: {e}")
@@ -3,9 +3,18 @@ Overdue detector for identifying and managing overdue tasks and deadlines.
 Monitors emails for deadlines and tracks overdue items with escalation.
 """
 
+import bisect
+import hashlib
+import itertools
 import json
 import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timedelta
+from enum import IntEnum
 from typing import List, Dict, Optional, Tuple
 from loguru import logger
 
@@ -13,15 +22,298 @@ from ..database.advanced_db import AdvancedDatabase, FollowUp
 from ..core.email_service import EmailData
 from ..ai.gemini_service import GeminiEmailAI
 
+try:
+    # Faster JSON parser for AI responses; its errors subclass json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Fraction of overdue items that may change incrementally before the summary is rebuilt
+SUMMARY_REBUILD_RATIO = 0.1
+
+# Seconds before the summary is rebuilt to pick up items that became overdue
+SUMMARY_MAX_AGE = 300
+
+# Days overdue at which escalation moves past low, medium and high
+_ESCALATION_THRESHOLDS = (1, 3, 7)
+
+# Escalation level names, least severe first, one more than the thresholds
+_ESCALATION_LEVELS = ('low', 'medium', 'high', 'critical')
+
+# Index of each level in _ESCALATION_LEVELS, for comparing severities
+_ESCALATION_RANK = {level: rank for rank, level in enumerate(_ESCALATION_LEVELS)}
+
+# Number of per-email AI deadline results kept, keyed by a hash of the
+# email's section of the prompt
+AI_CACHE_SIZE = 2048
+
+# Emails sent to the AI per deadline extraction request
+DEADLINE_BATCH_SIZE = 20
+
+# Response tokens allowed per email in a batched deadline request
+DEADLINE_TOKENS_PER_EMAIL = 200
+
+# Deadline phrases followed by a numeric date, as one pattern so the text is
+# scanned once; earlier alternatives win where phrases overlap
+_DEADLINE_RE = re.compile(
+    r'(?:due\s+(?:by\s+)?'
+    r'|deadline\s+(?:is\s+)?'
+    r'|must\s+be\s+(?:completed|submitted|sent)\s+by\s+'
+    r'|(?:end\s+of\s+day|eod)\s+(?:on\s+)?'
+    r'|by\s+)'
+    r'(?P<date>\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
+    re.IGNORECASE
+)
+
+# Words that suggest an email may contain a deadline; emails without any are
+# not sent to the AI, though the regex fallback still runs on them. "submit"
+# and "by <digit>" take no closing boundary so "submitted" and "by 12/15" match
+_DEADLINE_TRIGGER_RE = re.compile(
+    r'\b(?:(?:due|deadline|eod|cob|asap|urgent|by\s+end\s+of|end\s+of\s+day)\b'
+    r'|submit|by\s+\d)',
+    re.IGNORECASE
+)
+
+# Urgency keywords by level, most urgent first
+_URGENCY_KEYWORDS = {
+    'critical': ['critical', 'asap', 'immediately', 'urgent'],
+    'high': ['urgent', 'important', 'priority', 'soon'],
+    'medium': ['needed', 'required', 'please'],
+    'low': ['when possible', 'at your convenience']
+}
+
+# Most urgent level for each keyword, and the rank used to pick between levels
+_URGENCY_LEVEL = {}
+for _level, _keywords in reversed(_URGENCY_KEYWORDS.items()):
+    _URGENCY_LEVEL.update(dict.fromkeys(_keywords, _level))
+_URGENCY_RANK = {level: rank for rank, level in enumerate(reversed(_URGENCY_KEYWORDS))}
+
+# All urgency keywords in one lookahead pattern, so overlapping hits are still seen
+_URGENCY_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in _URGENCY_LEVEL) + '))',
+    re.IGNORECASE
+)
+
+# Deadline extraction prompt for a batch of emails; braces in the JSON example
+# are doubled for str.format
+_DEADLINE_PROMPT_TEMPLATE = """
+            Analyze the following {count} emails to extract any deadlines, due dates, or time-sensitive requirements:
+            {emails}
+            Please identify any deadlines and respond with a JSON array containing one object per email:
+            [
+                {{
+                    "email_id": "the id after EMAIL in the email's header",
+                    "deadlines": [
+                        {{
+                            "description": "brief description of what's due",
+                            "due_date": "YYYY-MM-DD HH:MM",
+                            "urgency": "low/medium/high/critical",
+                            "type": "deadline/meeting/submission/payment/response_required",
+                            "confidence": 0.0-1.0
+                        }}
+                    ]
+                }}
+            ]
+            
+            Look for patterns like:
+            - "due by", "deadline", "must be completed by"
+            - Specific dates and times
+            - "end of day", "EOD", "COB"
+            - Meeting times and dates
+            - Payment due dates
+            - Project milestones
+            """
+
+# One email's section of _DEADLINE_PROMPT_TEMPLATE
+_DEADLINE_EMAIL_TEMPLATE = """
+--- EMAIL {id} ---
+From: {sender}
+Subject: {subject}
+Date: {date}
+Content: {content}
+"""
+
+# Formats tried, in order, for due dates returned by the AI
+_AI_DATE_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+
+# LRU cache of each email's raw AI deadlines, shared by all detectors; keyed
+# per email so a reprocessed email hits whatever batch it lands in
+_ai_cache: 'OrderedDict[str, Tuple]' = OrderedDict()
+_ai_cache_lock = threading.Lock()
+
+
+def _email_prompt_section(email: EmailData) -> str:
+    """Build an email's section of the deadline extraction prompt."""
+    content_snippet = email.content[:1500]
+    if len(email.content) > 1500:
+        content_snippet += "..."
+    return _DEADLINE_EMAIL_TEMPLATE.format(
+        id=email.id,
+        sender=email.sender,
+        subject=email.subject,
+        date=email.date,
+        content=content_snippet
+    )
+
+
+def _get_cached_deadlines(cache_key: str) -> Optional[List]:
+    """Get copies of an email's cached AI deadlines, or None if not cached."""
+    with _ai_cache_lock:
+        deadlines = _ai_cache.get(cache_key)
+        if deadlines is None:
+            return None
+        _ai_cache.move_to_end(cache_key)
+    # Validation fills in parsed fields, so callers get their own dicts
+    return [dict(deadline) if isinstance(deadline, dict) else deadline for deadline in deadlines]
+
+
+def _cache_deadlines(cache_key: str, deadlines: List):
+    """Store copies of an email's raw AI deadlines."""
+    stored = tuple(dict(deadline) if isinstance(deadline, dict) else deadline for deadline in deadlines)
+    with _ai_cache_lock:
+        _ai_cache[cache_key] = stored
+        if len(_ai_cache) > AI_CACHE_SIZE:
+            _ai_cache.popitem(last=False)
+
+
+class EscalationLevel(IntEnum):
+    """Overdue escalation levels, ordered from least to most severe."""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
+
+
+@dataclass(slots=True)
+class OverdueItem:
+    """An overdue follow-up with its escalation state."""
+    type: str
+    id: Optional[int]
+    title: str
+    description: str
+    due_date: Optional[datetime]
+    overdue_days: int
+    escalation: str
+    escalation_level: EscalationLevel
+    priority: str
+    notes: str = ""
+    recipient: str = ""
+    email_id: str = ""
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary."""
+        return asdict(self)
+
+
+def _parse_deadline_response(response: str) -> List[Dict]:
+    """
+    Get the per-email result objects from an AI deadline reply.
+    
+    Malformed or truncated replies keep every complete per-email object that
+    can still be decoded, so only the damaged emails need the keyword fallback.
+    """
+    # Skip the full decoder for replies that cannot be JSON
+    if response and response[0] in '[{':
+        try:
+            parsed = _json_loads(response)
+            if isinstance(parsed, dict):
+                parsed = [parsed]
+            if isinstance(parsed, list):
+                return [item for item in parsed if isinstance(item, dict)]
+            return []
+        except json.JSONDecodeError:
+            pass
+    
+    logger.warning("Failed to parse AI deadline extraction, salvaging complete results")
+    decoder = json.JSONDecoder()
+    results = []
+    pos = response.find('{')
+    while pos != -1:
+        try:
+            item, end = decoder.raw_decode(response, pos)
+        except json.JSONDecodeError:
+            # Damaged object; objects nested in it are tried next
+            pos = response.find('{', pos + 1)
+            continue
+        if isinstance(item, dict) and "email_id" in item:
+            results.append(item)
+        pos = response.find('{', end)
+    return results
+
+
+def _has_deadline_trigger(email: EmailData) -> bool:
+    """Check whether the part of an email the AI would see mentions a deadline."""
+    return bool(_DEADLINE_TRIGGER_RE.search(email.subject) or
+                _DEADLINE_TRIGGER_RE.search(email.content, 0, 1500))
+
+
+def _parse_numeric_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a date matched by _DEADLINE_RE, trying month-first then day-first.
+    
+    Two-digit years are taken as 20xx; mixed separators and three-digit years
+    are rejected.
+    """
+    separator = '/' if '/' in date_str else '-'
+    parts = date_str.split(separator)
+    if len(parts) != 3 or len(parts[2]) == 3:
+        return None
+    
+    first, second, year = int(parts[0]), int(parts[1]), int(parts[2])
+    if year < 100:
+        year += 2000
+    
+    for month, day in ((first, second), (second, first)):
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            continue
+    return None
+
+
+def _escalation_for(overdue_days: int) -> str:
+    """Get the escalation level for an item overdue by the given number of days."""
+    return _ESCALATION_LEVELS[bisect.bisect_left(_ESCALATION_THRESHOLDS, overdue_days)]
+
+
+def _detect_urgency(*texts: str) -> str:
+    """Get the most urgent level whose keywords appear in any text, defaulting to medium."""
+    urgency = None
+    for text in texts:
+        for match in _URGENCY_RE.finditer(text):
+            level = _URGENCY_LEVEL[match.group(1).lower()]
+            if level == 'critical':
+                return level
+            if urgency is None or _URGENCY_RANK[level] > _URGENCY_RANK[urgency]:
+                urgency = level
+    return urgency or 'medium'
+
 
 class OverdueDetector:
     """Detects and manages overdue tasks and deadlines from emails."""
     
     def __init__(self, advanced_db: Optional[AdvancedDatabase] = None,
-                 ai_service: Optional[GeminiEmailAI] = None):
-        """Initialize the overdue detector."""
+                 ai_service: Optional[GeminiEmailAI] = None,
+                 max_concurrent_requests: int = 4):
+        """
+        Initialize the overdue detector.
+        
+        Args:
+            advanced_db: Database for follow-ups, created if not given
+            ai_service: AI service for deadline extraction, created if not given
+            max_concurrent_requests: Number of AI requests in flight at once
+        """
         self.advanced_db = advanced_db or AdvancedDatabase()
         self.ai_service = ai_service or GeminiEmailAI()
+        self.max_concurrent_requests = max_concurrent_requests
+        
+        # Incrementally maintained overdue summary (see on_task_changed)
+        self._summary_lock = threading.Lock()
+        self._summary_cache: Optional[Dict] = None
+        self._summary_built_at = 0.0
+        self._summary_overdue_days = 0
+        self._delta_since_rebuild = 0
         
     def extract_deadlines(self, email: EmailData) -> List[Dict]:
         """
@@ -33,142 +325,175 @@ class OverdueDetector:
         Returns:
             List of deadline dictionaries
         """
+        return self.extract_deadlines_batch([email])[0]
+    
+    def extract_deadlines_batch(self, emails: List[EmailData]) -> List[List[Dict]]:
+        """
+        Extract deadlines from several emails, one AI request per batch.
+        
+        Emails that mention nothing deadline-like skip the AI and only get the
+        regex fallback, emails already answered by the AI reuse the cached
+        result, and the rest are sent in batches concurrently up to
+        max_concurrent_requests.
+        
+        Args:
+            emails: Emails to analyze
+            
+        Returns:
+            List of deadline dictionary lists, in the same order as emails
+        """
+        results: List[List[Dict]] = [[] for _ in emails]
+        # (index, prompt section, cache key) of emails that need the AI
+        pending = []
+        for i, email in enumerate(emails):
+            if not _has_deadline_trigger(email):
+                results[i] = self._fallback_deadline_extraction(email)
+                continue
+            
+            section = _email_prompt_section(email)
+            cache_key = hashlib.blake2b(section.encode(), digest_size=16).hexdigest()
+            cached = _get_cached_deadlines(cache_key)
+            if cached is not None:
+                results[i] = self._validate_deadlines(email, cached)
+            else:
+                pending.append((i, section, cache_key))
+        
+        batches = [pending[start:start + DEADLINE_BATCH_SIZE]
+                   for start in range(0, len(pending), DEADLINE_BATCH_SIZE)]
+        
+        def extract(batch: List[Tuple[int, str, str]]) -> List[List[Dict]]:
+            return self._extract_deadlines_batch(
+                [(emails[i], section, cache_key) for i, section, cache_key in batch]
+            )
+        
+        if len(batches) > 1 and self.max_concurrent_requests > 1:
+            workers = min(self.max_concurrent_requests, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_results = list(executor.map(extract, batches))
+        else:
+            batch_results = [extract(batch) for batch in batches]
+        
+        for batch, deadlines_list in zip(batches, batch_results):
+            for (i, _, _), deadlines in zip(batch, deadlines_list):
+                results[i] = deadlines
+        
+        return results
+    
+    def _extract_deadlines_batch(self, batch: List[Tuple[EmailData, str, str]]) -> List[List[Dict]]:
+        """
+        Extract deadlines from one batch of emails with a single AI request.
+        
+        Args:
+            batch: (email, prompt section, cache key) for each email
+            
+        Returns:
+            List of deadline dictionary lists, in the same order as batch
+        """
         try:
             # Create deadline extraction prompt
-            prompt = f"""
-            Analyze the following email to extract any deadlines, due dates, or time-sensitive requirements:
-            
-            From: {email.sender}
-            Subject: {email.subject}
-            Date: {email.date}
-            Content: {email.content[:1500]}...
-            
-            Please identify any deadlines and respond in JSON format:
-            {{
-                "deadlines": [
-                    {{
-                        "description": "brief description of what's due",
-                        "due_date": "YYYY-MM-DD HH:MM",
-                        "urgency": "low/medium/high/critical",
-                        "type": "deadline/meeting/submission/payment/response_required",
-                        "confidence": 0.0-1.0
-                    }}
-                ]
-            }}
+            emails_text = "".join(section for _, section, _ in batch)
+            prompt = _DEADLINE_PROMPT_TEMPLATE.format(count=len(batch), emails=emails_text)
+            response = self.ai_service.generate_content(
+                prompt, max_output_tokens=DEADLINE_TOKENS_PER_EMAIL * len(batch)
+            )
             
-            Look for patterns like:
-            - "due by", "deadline", "must be completed by"
-            - Specific dates and times
-            - "end of day", "EOD", "COB"
-            - Meeting times and dates
-            - Payment due dates
-            - Project milestones
-            """
+            response = response.strip()
+            if response.startswith('```json'):
+                response = response[7:-3].strip()
+            elif response.startswith('```'):
+                response = response[3:-3].strip()
             
-            response = self.ai_service.generate_content(prompt)
+            deadlines_by_id = {
+                str(item.get("email_id")): item.get("deadlines", [])
+                for item in _parse_deadline_response(response)
+            }
             
-            try:
-                result = json.loads(response)
-                deadlines = result.get("deadlines", [])
-                
-                # Validate and parse dates
-                validated_deadlines = []
-                for deadline in deadlines:
+        except Exception as e:
+            logger.error("Error extracting deadlines: {}", e)
+            deadlines_by_id = {}
+        
+        # Fall back per email for anything missing from the response; only
+        # answers from the AI are cached
+        results = []
+        for email, _, cache_key in batch:
+            deadlines = deadlines_by_id.get(str(email.id))
+            if isinstance(deadlines, list):
+                _cache_deadlines(cache_key, deadlines)
+                results.append(self._validate_deadlines(email, deadlines))
+            else:
+                results.append(self._fallback_deadline_extraction(email))
+        
+        return results
+    
+    def _validate_deadlines(self, email: EmailData, deadlines: List[Dict]) -> List[Dict]:
+        """Parse the due dates of AI-extracted deadlines, dropping any that do not parse."""
+        validated_deadlines = []
+        for deadline in deadlines:
+            if not isinstance(deadline, dict):
+                continue
+            due_date_str = deadline.get("due_date", "")
+            if not due_date_str or not isinstance(due_date_str, str):
+                continue
+            
+            # The prompt asks for ISO dates, which fromisoformat parses far more
+            # cheaply than strptime; other shapes go through the formats
+            due_date = None
+            if len(due_date_str) in (10, 16):
+                try:
+                    due_date = datetime.fromisoformat(due_date_str)
+                except ValueError:
+                    pass
+            if due_date is None:
+                for date_format in _AI_DATE_FORMATS:
                     try:
-                        due_date_str = deadline.get("due_date", "")
-                        if due_date_str:
-                            # Try to parse the date
-                            due_date = datetime.strptime(due_date_str, "%Y-%m-%d %H:%M")
-                            deadline["due_date"] = due_date
-                            deadline["email_id"] = email.id
-                            deadline["email_subject"] = email.subject
-                            deadline["email_sender"] = email.sender
-                            validated_deadlines.append(deadline)
+                        due_date = datetime.strptime(due_date_str, date_format)
+                        break
                     except ValueError:
-                        # Try alternative date formats
-                        try:
-                            due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
-                            deadline["due_date"] = due_date
-                            deadline["email_id"] = email.id
-                            deadline["email_subject"] = email.subject
-                            deadline["email_sender"] = email.sender
-                            validated_deadlines.append(deadline)
-                        except ValueError:
-                            logger.warning(f"Could not parse deadline date: {due_date_str}")
-                            continue
-                
-                return validated_deadlines
-                
-            except json.JSONDecodeError:
-                logger.warning("Failed to parse AI deadline extraction, using fallback")
-                return self._fallback_deadline_extraction(email)
-                
-        except Exception as e:
-            logger.error(f"Error extracting deadlines: {e}")
-            return self._fallback_deadline_extraction(email)
+                        continue
+                else:
+                    logger.warning("Could not parse deadline date: {}", due_date_str)
+                    continue
+            
+            deadline["due_date"] = due_date
+            deadline["email_id"] = email.id
+            deadline["email_subject"] = email.subject
+            deadline["email_sender"] = email.sender
+            validated_deadlines.append(deadline)
+        
+        return validated_deadlines
     
     def _fallback_deadline_extraction(self, email: EmailData) -> List[Dict]:
         """Fallback deadline extraction using regex patterns."""
-        content = email.content.lower()
-        subject = email.subject.lower()
-        text_to_analyze = f"{subject} {content}"
+        urgency = None
         
         deadlines = []
         
-        # Common deadline patterns
-        deadline_patterns = [
-            r'due\s+(?:by\s+)?(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-            r'deadline\s+(?:is\s+)?(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-            r'must\s+be\s+(?:completed|submitted|sent)\s+by\s+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-            r'(?:end\s+of\s+day|eod)\s+(?:on\s+)?(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-            r'by\s+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-        ]
-        
-        urgency_keywords = {
-            'critical': ['critical', 'asap', 'immediately', 'urgent'],
-            'high': ['urgent', 'important', 'priority', 'soon'],
-            'medium': ['needed', 'required', 'please'],
-            'low': ['when possible', 'at your convenience']
-        }
-        
-        for pattern in deadline_patterns:
-            matches = re.finditer(pattern, text_to_analyze)
-            for match in matches:
-                date_str = match.group(1)
-                try:
-                    # Try to parse the date
-                    for date_format in ['%m/%d/%Y', '%m-%d-%Y', '%d/%m/%Y', '%d-%m-%Y']:
-                        try:
-                            due_date = datetime.strptime(date_str, date_format)
-                            if due_date.year < 100:  # Handle 2-digit years
-                                due_date = due_date.replace(year=due_date.year + 2000)
-                            
-                            # Determine urgency
-                            urgency = 'medium'
-                            for level, keywords in urgency_keywords.items():
-                                if any(keyword in text_to_analyze for keyword in keywords):
-                                    urgency = level
-                                    break
-                            
-                            deadlines.append({
-                                'description': f'Deadline from: {email.subject[:50]}...',
-                                'due_date': due_date,
-                                'urgency': urgency,
-                                'type': 'deadline',
-                                'confidence': 0.7,
-                                'email_id': email.id,
-                                'email_subject': email.subject,
-                                'email_sender': email.sender
-                            })
-                            break
-                        except ValueError:
-                            continue
-                except Exception:
-                    continue
+        # Subject and content are scanned in place rather than joined into a copy
+        matches = itertools.chain(_DEADLINE_RE.finditer(email.subject),
+                                  _DEADLINE_RE.finditer(email.content))
+        for match in matches:
+            due_date = _parse_numeric_date(match.group('date'))
+            if due_date is None:
+                continue
+            
+            # Determine urgency once per email, on the first deadline
+            if urgency is None:
+                urgency = _detect_urgency(email.subject, email.content)
+            
+            deadlines.append({
+                'description': f'Deadline from: {email.subject[:50]}...',
+                'due_date': due_date,
+                'urgency': urgency,
+                'type': 'deadline',
+                'confidence': 0.7,
+                'email_id': email.id,
+                'email_subject': email.subject,
+                'email_sender': email.sender
+            })
         
         return deadlines
     
-    def check_overdue_items(self) -> List[Dict]:
+    def check_overdue_items(self) -> List[OverdueItem]:
         """
         Check for overdue follow-ups and deadlines.
         
@@ -177,92 +502,141 @@ class OverdueDetector:
         """
         try:
             current_time = datetime.now()
+            today_ordinal = current_time.toordinal()
+            time_of_day = current_time.time()
             overdue_items = []
             
-            # Get overdue follow-ups from database
-            overdue_followups = self.advanced_db.get_overdue_follow_ups()
+            # Stream overdue follow-ups from the database as plain rows
+            overdue_rows = self.advanced_db.iter_overdue_follow_ups()
             
-            for followup in overdue_followups:
-                overdue_days = (current_time - followup.follow_up_date).days if followup.follow_up_date else 0
+            for followup_id, subject, recipient, due, priority, notes, email_id in overdue_rows:
+                # Whole days elapsed: calendar days, less one if the due time
+                # of day has not come round yet today
+                overdue_days = today_ordinal - due.toordinal() - (due.time() > time_of_day) if due else 0
                 
                 # Determine escalation level based on how overdue it is
-                if overdue_days <= 1:
-                    escalation = "low"
-                elif overdue_days <= 3:
-                    escalation = "medium"  
-                elif overdue_days <= 7:
-                    escalation = "high"
-                else:
-                    escalation = "critical"
+                escalation = _escalation_for(overdue_days)
                 
-                overdue_items.append({
-                    'type': 'followup',
-                    'id': followup.id,
-                    'title': f"Follow-up: {followup.subject}",
-                    'description': f"Follow-up with {followup.recipient}",
-                    'due_date': followup.follow_up_date,
-                    'overdue_days': overdue_days,
-                    'escalation': escalation,
-                    'priority': followup.priority,
-                    'notes': followup.notes,
-                    'recipient': followup.recipient,
-                    'email_id': followup.email_id
-                })
+                overdue_items.append(OverdueItem(
+                    type='followup',
+                    id=followup_id,
+                    title=f"Follow-up: {subject}",
+                    description=f"Follow-up with {recipient}",
+                    due_date=due,
+                    overdue_days=overdue_days,
+                    escalation=escalation,
+                    escalation_level=EscalationLevel[escalation.upper()],
+                    priority=priority,
+                    notes=notes,
+                    recipient=recipient,
+                    email_id=email_id
+                ))
             
             return overdue_items
             
         except Exception as e:
-            logger.error(f"Error checking overdue items: {e}")
+            logger.error("Error checking overdue items: {}", e)
             return []
     
-    def escalate_overdue_item(self, item: Dict) -> bool:
+    def escalate_overdue_item(self, item: OverdueItem) -> bool:
         """
         Escalate an overdue item based on its priority and days overdue.
         
         Args:
-            item: Overdue item dictionary
+            item: Overdue item
             
         Returns:
             True if escalated successfully, False otherwise
         """
         try:
-            overdue_days = item.get('overdue_days', 0)
-            current_escalation = item.get('escalation', 'low')
+            overdue_days = item.overdue_days
+            current_escalation = item.escalation
             
-            # Determine new escalation level
-            new_escalation = current_escalation
-            action_taken = False
+            # Determine new escalation level; only ever move up
+            target_rank = bisect.bisect_left(_ESCALATION_THRESHOLDS, overdue_days)
+            current_rank = _ESCALATION_RANK.get(current_escalation, 0)
             
-            if overdue_days > 7 and current_escalation != 'critical':
-                new_escalation = 'critical'
-                action_taken = True
-                logger.warning(f"Escalating item {item.get('id')} to CRITICAL after {overdue_days} days")
+            if target_rank > current_rank:
+                new_escalation = _ESCALATION_LEVELS[target_rank]
+                # Messages are formatted by loguru only if the level is enabled
+                log = logger.info if new_escalation == 'medium' else logger.warning
+                log("Escalating item {} to {} after {} days", item.id, new_escalation.upper(), overdue_days)
                 
-            elif overdue_days > 3 and current_escalation not in ['high', 'critical']:
-                new_escalation = 'high'
-                action_taken = True
-                logger.warning(f"Escalating item {item.get('id')} to HIGH after {overdue_days} days")
+                self.on_task_changed(item, replace(
+                    item,
+                    escalation=new_escalation,
+                    escalation_level=EscalationLevel[new_escalation.upper()]
+                ))
                 
-            elif overdue_days > 1 and current_escalation not in ['medium', 'high', 'critical']:
-                new_escalation = 'medium'
-                action_taken = True
-                logger.info(f"Escalating item {item.get('id')} to MEDIUM after {overdue_days} days")
-            
-            if action_taken:
                 # Update escalation in database if it's a follow-up
-                if item.get('type') == 'followup':
+                if item.type == 'followup':
                     # Note: This would require an update escalation method in the database
                     # For now, we'll just log the escalation
-                    logger.info(f"Item {item.get('id')} escalated to {new_escalation}")
+                    logger.info("Item {} escalated to {}", item.id, new_escalation)
                 
                 return True
             
             return False
             
         except Exception as e:
-            logger.error(f"Error escalating overdue item: {e}")
+            logger.error("Error escalating overdue item: {}", e)
             return False
     
+    def escalate_items(self, items: List[OverdueItem]) -> int:
+        """
+        Escalate several overdue items in one pass.
+        
+        Args:
+            items: Overdue items
+            
+        Returns:
+            Number of items escalated
+        """
+        escalated_count = 0
+        for item in items:
+            if self.escalate_overdue_item(item):
+                escalated_count += 1
+        return escalated_count
+    
+    def on_task_changed(self, old: Optional[OverdueItem], new: Optional[OverdueItem]):
+        """
+        Apply a single overdue item change to the cached summary.
+        
+        Args:
+            old: Overdue item before the change, or None if it was added
+            new: Overdue item after the change, or None if it was resolved
+        """
+        with self._summary_lock:
+            summary = self._summary_cache
+            if summary is None:
+                return
+            
+            for item, sign in ((old, -1), (new, 1)):
+                if item is None:
+                    continue
+                summary['total_overdue'] += sign
+                if item.escalation in summary['escalation_breakdown']:
+                    summary['escalation_breakdown'][item.escalation] += sign
+                if item.priority in summary['priority_breakdown']:
+                    summary['priority_breakdown'][item.priority] += sign
+                self._summary_overdue_days += sign * item.overdue_days
+            
+            escalation_counts = summary['escalation_breakdown']
+            total = summary['total_overdue']
+            summary['average_overdue_days'] = round(self._summary_overdue_days / total, 1) if total else 0
+            summary['critical_items'] = escalation_counts['critical']
+            summary['needs_immediate_attention'] = escalation_counts['critical'] + escalation_counts['high']
+            
+            # Too many deltas: drift is likely, so rebuild on next access
+            self._delta_since_rebuild += 1
+            if self._delta_since_rebuild > SUMMARY_REBUILD_RATIO * total:
+                self._summary_cache = None
+    
+    def invalidate_summary(self):
+        """Force the next summary request to rebuild from the database."""
+        with self._summary_lock:
+            self._summary_cache = None
+    
     def get_overdue_summary(self) -> Dict:
         """
         Get a summary of all overdue items.
@@ -270,41 +644,37 @@ class OverdueDetector:
         Returns:
             Dictionary with overdue statistics
         """
+        with self._summary_lock:
+            summary = self._summary_cache
+            if summary is not None and time.monotonic() - self._summary_built_at < SUMMARY_MAX_AGE:
+                return {
+                    **summary,
+                    'escalation_breakdown': dict(summary['escalation_breakdown']),
+                    'priority_breakdown': dict(summary['priority_breakdown'])
+                }
+        
         try:
-            overdue_items = self.check_overdue_items()
-            
-            # Categorize by escalation level
-            escalation_counts = {
-                'low': 0,
-                'medium': 0, 
-                'high': 0,
-                'critical': 0
-            }
+            # Aggregated in the database; only the UI needs the items themselves
+            count_rows = self.advanced_db.get_overdue_follow_up_counts()
             
-            priority_counts = {
-                'low': 0,
-                'medium': 0,
-                'high': 0,
-                'urgent': 0
-            }
+            # Categorize by escalation level and priority
+            escalation_counter = Counter()
+            priority_counter = Counter()
+            for row in count_rows:
+                escalation_counter[_escalation_for(row['overdue_days'])] += row['count']
+                priority_counter[row['priority'] or 'medium'] += row['count']
             
-            total_overdue_days = 0
+            escalation_counts = {level: escalation_counter[level] for level in _ESCALATION_LEVELS}
+            priority_counts = {priority: priority_counter[priority]
+                               for priority in ('low', 'medium', 'high', 'urgent')}
             
-            for item in overdue_items:
-                escalation = item.get('escalation', 'low')
-                if escalation in escalation_counts:
-                    escalation_counts[escalation] += 1
-                
-                priority = item.get('priority', 'medium')
-                if priority in priority_counts:
-                    priority_counts[priority] += 1
-                
-                total_overdue_days += item.get('overdue_days', 0)
+            total_overdue = sum(row['count'] for row in count_rows)
+            total_overdue_days = sum(row['overdue_days'] * row['count'] for row in count_rows)
             
-            average_overdue_days = total_overdue_days / len(overdue_items) if overdue_items else 0
+            average_overdue_days = total_overdue_days / total_overdue if total_overdue else 0
             
-            return {
-                'total_overdue': len(overdue_items),
+            summary = {
+                'total_overdue': total_overdue,
                 'escalation_breakdown': escalation_counts,
                 'priority_breakdown': priority_counts,
                 'average_overdue_days': round(average_overdue_days, 1),
@@ -312,6 +682,18 @@ class OverdueDetector:
                 'needs_immediate_attention': escalation_counts['critical'] + escalation_counts['high']
             }
             
+            with self._summary_lock:
+                self._summary_cache = summary
+                self._summary_built_at = time.monotonic()
+                self._summary_overdue_days = total_overdue_days
+                self._delta_since_rebuild = 0
+            
+            return {
+                **summary,
+                'escalation_breakdown': dict(escalation_counts),
+                'priority_breakdown': dict(priority_counts)
+            }
+            
         except Exception as e:
             logger.error(f"Error getting overdue summary: {e}")
             return {
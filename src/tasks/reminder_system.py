@@ -3,7 +3,14 @@ Smart reminder system with context-aware scheduling and AI-powered timing.
 Provides intelligent reminders based on user patterns and email context.
 """
 
+import hashlib
 import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from loguru import logger
@@ -13,14 +20,190 @@ from ..core.email_service import EmailData
 from ..ai.gemini_service import GeminiEmailAI
 
 
+# Seconds user patterns (and their JSON form) are reused before being fetched again
+USER_PATTERNS_TTL = 300
+
+# Number of raw AI reminder analyses kept, keyed by a hash of the prompt
+AI_CACHE_SIZE = 2048
+
+# LRU cache of raw AI reminder analyses, shared by all reminder systems
+_ai_cache: 'OrderedDict[str, str]' = OrderedDict()
+_ai_cache_lock = threading.Lock()
+
+# Keyword categories for the fallback analysis, as bit flags
+_NEEDS_REMINDER = 1
+_MEETING = 2
+_DEADLINE = 4
+_IMPORTANT = 8
+_FOLLOW = 16
+_ALL_CATEGORIES = _NEEDS_REMINDER | _MEETING | _DEADLINE | _IMPORTANT | _FOLLOW
+
+# Keywords for each fallback category, matched case-insensitively as substrings
+_CATEGORY_KEYWORDS = {
+    _NEEDS_REMINDER: [
+        'deadline', 'due date', 'meeting', 'appointment', 'schedule',
+        'reminder', 'don\'t forget', 'remember', 'important',
+        'urgent', 'follow up', 'check in'
+    ],
+    _MEETING: ['meeting', 'call', 'conference', 'zoom', 'teams'],
+    _DEADLINE: ['deadline', 'due', 'submit', 'complete by'],
+    _IMPORTANT: ['important', 'urgent', 'priority', 'critical'],
+    _FOLLOW: ['follow']
+}
+
+# Categories hit by each keyword; a keyword also carries the categories of any
+# keyword it starts with, since only one alternative is reported per position
+_KEYWORD_CATEGORIES = {}
+for _category, _keywords in _CATEGORY_KEYWORDS.items():
+    for _keyword in _keywords:
+        for _other_category, _other_keywords in _CATEGORY_KEYWORDS.items():
+            if any(_keyword.startswith(_prefix) for _prefix in _other_keywords):
+                _KEYWORD_CATEGORIES[_keyword] = _KEYWORD_CATEGORIES.get(_keyword, 0) | _other_category
+
+# All fallback keywords in one lookahead pattern, longest first, so the text is
+# scanned once and overlapping keywords are still seen; matched against
+# lowercased text, which is much cheaper than a case-insensitive pattern
+_CATEGORY_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in
+                      sorted(_KEYWORD_CATEGORIES, key=len, reverse=True)) + '))'
+)
+
+# Formats tried, in order, for reminder times returned by the AI
+_AI_DATE_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+# Fallback (first, second) reminder offsets from now by reminder type
+_FALLBACK_REMINDER_OFFSETS = {
+    "meeting": (timedelta(hours=24), timedelta(hours=2)),  # 1 day before, 2 hours before
+    "deadline": (timedelta(days=2), timedelta(days=1)),    # 2 days before, 1 day before
+}
+_DEFAULT_REMINDER_OFFSETS = (timedelta(days=1), None)      # Next day
+
+# Reminder title prefix by reminder type
+_TITLE_PREFIXES = {
+    "meeting": "Meeting Reminder: ",
+    "deadline": "Deadline Reminder: ",
+    "followup": "Follow-up Reminder: ",
+}
+
+# Snooze options as (minutes, label), offered by default and for deadlines
+_BASE_SNOOZES = ((15, "15 minutes"), (30, "30 minutes"), (60, "1 hour"), (120, "2 hours"))
+_DEADLINE_SNOOZES = ((240, "4 hours"), (480, "8 hours"), (1440, "Tomorrow"))
+
+# Most snooze suggestions offered for one reminder
+MAX_SNOOZE_SUGGESTIONS = 6
+
+# The needs_reminder verdict, found in a streamed AI response as soon as it arrives
+_NEEDS_REMINDER_VALUE_RE = re.compile(r'"needs_reminder"\s*:\s*(true|false)', re.IGNORECASE)
+
+# Analysis cached and returned when the AI says no reminder is needed
+_NO_REMINDER_RESPONSE = json.dumps({
+    "needs_reminder": False,
+    "reminder_type": "none",
+    "optimal_timing": {},
+    "priority": "low",
+    "context": "AI found no reminder needed",
+    "frequency": "once",
+    "suggested_snooze": [15, 30, 60]
+})
+
+# Per-email part of the reminder analysis prompt, filled in with str.format
+_REMINDER_PROMPT_HEADER = """
+            Analyze the following email to determine if it needs reminders and optimal timing:
+            
+            From: {sender}
+            Subject: {subject}
+            Date: {date}
+            Content: {content}
+            
+            User patterns: {user_patterns}
+            
+"""
+
+# Static JSON schema and guidance appended to every reminder prompt as is
+_REMINDER_PROMPT_SCHEMA = """
+            Please analyze and respond in JSON format:
+            {
+                "needs_reminder": true/false,
+                "reminder_type": "followup/deadline/meeting/important_email/custom",
+                "optimal_timing": {
+                    "first_reminder": "YYYY-MM-DD HH:MM",
+                    "second_reminder": "YYYY-MM-DD HH:MM" (optional),
+                    "final_reminder": "YYYY-MM-DD HH:MM" (optional)
+                },
+                "priority": "low/medium/high/urgent",
+                "context": "brief explanation of why reminders are needed",
+                "frequency": "once/daily/weekly/custom",
+                "suggested_snooze": [15, 30, 60, 120] (minutes options)
+            }
+            
+            Consider:
+            - User's typical response times
+            - Email importance and sender
+            - Deadlines mentioned in content
+            - Meeting scheduling needs
+            - User's work schedule patterns
+            """
+
+
+@dataclass(slots=True, frozen=True)
+class SnoozeSuggestion:
+    """A suggested snooze duration with its display label."""
+    minutes: int
+    label: str
+
+
+def _parse_ai_datetime(date_str: str) -> Optional[datetime]:
+    """Parse a reminder time from the AI, or None if it is not in a known format."""
+    # The prompt asks for ISO times, which fromisoformat parses far more cheaply
+    # than strptime; the length check keeps out the wider forms it accepts
+    if len(date_str) in (10, 16):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    for date_format in _AI_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def _keyword_categories(*texts: str) -> int:
+    """Get the category flags of the fallback keywords found in any text."""
+    found = 0
+    for text in texts:
+        for match in _CATEGORY_KEYWORD_RE.finditer(text.lower()):
+            found |= _KEYWORD_CATEGORIES[match.group(1)]
+            if found == _ALL_CATEGORIES:
+                return found
+    return found
+
+
 class ReminderSystem:
     """Intelligent reminder system with context-aware scheduling."""
     
     def __init__(self, advanced_db: Optional[AdvancedDatabase] = None,
-                 ai_service: Optional[GeminiEmailAI] = None):
-        """Initialize the reminder system."""
+                 ai_service: Optional[GeminiEmailAI] = None,
+                 max_concurrent_requests: int = 4):
+        """
+        Initialize the reminder system.
+        
+        Args:
+            advanced_db: Database for reminders, created if not given
+            ai_service: AI service for reminder analysis, created if not given
+            max_concurrent_requests: Number of AI requests in flight at once
+        """
         self.advanced_db = advanced_db or AdvancedDatabase()
         self.ai_service = ai_service or GeminiEmailAI()
+        self.max_concurrent_requests = max_concurrent_requests
+        
+        # (fetched at, patterns, patterns as JSON) from _get_user_patterns
+        self._user_patterns_cache: Optional[Tuple[float, Dict, str]] = None
+        
+    def invalidate_user_patterns(self):
+        """Drop cached user patterns after the user's profile changes."""
+        self._user_patterns_cache = None
         
     def analyze_reminder_needs(self, email: EmailData, user_patterns: Dict = None) -> Dict:
         """
@@ -34,45 +217,40 @@ class ReminderSystem:
             Dictionary with reminder analysis results
         """
         try:
-            # Get user patterns if not provided
+            # Get user patterns if not provided, reusing their cached JSON form
             if not user_patterns:
                 user_patterns = self._get_user_patterns()
+            cached = self._user_patterns_cache
+            if cached is not None and cached[1] is user_patterns:
+                user_patterns_json = cached[2]
+            else:
+                user_patterns_json = json.dumps(user_patterns, default=str)
             
             # Create reminder analysis prompt
-            prompt = f"""
-            Analyze the following email to determine if it needs reminders and optimal timing:
-            
-            From: {email.sender}
-            Subject: {email.subject}
-            Date: {email.date}
-            Content: {email.content[:1200]}...
-            
-            User patterns: {json.dumps(user_patterns, default=str)}
+            content_snippet = email.content[:1200]
+            if len(email.content) > 1200:
+                content_snippet += "..."
+            prompt = _REMINDER_PROMPT_HEADER.format(
+                sender=email.sender,
+                subject=email.subject,
+                date=email.date,
+                content=content_snippet,
+                user_patterns=user_patterns_json
+            ) + _REMINDER_PROMPT_SCHEMA
             
-            Please analyze and respond in JSON format:
-            {{
-                "needs_reminder": true/false,
-                "reminder_type": "followup/deadline/meeting/important_email/custom",
-                "optimal_timing": {{
-                    "first_reminder": "YYYY-MM-DD HH:MM",
-                    "second_reminder": "YYYY-MM-DD HH:MM" (optional),
-                    "final_reminder": "YYYY-MM-DD HH:MM" (optional)
-                }},
-                "priority": "low/medium/high/urgent",
-                "context": "brief explanation of why reminders are needed",
-                "frequency": "once/daily/weekly/custom",
-                "suggested_snooze": [15, 30, 60, 120] (minutes options)
-            }}
-            
-            Consider:
-            - User's typical response times
-            - Email importance and sender
-            - Deadlines mentioned in content
-            - Meeting scheduling needs
-            - User's work schedule patterns
-            """
+            # Reprocessed emails produce the same prompt, so reuse the earlier response
+            cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+            with _ai_cache_lock:
+                response = _ai_cache.get(cache_key)
+                if response is not None:
+                    _ai_cache.move_to_end(cache_key)
             
-            response = self.ai_service.generate_content(prompt)
+            if response is None:
+                response = self._stream_reminder_response(prompt)
+                with _ai_cache_lock:
+                    _ai_cache[cache_key] = response
+                    if len(_ai_cache) > AI_CACHE_SIZE:
+                        _ai_cache.popitem(last=False)
             
             try:
                 analysis = json.loads(response)
@@ -81,15 +259,9 @@ class ReminderSystem:
                 optimal_timing = analysis.get("optimal_timing", {})
                 for key, date_str in optimal_timing.items():
                     if date_str:
-                        try:
-                            optimal_timing[key] = datetime.strptime(date_str, "%Y-%m-%d %H:%M")
-                        except ValueError:
-                            # Try alternative format
-                            try:
-                                optimal_timing[key] = datetime.strptime(date_str, "%Y-%m-%d")
-                            except ValueError:
-                                logger.warning(f"Could not parse reminder date: {date_str}")
-                                optimal_timing[key] = None
+                        optimal_timing[key] = _parse_ai_datetime(date_str)
+                        if optimal_timing[key] is None:
+                            logger.warning(f"Could not parse reminder date: {date_str}")
                 
                 return analysis
                 
@@ -101,24 +273,61 @@ class ReminderSystem:
             logger.error(f"Error analyzing reminder needs: {e}")
             return self._fallback_reminder_analysis(email, user_patterns)
     
+    def _stream_reminder_response(self, prompt: str) -> str:
+        """
+        Get the AI's reminder analysis, stopping the stream once it says no reminder is needed.
+        
+        The schema puts needs_reminder first, and a false there discards the
+        rest of the analysis, so most emails only wait for the first few tokens.
+        """
+        chunks = []
+        decided = False
+        for chunk in self.ai_service.stream_content(prompt):
+            chunks.append(chunk)
+            if decided:
+                continue
+            
+            match = _NEEDS_REMINDER_VALUE_RE.search("".join(chunks))
+            if match:
+                if match.group(1).lower() == "false":
+                    return _NO_REMINDER_RESPONSE
+                decided = True
+        
+        return "".join(chunks)
+    
+    def analyze_reminder_needs_batch(self, emails: List[EmailData],
+                                     user_patterns: Dict = None) -> List[Dict]:
+        """
+        Analyze several emails for reminders, with up to max_concurrent_requests AI requests in flight.
+        
+        Args:
+            emails: Emails to analyze
+            user_patterns: User's behavioral patterns (optional)
+            
+        Returns:
+            List of reminder analysis results, in the same order as emails
+        """
+        # Resolve patterns once so every prompt shares their cached JSON form
+        if not user_patterns:
+            user_patterns = self._get_user_patterns()
+        
+        def analyze(email: EmailData) -> Dict:
+            return self.analyze_reminder_needs(email, user_patterns)
+        
+        if len(emails) > 1 and self.max_concurrent_requests > 1:
+            workers = min(self.max_concurrent_requests, len(emails))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(analyze, emails))
+        
+        return [analyze(email) for email in emails]
+    
     def _fallback_reminder_analysis(self, email: EmailData, user_patterns: Dict = None) -> Dict:
         """Fallback reminder analysis using keyword detection."""
-        content_lower = email.content.lower()
-        subject_lower = email.subject.lower()
-        text_to_analyze = f"{subject_lower} {content_lower}"
+        # One pass over the subject and content finds every keyword category
+        categories = _keyword_categories(email.subject, email.content)
         
         # Check for reminder indicators
-        reminder_keywords = [
-            'deadline', 'due date', 'meeting', 'appointment', 'schedule',
-            'reminder', 'don\'t forget', 'remember', 'important',
-            'urgent', 'follow up', 'check in'
-        ]
-        
-        meeting_keywords = ['meeting', 'call', 'conference', 'zoom', 'teams']
-        deadline_keywords = ['deadline', 'due', 'submit', 'complete by']
-        important_keywords = ['important', 'urgent', 'priority', 'critical']
-        
-        needs_reminder = any(keyword in text_to_analyze for keyword in reminder_keywords)
+        needs_reminder = bool(categories & _NEEDS_REMINDER)
         
         if not needs_reminder:
             return {
@@ -133,31 +342,25 @@ class ReminderSystem:
         
         # Determine reminder type
         reminder_type = "custom"
-        if any(keyword in text_to_analyze for keyword in meeting_keywords):
+        if categories & _MEETING:
             reminder_type = "meeting"
-        elif any(keyword in text_to_analyze for keyword in deadline_keywords):
+        elif categories & _DEADLINE:
             reminder_type = "deadline"
-        elif 'follow' in text_to_analyze:
+        elif categories & _FOLLOW:
             reminder_type = "followup"
         else:
             reminder_type = "important_email"
         
         # Determine priority
         priority = "medium"
-        if any(keyword in text_to_analyze for keyword in important_keywords):
+        if categories & _IMPORTANT:
             priority = "high"
         
         # Calculate optimal timing based on type and user patterns
         now = datetime.now()
-        if reminder_type == "meeting":
-            first_reminder = now + timedelta(hours=24)  # 1 day before
-            second_reminder = now + timedelta(hours=2)   # 2 hours before
-        elif reminder_type == "deadline":
-            first_reminder = now + timedelta(days=2)     # 2 days before
-            second_reminder = now + timedelta(days=1)    # 1 day before
-        else:
-            first_reminder = now + timedelta(days=1)     # Next day
-            second_reminder = None
+        first_offset, second_offset = _FALLBACK_REMINDER_OFFSETS.get(reminder_type, _DEFAULT_REMINDER_OFFSETS)
+        first_reminder = now + first_offset
+        second_reminder = now + second_offset if second_offset else None
         
         return {
             "needs_reminder": True,
@@ -173,17 +376,25 @@ class ReminderSystem:
         }
     
     def _get_user_patterns(self) -> Dict:
-        """Get user behavioral patterns for reminder optimization."""
+        """Get user behavioral patterns for reminder optimization, cached for USER_PATTERNS_TTL seconds."""
+        cached = self._user_patterns_cache
+        if cached is not None and time.monotonic() - cached[0] < USER_PATTERNS_TTL:
+            return cached[1]
+        
         try:
             # This would typically come from user profile/analytics
             # For now, return default patterns
-            return {
+            user_patterns = {
                 "typical_work_hours": {"start": 9, "end": 17},
                 "average_response_time": "2 hours",
                 "preferred_reminder_time": "09:00",
                 "time_zone": "local",
                 "weekend_preferences": "no_reminders"
             }
+            self._user_patterns_cache = (
+                time.monotonic(), user_patterns, json.dumps(user_patterns, default=str)
+            )
+            return user_patterns
         except Exception as e:
             logger.error(f"Error getting user patterns: {e}")
             return {}
@@ -207,57 +418,117 @@ class ReminderSystem:
                 logger.info(f"No reminder needed for email {email.id}")
                 return 0
             
-            reminders_created = 0
-            optimal_timing = analysis.get("optimal_timing", {})
-            reminder_type = analysis.get("reminder_type", "custom")
-            priority = analysis.get("priority", "medium")
-            context = analysis.get("context", "")
-            
-            # Create reminders based on optimal timing
-            for reminder_key, reminder_time in optimal_timing.items():
-                if reminder_time and isinstance(reminder_time, datetime):
-                    # Create reminder title based on type
-                    if reminder_type == "meeting":
-                        title = f"Meeting Reminder: {email.subject[:50]}"
-                    elif reminder_type == "deadline":
-                        title = f"Deadline Reminder: {email.subject[:50]}"
-                    elif reminder_type == "followup":
-                        title = f"Follow-up Reminder: {email.subject[:50]}"
-                    else:
-                        title = f"Reminder: {email.subject[:50]}"
-                    
-                    # Create description
-                    description = f"{context}\\n\\nFrom: {email.sender}\\nOriginal: {email.subject}"
-                    
-                    # Create reminder object
-                    reminder = Reminder(
-                        email_id=email.id,
-                        thread_id=email.thread_id,
-                        title=title,
-                        description=description,
-                        reminder_time=reminder_time,
-                        status="active",
-                        reminder_type=reminder_type,
-                        created_at=datetime.now()
-                    )
-                    
-                    # Store in database
-                    reminder_id = self.advanced_db.create_reminder(reminder)
-                    
-                    if reminder_id > 0:
-                        reminders_created += 1
-                        logger.info(f"Created {reminder_key} reminder {reminder_id} for email {email.id}")
-            
-            return reminders_created
+            # Store all of the email's reminders in one transaction
+            keyed_reminders = self._build_reminders(email, analysis)
+            reminder_ids = self.advanced_db.create_reminders([reminder for _, reminder in keyed_reminders])
+            return self._count_created(email, keyed_reminders, reminder_ids)
             
         except Exception as e:
             logger.error(f"Error creating reminders: {e}")
             return 0
     
+    def create_reminders(self, emails: List[EmailData]) -> List[int]:
+        """
+        Create reminders for several emails, analyzing them concurrently and
+        storing every reminder in one transaction.
+        
+        Args:
+            emails: Email data
+            
+        Returns:
+            Number of reminders created for each email
+        """
+        try:
+            analyses = self.analyze_reminder_needs_batch(emails)
+            
+            keyed_by_email = []
+            for email, analysis in zip(emails, analyses):
+                if analysis.get("needs_reminder", False):
+                    keyed_by_email.append(self._build_reminders(email, analysis))
+                else:
+                    logger.info(f"No reminder needed for email {email.id}")
+                    keyed_by_email.append([])
+            
+            reminder_ids = self.advanced_db.create_reminders(
+                [reminder for keyed_reminders in keyed_by_email for _, reminder in keyed_reminders]
+            )
+            
+            # Split the IDs back out per email, in the order they were built
+            counts = []
+            start = 0
+            for email, keyed_reminders in zip(emails, keyed_by_email):
+                end = start + len(keyed_reminders)
+                counts.append(self._count_created(email, keyed_reminders, reminder_ids[start:end]))
+                start = end
+            return counts
+            
+        except Exception as e:
+            logger.error(f"Error creating reminders: {e}")
+            return [0] * len(emails)
+    
+    def _build_reminders(self, email: EmailData, analysis: Dict) -> List[Tuple[str, Reminder]]:
+        """Build an email's reminders from its analysis, keyed by their timing name."""
+        optimal_timing = analysis.get("optimal_timing", {})
+        reminder_type = analysis.get("reminder_type", "custom")
+        context = analysis.get("context", "")
+        created_at = datetime.now()
+        
+        # Title and description are the same for every reminder of this email
+        title = _TITLE_PREFIXES.get(reminder_type, "Reminder: ") + email.subject[:50]
+        description = f"{context}\n\nFrom: {email.sender}\nOriginal: {email.subject}"
+        
+        # Create reminders based on optimal timing
+        keyed_reminders = []
+        for reminder_key, reminder_time in optimal_timing.items():
+            if reminder_time and isinstance(reminder_time, datetime):
+                keyed_reminders.append((reminder_key, Reminder(
+                    email_id=email.id,
+                    thread_id=email.thread_id,
+                    title=title,
+                    description=description,
+                    reminder_time=reminder_time,
+                    status="active",
+                    reminder_type=reminder_type,
+                    created_at=created_at
+                )))
+        return keyed_reminders
+    
+    def _count_created(self, email: EmailData, keyed_reminders: List[Tuple[str, Reminder]],
+                       reminder_ids: List[int]) -> int:
+        """Log and count the reminders that were stored for an email."""
+        reminders_created = 0
+        for (reminder_key, _), reminder_id in zip(keyed_reminders, reminder_ids):
+            if reminder_id > 0:
+                reminders_created += 1
+                logger.info(f"Created {reminder_key} reminder {reminder_id} for email {email.id}")
+        return reminders_created
+    
     def get_due_reminders(self) -> List[Reminder]:
         """Get reminders that are due now."""
         return self.advanced_db.get_due_reminders()
     
+    def get_due_reminders_page(self, after: Optional[Tuple[str, int]] = None,
+                               limit: int = 25) -> Tuple[List[Reminder], Optional[Tuple[str, int]]]:
+        """
+        Get one page of reminders that are due now.
+        
+        Args:
+            after: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of reminders to return
+            
+        Returns:
+            Tuple of (reminders, cursor for the next page or None)
+        """
+        return self.advanced_db.get_due_reminders_page(after=after, limit=limit)
+    
+    def count_due_reminders(self) -> int:
+        """Count reminders that are due now."""
+        return self.advanced_db.count_due_reminders()
+    
+    def get_due_reminder_ids(self) -> List[int]:
+        """Get the ids of all reminders that are due now, for bulk actions."""
+        return self.advanced_db.get_due_reminder_ids()
+    
     def snooze_reminder(self, reminder_id: int, minutes: int) -> bool:
         """
         Snooze a reminder for specified minutes.
@@ -281,16 +552,34 @@ class ReminderSystem:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            # This would require an update method in the database
-            # For now, we'll log the dismissal
-            logger.info(f"Dismissed reminder {reminder_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Error dismissing reminder: {e}")
-            return False
+        return self.dismiss_reminders([reminder_id]) > 0
+    
+    def snooze_reminders(self, reminder_ids: List[int], minutes: int) -> int:
+        """
+        Snooze several reminders in one database call.
+        
+        Args:
+            reminder_ids: IDs of the reminders
+            minutes: Minutes to snooze
+            
+        Returns:
+            Number of reminders snoozed
+        """
+        return self.advanced_db.snooze_reminders(reminder_ids, minutes)
     
-    def get_smart_snooze_suggestions(self, reminder: Reminder, user_patterns: Dict = None) -> List[Dict]:
+    def dismiss_reminders(self, reminder_ids: List[int]) -> int:
+        """
+        Dismiss several reminders in one database call.
+        
+        Args:
+            reminder_ids: IDs of the reminders
+            
+        Returns:
+            Number of reminders dismissed
+        """
+        return self.advanced_db.update_reminders_status(reminder_ids, "dismissed")
+    
+    def get_smart_snooze_suggestions(self, reminder: Reminder, user_patterns: Dict = None) -> List[SnoozeSuggestion]:
         """
         Get intelligent snooze suggestions based on reminder context and user patterns.
         
@@ -299,71 +588,48 @@ class ReminderSystem:
             user_patterns: User behavioral patterns
             
         Returns:
-            List of snooze suggestion dictionaries
+            List of snooze suggestions, shortest first
         """
         try:
             if not user_patterns:
                 user_patterns = self._get_user_patterns()
             
-            now = datetime.now()
-            suggestions = []
+            hour = datetime.now().hour
             
-            # Base suggestions
-            base_suggestions = [
-                {"minutes": 15, "label": "15 minutes"},
-                {"minutes": 30, "label": "30 minutes"},
-                {"minutes": 60, "label": "1 hour"},
-                {"minutes": 120, "label": "2 hours"}
-            ]
-            
-            # Smart suggestions based on reminder type and time
+            # Smart suggestions based on reminder type and time, keyed by minutes
+            # so duplicate durations collapse as they are added
             if reminder.reminder_type == "meeting":
                 # For meetings, suggest based on meeting time
-                if now.hour < 8:  # Early morning
-                    suggestions.append({"minutes": 60, "label": "Until 9 AM"})
-                elif now.hour > 17:  # After work
-                    suggestions.append({"minutes": 840, "label": "Tomorrow morning"})
+                if hour < 8:  # Early morning
+                    suggestions = {60: "Until 9 AM"}
+                elif hour > 17:  # After work
+                    suggestions = {840: "Tomorrow morning"}
                 else:
-                    suggestions.extend(base_suggestions[:2])  # Short snoozes during work
+                    suggestions = dict(_BASE_SNOOZES[:2])  # Short snoozes during work
             
             elif reminder.reminder_type == "deadline":
                 # For deadlines, suggest longer snoozes
-                suggestions.extend([
-                    {"minutes": 240, "label": "4 hours"},
-                    {"minutes": 480, "label": "8 hours"},
-                    {"minutes": 1440, "label": "Tomorrow"}
-                ])
+                suggestions = dict(_DEADLINE_SNOOZES)
             
             else:
                 # Default suggestions
-                suggestions.extend(base_suggestions)
+                suggestions = dict(_BASE_SNOOZES)
             
-            # Add context-aware suggestions
+            # Add context-aware suggestions, keeping an existing label for the same duration
             work_hours = user_patterns.get("typical_work_hours", {"start": 9, "end": 17})
-            if now.hour < work_hours["start"]:
-                minutes_to_work = (work_hours["start"] - now.hour) * 60
-                suggestions.append({"minutes": minutes_to_work, "label": "Until work starts"})
-            elif now.hour >= work_hours["end"]:
-                minutes_to_tomorrow = ((24 - now.hour) + work_hours["start"]) * 60
-                suggestions.append({"minutes": minutes_to_tomorrow, "label": "Tomorrow morning"})
-            
-            # Remove duplicates and sort by minutes
-            unique_suggestions = []
-            seen_minutes = set()
-            for suggestion in suggestions:
-                if suggestion["minutes"] not in seen_minutes:
-                    unique_suggestions.append(suggestion)
-                    seen_minutes.add(suggestion["minutes"])
-            
-            return sorted(unique_suggestions, key=lambda x: x["minutes"])[:6]  # Limit to 6 suggestions
+            if hour < work_hours["start"]:
+                suggestions.setdefault((work_hours["start"] - hour) * 60, "Until work starts")
+            elif hour >= work_hours["end"]:
+                suggestions.setdefault(((24 - hour) + work_hours["start"]) * 60, "Tomorrow morning")
             
-        except Exception as e:
-            logger.error(f"Error getting snooze suggestions: {e}")
             return [
-                {"minutes": 15, "label": "15 minutes"},
-                {"minutes": 30, "label": "30 minutes"},
-                {"minutes": 60, "label": "1 hour"}
+                SnoozeSuggestion(minutes, label)
+                for minutes, label in sorted(suggestions.items())[:MAX_SNOOZE_SUGGESTIONS]
             ]
+            
+        except Exception as e:
+            logger.error(f"Error getting snooze suggestions: {e}")
+            return [SnoozeSuggestion(minutes, label) for minutes, label in _BASE_SNOOZES[:3]]
     
     def get_reminder_effectiveness_stats(self) -> Dict:
         """Get statistics on reminder effectiveness."""
@@ -390,17 +656,15 @@ class ReminderSystem:
     def get_statistics(self) -> Dict:
         """Get reminder system statistics."""
         try:
-            due_reminders = self.get_due_reminders()
+            # Counted in the database; the reminders themselves are not needed
+            type_counts = self.advanced_db.get_due_reminder_type_counts()
             effectiveness_stats = self.get_reminder_effectiveness_stats()
             
             return {
-                "total_due": len(due_reminders),
+                "total_due": sum(type_counts.values()),
                 "by_type": {
-                    "meeting": len([r for r in due_reminders if r.reminder_type == "meeting"]),
-                    "deadline": len([r for r in due_reminders if r.reminder_type == "deadline"]),
-                    "followup": len([r for r in due_reminders if r.reminder_type == "followup"]),
-                    "important_email": len([r for r in due_reminders if r.reminder_type == "important_email"]),
-                    "custom": len([r for r in due_reminders if r.reminder_type == "custom"])
+                    reminder_type: type_counts.get(reminder_type, 0)
+                    for reminder_type in ("meeting", "deadline", "followup", "important_email", "custom")
                 },
                 "effectiveness_rate": effectiveness_stats.get("effectiveness_rate", 0.0),
                 "total_sent": effectiveness_stats.get("total_reminders_sent", 0),
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Consistency tests for the scheduling, paging and summary algorithms.
+Checks the interval tree, the meeting slot bitset search, keyset
+pagination and the overdue summary against simple brute-force versions
+of the same queries.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent / "src"
+sys.path.insert(0, str(src_path))
+
+
+def _merge_intervals(intervals):
+    """Merge (start, end) pairs into the sorted, disjoint form freebusy returns."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _baseline_meeting_times(base_date, busy, duration_minutes, days_ahead):
+    """The original hour-by-hour suggestion loop, with busy time checked by overlap."""
+    suggestions = []
+    for day_offset in range(1, days_ahead + 1):
+        current_date = base_date + timedelta(days=day_offset)
+        if current_date.weekday() >= 5:
+            continue
+        for hour in range(9, 17):
+            start_time = current_date.replace(hour=hour)
+            end_time = start_time + timedelta(minutes=duration_minutes)
+            if end_time.hour >= 17:
+                continue
+            start_ts, end_ts = start_time.timestamp(), end_time.timestamp()
+            if all(end <= start_ts or start >= end_ts for start, end in busy):
+                suggestions.append(start_time)
+                if len(suggestions) >= 5:
+                    return suggestions
+    return suggestions
+
+
+def _suggest_with_busy(now, busy, duration_minutes, days_ahead):
+    """Run CalendarService.suggest_meeting_times at a fixed time against given busy time."""
+    from src.services import calendar_service
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls.fromtimestamp(now.timestamp(), tz)
+
+    service = calendar_service.CalendarService.__new__(calendar_service.CalendarService)
+    service.get_busy_intervals = lambda start_time, end_time, attendees=None: busy
+
+    original_datetime = calendar_service.datetime
+    calendar_service.datetime = FixedDatetime
+    try:
+        return service.suggest_meeting_times(duration_minutes, days_ahead, ["attendee@example.com"])
+    finally:
+        calendar_service.datetime = original_datetime
+
+
+def test_interval_tree():
+    """Test interval tree queries against a brute-force overlap search."""
+    print("Testing interval tree...")
+    from src.services.interval_tree import IntervalTree
+
+    rng = random.Random(7)
+    for _ in range(50):
+        tree = IntervalTree()
+        intervals = []
+        for index in range(rng.randint(0, 200)):
+            lo = rng.randint(0, 1000)
+            hi = lo + rng.randint(1, 100)
+            intervals.append((lo, hi, index))
+            tree.insert(lo, hi, index)
+        assert len(tree) == len(intervals)
+
+        for _ in range(50):
+            lo = rng.randint(-50, 1100)
+            hi = lo + rng.randint(1, 150)
+            expected = sorted(index for start, end, index in intervals if start < hi and end > lo)
+            assert sorted(tree.query(lo, hi)) == expected, (lo, hi)
+
+    print("✓ Interval tree matches brute-force overlap search")
+
+
+def test_meeting_slot_search():
+    """Test the busy bitset slot search against the original hourly loop."""
+    print("\nTesting meeting slot search...")
+
+    rng = random.Random(11)
+    now = datetime.now()
+    base_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    window_start = (base_date + timedelta(days=1)).timestamp()
+
+    for _ in range(100):
+        days_ahead = rng.randint(1, 14)
+        duration_minutes = rng.choice([15, 30, 45, 60, 90, 120])
+        intervals = []
+        for _ in range(rng.randint(0, 60)):
+            start = window_start + rng.randint(0, days_ahead * 24 * 60) * 60
+            intervals.append((start, start + rng.randint(5, 240) * 60))
+        busy = _merge_intervals(intervals)
+
+        expected = _baseline_meeting_times(base_date, busy, duration_minutes, days_ahead)
+        actual = [s.replace(tzinfo=None) for s in _suggest_with_busy(now, busy, duration_minutes, days_ahead)]
+        assert actual == expected, (days_ahead, duration_minutes, busy)
+
+    print("✓ Bitset slot search matches the hourly loop")
+
+
+def test_meeting_slot_search_across_dst():
+    """Test that slots after a DST change stay on local working hours."""
+    print("\nTesting meeting slot search across DST...")
+    if not hasattr(time, "tzset"):
+        print("⚠ Skipped: time.tzset is not available on this platform")
+        return
+
+    original_tz = os.environ.get("TZ")
+    os.environ["TZ"] = "America/New_York"
+    time.tzset()
+    try:
+        # US daylight saving time ends on Sunday 2026-11-01
+        now = datetime(2026, 10, 29, 15, 0)
+        friday = datetime(2026, 10, 30)
+        busy = [(friday.replace(hour=9).timestamp(), friday.replace(hour=17).timestamp())]
+
+        suggestions = _suggest_with_busy(now, busy, 60, 14)
+        assert suggestions, "no suggestions"
+        for suggestion in suggestions:
+            local = suggestion.replace(tzinfo=None)
+            assert local.date() == datetime(2026, 11, 2).date(), suggestion
+            assert 9 <= local.hour < 16 and local.minute == 0, suggestion
+            assert suggestion.utcoffset() == timedelta(hours=-5), suggestion
+        expected = _baseline_meeting_times(now.replace(hour=0), busy, 60, 14)
+        assert [s.replace(tzinfo=None) for s in suggestions] == expected
+    finally:
+        if original_tz is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = original_tz
+        time.tzset()
+
+    print("✓ Slots after the DST change keep local working hours")
+
+
+def test_keyset_pagination():
+    """Test that pages joined across cursors match the full queries."""
+    print("\nTesting keyset pagination...")
+    from src.database.advanced_db import AdvancedDatabase, FollowUp, Reminder
+
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = AdvancedDatabase(os.path.join(temp_dir, "advanced.db"))
+        now = datetime.now().replace(microsecond=0)
+
+        # Shared and missing dates exercise the id tie-break and COALESCE
+        dates = [now + timedelta(days=offset) for offset in range(-3, 4)] + [None]
+        for index in range(97):
+            db.create_follow_up(FollowUp(
+                email_id=f"email{index}",
+                thread_id="thread",
+                subject="Subject",
+                recipient="someone@example.com",
+                follow_up_date=rng.choice(dates),
+                reminder_date=None,
+                status=rng.choice(["pending", "overdue", "completed"]),
+                priority="medium",
+                created_at=now
+            ))
+
+        reminder_times = [now - timedelta(hours=offset) for offset in range(5)]
+        db.create_reminders([
+            Reminder(
+                email_id=f"email{index}",
+                thread_id="thread",
+                title="Reminder",
+                description="",
+                reminder_time=rng.choice(reminder_times),
+                status=rng.choice(["active", "dismissed"]),
+                reminder_type="custom",
+                created_at=now
+            )
+            for index in range(83)
+        ])
+
+        for limit in (1, 7, 25, 200):
+            paged = []
+            cursor = None
+            while True:
+                page, cursor = db.get_pending_follow_ups_page(after=cursor, limit=limit)
+                assert len(page) <= limit
+                paged.extend(follow_up.id for follow_up in page)
+                if cursor is None:
+                    break
+            assert paged == db.get_pending_follow_up_ids(), limit
+            assert sorted(paged) == sorted(f.id for f in db.get_pending_follow_ups())
+            assert len(paged) == db.count_pending_follow_ups()
+
+            paged = []
+            cursor = None
+            while True:
+                page, cursor = db.get_due_reminders_page(after=cursor, limit=limit)
+                assert len(page) <= limit
+                paged.extend(reminder.id for reminder in page)
+                if cursor is None:
+                    break
+            assert paged == db.get_due_reminder_ids(), limit
+            assert sorted(paged) == sorted(r.id for r in db.get_due_reminders())
+            assert len(paged) == db.count_due_reminders()
+
+    print("✓ Joined pages match the full queries")
+
+
+def test_overdue_summary_matches_list():
+    """Test that the overdue summary counts the same follow-ups the overdue list shows."""
+    print("\nTesting overdue summary against the overdue list...")
+    from types import SimpleNamespace
+    from src.database.advanced_db import AdvancedDatabase, FollowUp
+    from src.tasks.overdue_detector import OverdueDetector
+
+    rng = random.Random(5)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = AdvancedDatabase(os.path.join(temp_dir, "advanced.db"))
+        now = datetime.now().replace(microsecond=0)
+        for index in range(60):
+            db.create_follow_up(FollowUp(
+                email_id=f"email{index}",
+                thread_id="thread",
+                subject="Subject",
+                recipient="someone@example.com",
+                follow_up_date=now + timedelta(days=rng.randint(-10, 5), hours=rng.randint(-12, 12)),
+                reminder_date=None,
+                status=rng.choice(["pending", "pending", "overdue", "completed"]),
+                priority=rng.choice(["low", "medium", "high", "urgent"]),
+                created_at=now
+            ))
+
+        detector = OverdueDetector(db, ai_service=SimpleNamespace())
+
+        # The first load marks pending rows overdue; later loads must still agree
+        for _ in range(2):
+            items = detector.check_overdue_items()
+            detector.invalidate_summary()
+            summary = detector.get_overdue_summary()
+            assert items, "no overdue items"
+            assert summary["total_overdue"] == len(items), (summary["total_overdue"], len(items))
+
+            breakdown = {level: 0 for level in summary["escalation_breakdown"]}
+            for item in items:
+                breakdown[item.escalation] += 1
+            assert summary["escalation_breakdown"] == breakdown
+
+    print("✓ Overdue summary matches the overdue list")
+
+
+class _BatchModel:
+    """Stub Gemini model answering batched prompts with one result per EMAIL header."""
+
+    def __init__(self, item_for_id):
+        self.item_for_id = item_for_id
+        self.batch_sizes = []
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        import json
+        import re
+        from types import SimpleNamespace
+        email_ids = re.findall(r"--- EMAIL (\S+) ---", prompt)
+        self.batch_sizes.append(len(email_ids))
+        return SimpleNamespace(text=json.dumps([self.item_for_id(email_id) for email_id in email_ids]))
+
+
+def _stub_ai(model):
+    """A real GeminiEmailAI talking to a stub model, skipping API key setup."""
+    from src.ai.gemini_service import GeminiEmailAI
+    ai = GeminiEmailAI.__new__(GeminiEmailAI)
+    ai.model = model
+    return ai
+
+
+def _stub_emails(count, subject, content):
+    """Duck-typed emails with the fields the task modules read."""
+    from types import SimpleNamespace
+    return [
+        SimpleNamespace(id=f"msg{index}", thread_id=f"thread{index}", sender="someone@example.com",
+                        subject=f"{subject} {index}", content=content, date="2026-01-01")
+        for index in range(count)
+    ]
+
+
+def test_deadline_batching():
+    """Test that deadline extraction makes one AI request per batch and caches per email."""
+    print("\nTesting deadline extraction batching...")
+    from src.tasks import overdue_detector
+    from src.tasks.overdue_detector import DEADLINE_BATCH_SIZE, OverdueDetector
+
+    model = _BatchModel(lambda email_id: {"email_id": email_id, "deadlines": [{
+        "description": "Report", "due_date": "2026-03-01 17:00", "urgency": "high",
+        "type": "submission", "confidence": 0.9
+    }]})
+    detector = OverdueDetector(advanced_db=object(), ai_service=_stub_ai(model))
+    emails = _stub_emails(45, "Report due", "Please submit the report.")
+
+    with overdue_detector._ai_cache_lock:
+        overdue_detector._ai_cache.clear()
+
+    results = detector.extract_deadlines_batch(emails)
+    assert sorted(model.batch_sizes) == [5, DEADLINE_BATCH_SIZE, DEADLINE_BATCH_SIZE], model.batch_sizes
+    assert all(len(deadlines) == 1 and deadlines[0]["due_date"] == datetime(2026, 3, 1, 17)
+               for deadlines in results)
+
+    # Reprocessed emails hit the per-email cache whatever batch they land in
+    assert detector.extract_deadlines_batch(emails[10:30]) == results[10:30]
+    assert len(model.batch_sizes) == 3, model.batch_sizes
+
+    print("✓ One AI request per batch, cached per email")
+
+
+def test_followup_batching():
+    """Test that follow-up analysis makes one AI request per batch."""
+    print("\nTesting follow-up analysis batching...")
+    from src.tasks.followup_manager import ANALYSIS_BATCH_SIZE, FollowupManager
+
+    model = _BatchModel(lambda email_id: {
+        "email_id": email_id, "requires_followup": True, "urgency": "high",
+        "suggested_days": 2, "reason": "Awaiting approval", "followup_type": "response_required"
+    })
+    manager = FollowupManager(advanced_db=object(), ai_service=_stub_ai(model))
+    emails = _stub_emails(45, "Status", "Nothing to see here.")
+
+    analyses = manager.analyze_followup_requirements_batch(emails)
+    assert model.batch_sizes == [ANALYSIS_BATCH_SIZE, ANALYSIS_BATCH_SIZE, 5], model.batch_sizes
+    assert len(analyses) == len(emails)
+    # The keyword fallback would report no follow-up for these emails
+    assert all(analysis["requires_followup"] and analysis["reason"] == "Awaiting approval"
+               for analysis in analyses)
+
+    print("✓ One AI request per batch of follow-up analyses")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 50)
+    print("AI Email Manager - Algorithm Tests")
+    print("=" * 50)
+
+    tests = [
+        ("Interval tree", test_interval_tree),
+        ("Meeting slot search", test_meeting_slot_search),
+        ("Meeting slots across DST", test_meeting_slot_search_across_dst),
+        ("Keyset pagination", test_keyset_pagination),
+        ("Overdue summary", test_overdue_summary_matches_list),
+        ("Deadline batching", test_deadline_batching),
+        ("Follow-up batching", test_followup_batching),
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {test_name} failed: {e}")
+
+    print("\n" + "=" * 50)
+    print(f"Test Results: {passed}/{total} tests passed")
+    print("=" * 50)
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)